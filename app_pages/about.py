@@ -0,0 +1,80 @@
+import streamlit as st
+
+def render(t):
+    st.header(t['about'])
+    st.markdown(f"""
+    #### {t['about_dataset']}
+    {t['dataset_intro']}
+    
+    {t['dataset_description']}
+    
+    {t['test_images']}
+    
+    #### {t['content']}
+    1. {t['train_images']}
+    2. {t['test_images_count']}
+    3. {t['validation_images']}
+
+    #### {t['dataset_details']}
+    - **{t['total_images']}**: {t['total_images_count']}
+    - **{t['number_of_classes']}**: {t['classes_count']}
+    - **{t['image_resolution']}**: {t['resolution_type']}
+    - **{t['data_split']}**:
+        - {t['training_split']}
+        - {t['validation_split']}
+        - {t['test_split']}
+
+    #### {t['plant_categories']}
+    {t['categories_intro']}
+    - Apple
+    - Blueberry
+    - Cherry
+    - Corn (Maize)
+    - Grape
+    - Orange
+    - Peach
+    - Pepper
+    - Potato
+    - Raspberry
+    - Soybean
+    - Squash
+    - Strawberry
+    - Tomato
+
+    #### {t['disease_types']}
+    {t['disease_types_intro']}
+    - {t['healthy_samples']}
+    - {t['disease_conditions']}
+    - {t['disease_stages']}
+    - {t['disease_manifestations']}
+
+    #### {t['data_augmentation']}
+    {t['augmentation_intro']}
+    - {t['rotation']}
+    - {t['flipping']}
+    - {t['color_adjustments']}
+    - {t['brightness_modifications']}
+    - {t['contrast_variations']}
+
+    #### {t['usage']}
+    {t['usage_intro']}
+    - {t['plant_classification']}
+    - {t['ml_training']}
+    - {t['cv_research']}
+    - {t['disease_detection']}
+    - {t['educational_purposes']}
+
+    #### {t['data_quality']}
+    - {t['high_resolution']}
+    - {t['clear_symptoms']}
+    - {t['well_labeled']}
+    - {t['consistent_quality']}
+    - {t['professional_photography']}
+
+    #### {t['applications']}
+    - {t['agricultural_detection']}
+    - {t['health_monitoring']}
+    - {t['crop_protection']}
+    - {t['research_education']}
+    - {t['automated_diagnosis']}
+    """)
@@ -0,0 +1,214 @@
+import html
+import os
+
+import numpy as np
+import streamlit as st
+
+import inference
+from knowledge_base import knowledge_base_for
+from prediction_cache import PredictionCache
+
+# Cache the model loading to prevent reloading on every prediction. Set
+# PLANT_MODEL_REGISTRY to serve the newest version in a model registry
+# directory instead; newer versions are then loaded in the background and
+# swapped in without a restart (PLANT_SHADOW_FRACTION and PLANT_PROMOTE_AFTER
+# shadow-score them first).
+@st.cache_resource
+def load_model():
+    registry_dir = os.environ.get('PLANT_MODEL_REGISTRY')
+    if not registry_dir:
+        return inference.load_model()
+
+    from model_registry import ModelRegistry
+    return ModelRegistry(registry_dir,
+                         shadow_fraction=float(os.environ.get('PLANT_SHADOW_FRACTION', '0')),
+                         promote_after=int(os.environ.get('PLANT_PROMOTE_AFTER', '0')) or None)
+
+# Labels and disease details for the model actually loaded, from its bundle (a
+# registry only swaps in versions with the same class names)
+def get_knowledge_base():
+    return knowledge_base_for(load_model().class_names)
+
+# One prediction cache per process, shared by every session; set
+# PLANT_PREDICTION_CACHE_DIR to keep predictions across restarts
+@st.cache_resource
+def get_prediction_cache():
+    disk_dir = os.environ.get('PLANT_PREDICTION_CACHE_DIR')
+    if os.environ.get('PLANT_MODEL_REGISTRY'):
+        registry = load_model()
+        cache = PredictionCache(registry.version, disk_dir=disk_dir)
+        registry.add_listener(cache.set_model_version)
+        return cache
+    return PredictionCache(load_model().version, disk_dir=disk_dir)
+
+# Set PLANT_PREPROCESS_WORKERS to decode multi-image uploads on that many
+# worker processes; by default they are decoded in the app process
+@st.cache_resource
+def get_preprocess_pool():
+    workers = int(os.environ.get('PLANT_PREPROCESS_WORKERS', '0'))
+    if workers <= 0:
+        return None
+    from preprocess_pool import PreprocessPool
+    return PreprocessPool(workers)
+
+def predict_image_bytes(model, image_bytes):
+    return inference.predict_batch(model, inference.preprocess_image(image_bytes))[0]
+
+def model_prediction(test_image):
+    # Load model from cache
+    model = load_model()
+
+    # Re-uploads of the same photo are served from the prediction cache
+    predictions = get_prediction_cache().get_or_compute(
+        test_image.getvalue(), lambda image_bytes: predict_image_bytes(model, image_bytes))
+    return np.argmax(predictions), predictions
+
+def model_prediction_batch(test_images):
+    model = load_model()
+    cache = get_prediction_cache()
+
+    # Only images missing from the prediction cache go through the model, in
+    # fixed-size chunks
+    images_bytes = [image.getvalue() for image in test_images]
+    keys = [cache.key_for(image_bytes) for image_bytes in images_bytes]
+    predictions = [cache.lookup(key) for key in keys]
+    missing = [i for i, p in enumerate(predictions) if p is None]
+    if missing:
+        computed = inference.predict_images(model, [images_bytes[i] for i in missing],
+                                            pool=get_preprocess_pool())
+        for i, probabilities in zip(missing, computed):
+            predictions[i] = cache.put(keys[i], probabilities)
+    predictions = np.stack(predictions)
+    return np.argmax(predictions, axis=1), predictions
+
+# Top-5 predictions as one HTML block. The bars fill in the browser, each
+# starting 0.2 s after the previous one, so no rerun time is spent pacing them.
+def prediction_bars_html(class_names, probabilities, indices):
+    bars = []
+    for position, idx in enumerate(indices):
+        prob = float(probabilities[idx])
+        # animation-delay is not inherited, so the fill gets its own copy
+        delay = f'animation-delay: {position * 0.2:.1f}s'
+        bars.append(
+            f'<div class="prediction-bar" style="{delay}">'
+            f'<div class="track"><div class="fill" style="width: {prob:.1%}; {delay}"></div></div>'
+            f'<strong>{html.escape(class_names[idx])}:</strong> {prob:.2f}</div>'
+        )
+    return ''.join(bars)
+
+def show_batch_results(t, test_images):
+    with st.spinner(t['processing_batch']):
+        try:
+            result_indices, predictions = model_prediction_batch(test_images)
+            class_names = get_knowledge_base().class_names
+
+            st.success(t['analysis_complete'])
+            st.markdown(f"### {t['batch_results']}")
+            st.dataframe([
+                {
+                    t['file_name']: image.name,
+                    t['prediction']: class_names[index],
+                    t['confidence']: round(float(predictions[i, index]), 4),
+                }
+                for i, (image, index) in enumerate(zip(test_images, result_indices))
+            ], use_container_width=True)
+        except Exception as e:
+            st.error(f"{t['error_occurred']} {str(e)}")
+            st.error(t['try_again'])
+
+def show_single_result(t, test_image):
+    with st.spinner(t['processing']):
+        try:
+            result_index, predicted_probabilities = model_prediction(test_image)
+
+            # Shared read-only knowledge base, looked up by class index
+            knowledge = get_knowledge_base()
+            class_names = knowledge.class_names
+            details = knowledge.details(result_index, st.session_state.get('language', 'English'))
+
+            predicted_disease = class_names[result_index]
+
+            # Animated success message
+            st.success(t['analysis_complete'])
+            st.markdown(f"### {t['predicted_disease']} {predicted_disease}")
+
+            # Display top 5 predictions with animated progress bars
+            st.markdown(f"### {t['top_predictions']}")
+            top_5_indices = inference.top_k(predicted_probabilities)
+            st.markdown(prediction_bars_html(class_names, predicted_probabilities, top_5_indices),
+                        unsafe_allow_html=True)
+
+            # Display Disease Details with bullet points
+            if details is not None:
+                st.markdown(f"### {t['disease_details']}")
+
+                # Display details in a more compact format
+                with st.expander(f"{t['symptoms']}", expanded=True):
+                    st.markdown(f"• {details['symptoms']}")
+
+                with st.expander(f"{t['causes']}", expanded=True):
+                    st.markdown(f"• {details['causes']}")
+
+                with st.expander(f"{t['reasons']}", expanded=True):
+                    st.markdown(f"• {details['reasons_for_cause']}")
+
+                with st.expander(f"{t['precautions']}", expanded=True):
+                    st.markdown(f"• {details['precautions']}")
+
+                with st.expander(f"{t['treatments']}", expanded=True):
+                    st.markdown(f"• {details['treatments']}")
+
+                with st.expander(f"{t['more_info']}", expanded=True):
+                    st.markdown(f"• {details['detailed_info']}")
+            else:
+                st.warning("⚠️ Disease details not found.")
+
+        except Exception as e:
+            st.error(f"{t['error_occurred']} {str(e)}")
+            st.error(t['try_again'])
+
+# Uploading, switching mode and pressing Analyze only rerun this fragment, not
+# the sidebar, header and instructions around it
+@st.fragment
+def recognition_panel(t):
+    st.subheader(t['upload_image'])
+    analysis_mode = st.radio(t['analysis_mode'], [t['single_image'], t['multiple_images']], horizontal=True)
+
+    if analysis_mode == t['multiple_images']:
+        test_images = st.file_uploader(t['choose_images'], type=['jpg', 'jpeg', 'png'], accept_multiple_files=True)
+        if test_images and st.button(t['analyze_all_button'], key="predict_batch_button"):
+            show_batch_results(t, test_images)
+        return
+
+    test_image = st.file_uploader(t['choose_image'], type=['jpg', 'jpeg', 'png'])
+    if test_image is not None:
+        # Display image with reduced size and center alignment
+        st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
+        st.image(test_image, width=300)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        if st.button(t['analyze_button'], key="predict_button"):
+            show_single_result(t, test_image)
+
+def render(t):
+    st.markdown('<h1 class="main-header">Plant Disease Recognition</h1>', unsafe_allow_html=True)
+
+    # Create two columns with adjusted widths
+    col1, col2 = st.columns([1, 1.5])
+
+    with col1:
+        recognition_panel(t)
+
+    with col2:
+        st.markdown(f"### {t['instructions']}")
+        st.markdown(f"""
+        1. {t['step1']}
+        2. {t['step2']}
+        3. {t['step3']}
+        
+        ### {t['tips']}
+        - Use well-lit images
+        - Ensure the leaf is clearly visible
+        - Avoid blurry or dark images
+        - Capture both healthy and diseased parts if possible
+        """)
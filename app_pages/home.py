@@ -0,0 +1,17 @@
+import streamlit as st
+
+def render(t):
+    st.header(t['welcome_header'])
+    image_path = "home_page.jpeg"
+    st.image(image_path, use_column_width=True)
+    st.markdown(t['welcome_message'])
+    st.markdown(f"### {t['how_it_works']}")
+    st.markdown(t['step1'])
+    st.markdown(t['step2'])
+    st.markdown(t['step3'])
+    st.markdown(f"### {t['why_choose_us']}")
+    st.markdown(t['accuracy'])
+    st.markdown(t['user_friendly'])
+    st.markdown(t['fast'])
+    st.markdown(f"### {t['get_started']}")
+    st.markdown(f"### {t['about_us']}")
@@ -0,0 +1,74 @@
+# Styles for the whole app, injected once per run from main.py. Kept in a
+# module so the string is built once per process rather than on every rerun.
+# The top-5 bars animate in the browser (CSS keyframes with a staggered
+# delay), so the script thread never sleeps to pace them.
+APP_CSS = """
+<style>
+    .stButton>button {
+        width: 100%;
+        margin-top: 10px;
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        transition: all 0.3s ease;
+    }
+    .stButton>button:hover {
+        background-color: #45a049;
+        transform: scale(1.02);
+    }
+    .disease-detail {
+        padding: 10px;
+        margin: 5px 0;
+        border-radius: 5px;
+        background-color: #f0f2f6;
+    }
+    .prediction-bar {
+        margin: 10px 0;
+        padding: 10px;
+        border-radius: 5px;
+        background-color: #ffffff;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        animation: fade-in 0.4s ease-out backwards;
+    }
+    .prediction-bar .track {
+        height: 8px;
+        margin-bottom: 6px;
+        border-radius: 4px;
+        background-color: #e6e9ef;
+        overflow: hidden;
+    }
+    .prediction-bar .fill {
+        height: 100%;
+        border-radius: 4px;
+        background-color: #4CAF50;
+        transform-origin: left;
+        animation: grow 0.6s ease-out backwards;
+    }
+    @keyframes fade-in {
+        from { opacity: 0; transform: translateY(6px); }
+    }
+    @keyframes grow {
+        from { transform: scaleX(0); }
+    }
+    .streamlit-expanderHeader {
+        background-color: #f0f2f6;
+        border-radius: 5px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .main-header {
+        color: #1f77b4;
+        text-align: center;
+        padding: 20px;
+        background: linear-gradient(45deg, #1f77b4, #4CAF50);
+        color: white;
+        border-radius: 10px;
+        margin-bottom: 20px;
+    }
+    .language-selector {
+        margin-bottom: 20px;
+    }
+</style>
+"""
@@ -0,0 +1,67 @@
+import tensorflow as tf
+
+from inference import IMAGE_SIZE
+
+# Model definitions selectable at training time. Every variant takes raw
+# 0-255 RGB pixels of IMAGE_SIZE, like the original model, so the serving
+# preprocessing and bundle normalization stay the same whichever is trained.
+#
+#     model = build_model('lite', num_classes=len(training_set.class_names))
+INPUT_SHAPE = (*IMAGE_SIZE, 3)
+
+# The notebook's original CNN: five pairs of 3x3 Conv2D (32 to 512 filters)
+# with max pooling, then Flatten (8192 features) into Dense(1500)
+def build_baseline(num_classes=38, input_shape=INPUT_SHAPE, activation='softmax'):
+    from tensorflow.keras.layers import Conv2D, Dense, Dropout, Flatten, MaxPool2D
+
+    model = tf.keras.Sequential(name='baseline')
+    model.add(tf.keras.Input(input_shape))
+    for filters in (32, 64, 128, 256, 512):
+        model.add(Conv2D(filters=filters, kernel_size=3, padding='same', activation='relu'))
+        model.add(Conv2D(filters=filters, kernel_size=3, activation='relu'))
+        model.add(MaxPool2D(pool_size=2, strides=2))
+    model.add(Dropout(0.25))
+    model.add(Flatten())
+    model.add(Dense(units=1500, activation='relu'))
+    model.add(Dropout(0.4))
+    model.add(Dense(units=num_classes, activation=activation))
+    return model
+
+# Depthwise-separable variant: a strided full convolution stem, then
+# separable conv blocks with batch norm, and global average pooling in place
+# of Flatten + Dense(1500), which held most of the baseline's parameters.
+# width scales every block's filter count.
+def build_lite(num_classes=38, input_shape=INPUT_SHAPE, width=1.0, activation='softmax'):
+    from tensorflow.keras import layers
+
+    def filters(n):
+        return max(8, int(n * width))
+
+    model = tf.keras.Sequential(name='lite')
+    model.add(tf.keras.Input(input_shape))
+    model.add(layers.Rescaling(1 / 255))
+    model.add(layers.Conv2D(filters(32), 3, strides=2, padding='same', use_bias=False))
+    model.add(layers.BatchNormalization())
+    model.add(layers.ReLU())
+    for block_filters in (64, 128, 256, 512):
+        for _ in range(2):
+            model.add(layers.SeparableConv2D(filters(block_filters), 3, padding='same', use_bias=False))
+            model.add(layers.BatchNormalization())
+            model.add(layers.ReLU())
+        model.add(layers.MaxPool2D(pool_size=2, strides=2))
+    model.add(layers.GlobalAveragePooling2D())
+    model.add(layers.Dropout(0.3))
+    model.add(layers.Dense(num_classes, activation=activation))
+    return model
+
+ARCHITECTURES = {
+    'baseline': build_baseline,
+    'lite': build_lite,
+}
+
+# options go to the builder, e.g. width=0.5 for 'lite', or activation=None for
+# a model that outputs logits (as distill.py trains it)
+def build_model(name, num_classes=38, input_shape=INPUT_SHAPE, **options):
+    if name not in ARCHITECTURES:
+        raise ValueError(f'Unknown architecture {name!r}, expected one of {tuple(ARCHITECTURES)}')
+    return ARCHITECTURES[name](num_classes, input_shape, **options)
@@ -0,0 +1,119 @@
+import argparse
+import math
+import os
+import re
+from collections import Counter
+
+from datasets import TRAIN_DIR, list_labeled_images
+
+# The dataset ships pre-augmented copies of many leaves next to the original
+# photo, e.g. 'x___FREC_Scab 3003.JPG' and 'x___FREC_Scab 3003_90deg.JPG'. With
+# originals_only the loaders keep one file per leaf (the original, or the
+# first variant for leaves whose original is not in the split) and augment()
+# produces the same kinds of variation randomly in the input pipeline instead:
+# quarter turns, flips, small rotations and colour jitter.
+#
+#     python augmentation.py train --list variants.txt
+VARIANT_SUFFIXES = ('_90deg', '_180deg', '_270deg', '_flipTB', '_new30degFlipLR', '_new30degFlipTB',
+                    '_newPixel25', '_newGRR')
+_VARIANT = re.compile('(' + '|'.join(map(re.escape, VARIANT_SUFFIXES)) + ')$')
+
+MAX_ROTATION_DEGREES = 30
+BRIGHTNESS_DELTA = 0.1
+CONTRAST_RANGE = (0.8, 1.2)
+SATURATION_RANGE = (0.8, 1.2)
+HUE_DELTA = 0.02
+
+# (leaf, suffix) for a file name; suffix is None for an original
+def split_variant(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    match = _VARIANT.search(stem)
+    if match is None:
+        return stem, None
+    return stem[:match.start()], match.group(1)
+
+# One path per leaf and folder, in the input order. Returns (paths, labels,
+# excluded paths).
+def select_originals(paths, labels):
+    chosen = {}
+    for i, path in enumerate(paths):
+        leaf, suffix = split_variant(path)
+        key = (os.path.dirname(path), leaf)
+        current = chosen.get(key)
+        if current is None or (suffix is None and split_variant(paths[current])[1] is not None):
+            chosen[key] = i
+    keep = sorted(chosen.values())
+    kept = set(keep)
+    return ([paths[i] for i in keep], [labels[i] for i in keep],
+            [path for i, path in enumerate(paths) if i not in kept])
+
+# Random stateless augmentation of one float32 0-255 image. seed is a shape
+# [2] int tensor, e.g. from tf.data.Dataset.random(), so results only depend
+# on the pipeline seed and not on thread scheduling.
+def augment(image, seed):
+    import tensorflow as tf
+
+    seeds = tf.random.experimental.stateless_split(seed, num=8)
+    # Quarter turns and flips cover the _90deg/_180deg/_270deg/_flipTB copies
+    image = tf.image.rot90(image, tf.random.stateless_uniform([], seeds[0], 0, 4, dtype=tf.int32))
+    image = tf.image.stateless_random_flip_left_right(image, seeds[1])
+    image = tf.image.stateless_random_flip_up_down(image, seeds[2])
+    # A small rotation plus the flips covers the _new30degFlipLR copies
+    angle = tf.random.stateless_uniform([], seeds[3], -1.0, 1.0) * MAX_ROTATION_DEGREES * math.pi / 180
+    image = rotate(image, angle)
+
+    image = image / 255.0
+    image = tf.image.stateless_random_brightness(image, BRIGHTNESS_DELTA, seeds[4])
+    image = tf.image.stateless_random_contrast(image, *CONTRAST_RANGE, seeds[5])
+    image = tf.image.stateless_random_saturation(image, *SATURATION_RANGE, seeds[6])
+    image = tf.image.stateless_random_hue(image, HUE_DELTA, seeds[7])
+    return tf.clip_by_value(image, 0.0, 1.0) * 255.0
+
+# Rotate about the centre, filling the corners by reflection (the rotated
+# copies on disk have no black corners either)
+def rotate(image, angle):
+    import tensorflow as tf
+
+    height = tf.cast(tf.shape(image)[0], tf.float32)
+    width = tf.cast(tf.shape(image)[1], tf.float32)
+    cos, sin = tf.cos(angle), tf.sin(angle)
+    x_offset = ((width - 1) - (cos * (width - 1) - sin * (height - 1))) / 2
+    y_offset = ((height - 1) - (sin * (width - 1) + cos * (height - 1))) / 2
+    transform = tf.stack([cos, -sin, x_offset, sin, cos, y_offset, 0.0, 0.0])[None]
+    rotated = tf.raw_ops.ImageProjectiveTransformV3(
+        images=image[None], transforms=transform, output_shape=tf.shape(image)[:2],
+        fill_value=0.0, interpolation='BILINEAR', fill_mode='REFLECT')
+    return rotated[0]
+
+# Map augment() over a dataset of (image, label) elements
+def augment_dataset(dataset, seed=0, parallel_calls=-1):
+    import tensorflow as tf
+
+    seeds = tf.data.Dataset.random(seed=seed).batch(2)
+    return (tf.data.Dataset.zip((dataset, seeds))
+            .map(lambda element, s: (augment(tf.cast(element[0], tf.float32), s), element[1]),
+                 num_parallel_calls=parallel_calls))
+
+def main():
+    parser = argparse.ArgumentParser(description='Find the pre-augmented copies in a dataset split')
+    parser.add_argument('directory', nargs='?', default=TRAIN_DIR)
+    parser.add_argument('--list', help='write the paths that originals_only excludes here')
+    args = parser.parse_args()
+
+    paths, labels, _ = list_labeled_images(args.directory)
+    kept, _, excluded = select_originals(paths, labels)
+    suffixes = Counter(split_variant(path)[1] for path in paths)
+    stand_ins = sum(1 for path in kept if split_variant(path)[1] is not None)
+    size = lambda files: sum(os.path.getsize(path) for path in files) / 2**20
+
+    print(f'{len(paths)} images, {len(kept)} leaves ({stand_ins} without their original in this split)')
+    for suffix in VARIANT_SUFFIXES:
+        print(f'  {suffix:16s} {suffixes.get(suffix, 0)}')
+    print(f'originals_only reads {len(kept)} files ({size(kept):.0f} MB) instead of '
+          f'{len(paths)} ({size(paths):.0f} MB)')
+    if args.list:
+        with open(args.list, 'w') as f:
+            f.writelines(f'{path}\n' for path in excluded)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+import backends
+import inference
+from benchmarks.timing import measure_latency, summarize
+from datasets import VALID_DIR, list_labeled_images
+
+# Picks the fastest backend and thread count on the current host among those
+# whose top-1 predictions agree with the Keras model within a tolerance. The
+# result is stored per host (CPU model, core count) and model version, so the
+# micro-benchmark runs once per machine type rather than on every start.
+#
+#     python autotune.py --valid-dir valid --objective throughput
+TUNING_FILE = os.environ.get('PLANT_AUTOTUNE_FILE', 'autotune.json')
+REFERENCE_BACKEND = 'keras'
+ACCURACY_TOLERANCE = 0.01
+SAMPLE_SIZE = 128
+
+# Backends with full float32 precision need no agreement evidence; quantized
+# ones are only eligible when there are sample images to check them on. The
+# frozen graph counts only when its weights are stored as float32, which the
+# trial reports.
+EXACT_BACKENDS = ('keras', 'compiled', 'xla', 'savedmodel', 'frozen')
+
+def is_exact(model):
+    return model.name in EXACT_BACKENDS and getattr(model, 'weights_dtype', 'float32') == 'float32'
+
+def cpu_model():
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                # x86 reports 'model name'; many ARM kernels only 'CPU part'
+                if line.startswith(('model name', 'Model', 'CPU part')):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or 'unknown'
+
+def host_key(model_path):
+    return f'{platform.machine()}|{cpu_model()}|{os.cpu_count()}|{inference.model_version(model_path)}'
+
+def thread_choices():
+    count = os.cpu_count() or 1
+    choices = {1, count}
+    threads = 2
+    while threads < count:
+        choices.add(threads)
+        threads *= 2
+    return sorted(choices)
+
+def available_backends(model_path):
+    return [name for name, backend in backends.BACKENDS.items() if os.path.exists(backend.artifact(model_path))]
+
+# Evenly spaced sample over the (class-ordered) validation list
+def sample_images(valid_dir, size=SAMPLE_SIZE, model_path=inference.MODEL_PATH):
+    if not valid_dir or not os.path.isdir(valid_dir):
+        return []
+    paths, _, _ = list_labeled_images(valid_dir, inference.get_class_names(model_path))
+    if not paths:
+        return []
+    keep = np.linspace(0, len(paths) - 1, min(size, len(paths))).astype(int)
+    return [paths[i] for i in keep]
+
+# Runs inside a fresh process so TensorFlow's thread settings take effect
+def run_trial(name, threads, model_path, images, iterations):
+    model = backends.load_backend(name, model_path, threads)
+    model.warm_up()
+
+    top1 = []
+    for i in range(0, len(images), inference.BATCH_SIZE):
+        batch = np.stack([inference.preprocess_image(path)[0] for path in images[i:i + inference.BATCH_SIZE]])
+        top1.extend(int(index) for index in np.argmax(model.predict_on_batch(batch), axis=1))
+
+    single = np.zeros((1, *inference.IMAGE_SIZE, 3), dtype=np.float32)
+    full = np.zeros((inference.BATCH_SIZE, *inference.IMAGE_SIZE, 3), dtype=np.float32)
+    latency = summarize(measure_latency(lambda: model.predict_on_batch(single), iterations, warmup=3))
+    batch_ms = summarize(measure_latency(lambda: model.predict_on_batch(full), max(3, iterations // 10), warmup=1))
+    return {
+        'backend': name,
+        'threads': threads,
+        'p50_ms': latency['p50_ms'],
+        'p99_ms': latency['p99_ms'],
+        'images_per_second': inference.BATCH_SIZE * 1000 / batch_ms['p50_ms'],
+        'top1': top1,
+        'exact': is_exact(model),
+    }
+
+def tune(model_path=inference.MODEL_PATH, valid_dir=VALID_DIR, tolerance=ACCURACY_TOLERANCE,
+         sample_size=SAMPLE_SIZE, objective='latency', iterations=30):
+    images = sample_images(valid_dir, sample_size, model_path)
+    trials = []
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(images, f)
+        images_file = f.name
+    try:
+        for name in available_backends(model_path):
+            for threads in thread_choices():
+                command = [sys.executable, os.path.abspath(__file__), '--trial', name, '--threads', str(threads),
+                           '--model', model_path, '--images-file', images_file, '--iterations', str(iterations)]
+                result = subprocess.run(command, capture_output=True, text=True)
+                if result.returncode != 0:
+                    print(f'{name} x{threads}: failed', file=sys.stderr)
+                    continue
+                trials.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    finally:
+        os.remove(images_file)
+
+    # Agreement with the best-threaded Keras run on the sample images
+    reference = max((t for t in trials if t['backend'] == REFERENCE_BACKEND),
+                    key=lambda t: t['threads'], default=None)
+    reference_top1 = np.array(reference['top1']) if reference else None
+    for trial in trials:
+        top1 = np.array(trial.pop('top1'))
+        trial['agreement'] = None
+        if images and reference_top1 is not None:
+            trial['agreement'] = float(np.mean(top1 == reference_top1))
+
+    def eligible(trial):
+        if trial['agreement'] is None:
+            return trial['exact']
+        return 1 - trial['agreement'] <= tolerance
+
+    candidates = [t for t in trials if eligible(t)]
+    if not candidates:
+        raise RuntimeError('No backend could be benchmarked on this host')
+    if objective == 'throughput':
+        best = max(candidates, key=lambda t: t['images_per_second'])
+    else:
+        best = min(candidates, key=lambda t: t['p50_ms'])
+    return {
+        'backend': best['backend'],
+        'threads': best['threads'],
+        'objective': objective,
+        'tolerance': tolerance,
+        'sample_size': len(images),
+        'trials': trials,
+    }
+
+def load_tuning(path=TUNING_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_tuning(key, result, path=TUNING_FILE):
+    tuning = load_tuning(path)
+    tuning[key] = result
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(tuning, f, indent=2)
+    os.replace(tmp_path, path)
+
+# (backend, threads) for this host, benchmarking on first use
+def tuned_backend(model_path=inference.MODEL_PATH):
+    key = host_key(model_path)
+    result = load_tuning().get(key)
+    if result is None:
+        result = tune(model_path)
+        save_tuning(key, result)
+    return result['backend'], result['threads']
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serving backends on this host and store the fastest')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--valid-dir', default=VALID_DIR, help='images used to check prediction agreement')
+    parser.add_argument('--sample-size', type=int, default=SAMPLE_SIZE)
+    parser.add_argument('--tolerance', type=float, default=ACCURACY_TOLERANCE,
+                        help='maximum fraction of top-1 predictions allowed to differ from Keras')
+    parser.add_argument('--objective', choices=('latency', 'throughput'), default='latency')
+    parser.add_argument('--iterations', type=int, default=30)
+    parser.add_argument('--trial', choices=backends.BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument('--threads', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--images-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.trial:
+        with open(args.images_file) as f:
+            images = json.load(f)
+        print(json.dumps(run_trial(args.trial, args.threads, args.model, images, args.iterations)))
+        return
+
+    result = tune(args.model, args.valid_dir, args.tolerance, args.sample_size, args.objective, args.iterations)
+    save_tuning(host_key(args.model), result)
+    for trial in sorted(result['trials'], key=lambda t: t['p50_ms']):
+        agreement = 'n/a' if trial['agreement'] is None else f"{trial['agreement']:.3f}"
+        print(f"{trial['backend']:<15} x{trial['threads']:<3} p50 {trial['p50_ms']:8.2f} ms  "
+              f"{trial['images_per_second']:8.1f} img/s  agreement {agreement}")
+    print(f"Selected {result['backend']} with {result['threads']} threads -> {TUNING_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+import os
+import threading
+
+import numpy as np
+
+from inference import BATCH_SIZE, IMAGE_SIZE
+
+# Inference backends behind one interface: each is constructed from the Keras
+# model path (deriving its own artifact path from it) and an optional thread
+# count, and exposes predict_on_batch(batch) -> probabilities and warm_up().
+# TensorFlow and the TFLite interpreter are imported only by the backend that
+# needs them.
+class InferenceBackend:
+    name = None
+    # Labels in output order and the prediction cache key, set by
+    # inference.load_model from the bundle
+    class_names = None
+    version = None
+
+    def __init__(self, model_path, num_threads=None):
+        self.model_path = model_path
+        self.num_threads = num_threads
+
+    # File or directory this backend loads, derived from the Keras model path
+    @staticmethod
+    def artifact(model_path):
+        return model_path
+
+    # Import this backend's runtime without creating any runtime state, so a
+    # parent process can load the libraries once and fork workers that share
+    # those pages copy-on-write (see prefork.py)
+    @staticmethod
+    def preload():
+        pass
+
+    def predict_on_batch(self, batch):
+        raise NotImplementedError
+
+    def warm_up(self, batch_sizes=(1, BATCH_SIZE)):
+        for size in batch_sizes:
+            self.predict_on_batch(np.zeros((size, *IMAGE_SIZE, 3), dtype=np.float32))
+
+def _import_tensorflow(num_threads):
+    import tensorflow as tf
+
+    if num_threads:
+        try:
+            tf.config.threading.set_intra_op_parallelism_threads(num_threads)
+            tf.config.threading.set_inter_op_parallelism_threads(min(num_threads, 2))
+        except RuntimeError:
+            pass  # the TF runtime is already initialised in this process
+    return tf
+
+# The Keras model called eagerly through predict_on_batch
+class KerasBackend(InferenceBackend):
+    name = 'keras'
+
+    @staticmethod
+    def preload():
+        import tensorflow  # noqa: F401
+
+    def __init__(self, model_path, num_threads=None):
+        super().__init__(model_path, num_threads)
+        tf = _import_tensorflow(num_threads)
+        self.model = tf.keras.models.load_model(model_path)
+
+    def predict_on_batch(self, batch):
+        return np.asarray(self.model.predict_on_batch(batch))
+
+# Calls the model through a tf.function with a fixed input signature, so each
+# call is a single graph execution instead of model.predict()'s data adapter,
+# callbacks and step loop
+class CompiledBackend(KerasBackend):
+    name = 'compiled'
+    jit_compile = False
+
+    def __init__(self, model_path, num_threads=None):
+        super().__init__(model_path, num_threads)
+        import tensorflow as tf
+
+        model = self.model
+        self._serve = tf.function(
+            lambda images: model(images, training=False),
+            input_signature=[tf.TensorSpec([None, *IMAGE_SIZE, 3], tf.float32)],
+            jit_compile=self.jit_compile,
+        )
+
+    def predict_on_batch(self, batch):
+        return self._serve(np.asarray(batch, dtype=np.float32)).numpy()
+
+# XLA compiles once per batch shape, so warm_up() should cover every batch size
+# that will be served
+class XLABackend(CompiledBackend):
+    name = 'xla'
+    jit_compile = True
+
+# The SavedModel written by export_tflite.py, called through its 'serve'
+# endpoint without rebuilding any Keras objects
+class SavedModelBackend(InferenceBackend):
+    name = 'savedmodel'
+    preload = KerasBackend.preload
+
+    @staticmethod
+    def artifact(model_path):
+        return f'{os.path.splitext(model_path)[0]}_savedmodel'
+
+    def __init__(self, model_path, num_threads=None):
+        super().__init__(model_path, num_threads)
+        tf = _import_tensorflow(num_threads)
+        self._loaded = tf.saved_model.load(self.artifact(model_path))
+
+    def predict_on_batch(self, batch):
+        return self._loaded.serve(np.asarray(batch, dtype=np.float32)).numpy()
+
+# The frozen, constant-folded inference graph written by export_serving.py:
+# a single GraphDef with the weights as constants, no variables, optimizer
+# state or Dropout. Input and output tensor names are fixed by the exporter.
+class FrozenGraphBackend(InferenceBackend):
+    name = 'frozen'
+    preload = KerasBackend.preload
+    input_name = 'images:0'
+    output_name = 'probabilities:0'
+
+    @staticmethod
+    def artifact(model_path):
+        return f'{os.path.splitext(model_path)[0]}_frozen.pb'
+
+    def __init__(self, model_path, num_threads=None):
+        super().__init__(model_path, num_threads)
+        tf = _import_tensorflow(num_threads)
+        graph_def = tf.compat.v1.GraphDef()
+        with open(self.artifact(model_path), 'rb') as f:
+            graph_def.ParseFromString(f.read())
+        # export_serving.py --weights float16/bfloat16 stores large constants
+        # in that dtype; compute is float32 either way
+        reduced = {tf.float16.as_datatype_enum, tf.bfloat16.as_datatype_enum}
+        self.weights_dtype = next((tf.as_dtype(node.attr['dtype'].type).name for node in graph_def.node
+                                   if node.op == 'Const' and node.attr['dtype'].type in reduced), 'float32')
+        wrapped = tf.compat.v1.wrap_function(lambda: tf.compat.v1.import_graph_def(graph_def, name=''), [])
+        self._serve = wrapped.prune(self.input_name, self.output_name)
+        # Pruned functions only accept tensors
+        self._to_tensor = tf.convert_to_tensor
+
+    def predict_on_batch(self, batch):
+        return self._serve(self._to_tensor(np.asarray(batch, dtype=np.float32))).numpy()
+
+def tflite_path(model_path, quantization):
+    return f'{os.path.splitext(model_path)[0]}_{quantization}.tflite'
+
+def _quantize(batch, details):
+    if details['dtype'] == np.float32:
+        return batch
+    scale, zero_point = details['quantization']
+    if scale:
+        batch = batch / scale + zero_point
+    info = np.iinfo(details['dtype'])
+    return np.clip(np.round(batch), info.min, info.max).astype(details['dtype'])
+
+def _dequantize(output, details):
+    if details['dtype'] == np.float32:
+        return output
+    scale, zero_point = details['quantization']
+    return (output.astype(np.float32) - zero_point) * scale
+
+def _import_interpreter():
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+# Runs a .tflite export written by export_tflite.py. Uses the standalone
+# tflite_runtime package when it is installed, which avoids loading the full
+# TensorFlow runtime. The interpreter mmaps the file read-only, so processes
+# serving the same .tflite share its pages in the page cache; the weights it
+# computes with (repacked by XNNPACK, float16 expanded to float32) are still
+# private to each process.
+class TFLiteBackend(InferenceBackend):
+    quantization = None
+
+    @classmethod
+    def artifact(cls, model_path):
+        return tflite_path(model_path, cls.quantization)
+
+    @staticmethod
+    def preload():
+        _import_interpreter()
+
+    def __init__(self, model_path, num_threads=None):
+        super().__init__(model_path, num_threads)
+        Interpreter = _import_interpreter()
+        self._interpreter = Interpreter(model_path=self.artifact(model_path),
+                                        num_threads=num_threads or os.cpu_count())
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = None
+        # The interpreter holds per-call state, so concurrent callers take turns
+        self._lock = threading.Lock()
+
+    def predict_on_batch(self, batch):
+        batch = np.asarray(batch, dtype=np.float32)
+        with self._lock:
+            if batch.shape[0] != self._batch_size:
+                self._interpreter.resize_tensor_input(self._input['index'], batch.shape)
+                self._interpreter.allocate_tensors()
+                self._batch_size = batch.shape[0]
+            self._interpreter.set_tensor(self._input['index'], _quantize(batch, self._input))
+            self._interpreter.invoke()
+            return _dequantize(self._interpreter.get_tensor(self._output['index']), self._output)
+
+class TFLiteFloat16Backend(TFLiteBackend):
+    name = 'tflite-float16'
+    quantization = 'float16'
+
+class TFLiteInt8Backend(TFLiteBackend):
+    name = 'tflite-int8'
+    quantization = 'int8'
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (KerasBackend, CompiledBackend, XLABackend, SavedModelBackend, FrozenGraphBackend,
+                    TFLiteFloat16Backend, TFLiteInt8Backend)
+}
+
+def load_backend(name, model_path, num_threads=None):
+    if name not in BACKENDS:
+        raise ValueError(f'Unknown backend {name!r}, expected one of {tuple(BACKENDS)}')
+    return BACKENDS[name](model_path, num_threads)
@@ -0,0 +1,58 @@
+import argparse
+import os
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.timing import print_table
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'main.py')
+
+# Renders the single-image result the way the Analyze button does, for an
+# image passed in through AppTest
+def analyze_script(image_path):
+    import io
+
+    from app_pages import disease_recognition
+    from translations import TRANSLATIONS
+
+    with open(image_path, 'rb') as f:
+        disease_recognition.show_single_result(TRANSLATIONS['English'], io.BytesIO(f.read()))
+
+# Wall and CPU time the Streamlit script thread spends per interaction. Run
+# from a directory containing the model; pass --image to include the Analyze
+# path.
+#
+#     python -m benchmarks.app_rerun --image leaf.jpg
+def main():
+    parser = argparse.ArgumentParser(description='Per-interaction script time of the Streamlit app')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--image', help='leaf photo used for the Analyze scenario')
+    args = parser.parse_args()
+
+    def measure(name, interact):
+        wall, cpu = [], []
+        for _ in range(args.iterations):
+            start_wall, start_cpu = time.perf_counter(), time.process_time()
+            interact()
+            wall.append((time.perf_counter() - start_wall) * 1000)
+            cpu.append((time.process_time() - start_cpu) * 1000)
+        return {'interaction': name, 'wall_ms': sum(wall) / len(wall), 'cpu_ms': sum(cpu) / len(cpu)}
+
+    app = AppTest.from_file(MAIN_SCRIPT, default_timeout=120).run()
+    app.sidebar.selectbox[1].select('disease_recognition').run()
+    rows = [
+        measure('recognition page rerun', lambda: app.run()),
+        measure('switch language', lambda: app.sidebar.selectbox[0].select(
+            'Telugu' if app.sidebar.selectbox[0].value == 'English' else 'English').run()),
+    ]
+    # Measured last: once TensorFlow is imported, AppTest's per-run module
+    # scan makes every run slower
+    if args.image:
+        analyze = AppTest.from_function(analyze_script, args=(os.path.abspath(args.image),), default_timeout=120)
+        analyze.run()  # loads the model and fills the prediction cache
+        rows.append(measure('analyze', lambda: analyze.run()))
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
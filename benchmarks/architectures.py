@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import inference
+import model_bundle
+from benchmarks.timing import measure_latency, peak_rss_mb, print_table, reset_peak_rss, summarize
+from datasets import TRAIN_DIR, VALID_DIR
+
+# Accuracy against single-image CPU latency, parameter count and memory for
+# each model in architectures.py, trained on the same train/valid split, each
+# variant in a fresh process. Variants on the accuracy/latency Pareto front
+# are starred.
+#
+#     python -m benchmarks.architectures --epochs 10 --threads 2
+#     python -m benchmarks.architectures --models-dir trained/   # skip training
+def run_worker(args):
+    import tensorflow as tf
+
+    import architectures
+
+    if args.threads:
+        tf.config.threading.set_intra_op_parallelism_threads(args.threads)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+
+    import data_pipeline
+
+    # Loaded as train.py loads them; validation labels index into the class
+    # names of the training split, or of the bundle of a reused model
+    trained_path = os.path.join(args.models_dir, f'{args.worker}.keras') if args.models_dir else None
+    train_s = None
+    if trained_path and os.path.exists(trained_path):
+        model = tf.keras.models.load_model(trained_path)
+        class_names = inference.get_class_names(trained_path)
+    else:
+        training_set, class_names, _ = data_pipeline.make_dataset(args.train_dir)
+        model = architectures.build_model(args.worker, num_classes=len(class_names))
+        model.compile(optimizer='adam', loss='categorical_crossentropy', metrics=['accuracy'])
+        start = time.perf_counter()
+        model.fit(training_set, epochs=args.epochs, verbose=0)
+        train_s = time.perf_counter() - start
+        del training_set
+        if trained_path:
+            os.makedirs(args.models_dir, exist_ok=True)
+            model_bundle.save_bundle(model, trained_path, class_names, image_size=inference.IMAGE_SIZE,
+                                     interpolation='bilinear')
+    validation_set, _, _ = data_pipeline.make_dataset(args.valid_dir, class_names, shuffle=False)
+    _, accuracy = model.evaluate(validation_set, verbose=0)
+    del validation_set
+
+    # Inference only from here on: drop training state and the decoded-image
+    # caches and measure the peak memory of serving single images
+    serve = tf.function(lambda images: model(images, training=False),
+                        input_signature=[tf.TensorSpec([None, *inference.IMAGE_SIZE, 3], tf.float32)])
+    single = np.zeros((1, *inference.IMAGE_SIZE, 3), dtype=np.float32)
+    serve(single)
+    base_mb = reset_peak_rss()
+    latency = summarize(measure_latency(lambda: serve(single), args.iterations))
+    inference_mb = peak_rss_mb() - base_mb
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.keras')
+        # Uncompiled copy, so the size excludes optimizer state
+        tf.keras.models.clone_model(model).save(path)
+        size_mb = os.path.getsize(path) / 2**20
+
+    print(json.dumps({
+        'model': args.worker,
+        'accuracy': float(accuracy),
+        'p50_ms': latency['p50_ms'],
+        'p99_ms': latency['p99_ms'],
+        'params_m': model.count_params() / 1e6,
+        'size_mb': size_mb,
+        'peak_rss_mb': peak_rss_mb(),
+        'inference_mb': inference_mb,
+        'train_s': train_s,
+    }))
+
+# A variant is on the front when no other is at least as accurate and at
+# least as fast while being strictly better at one of the two
+def pareto_front(rows):
+    front = set()
+    for row in rows:
+        dominated = any(
+            other['accuracy'] >= row['accuracy'] and other['p50_ms'] <= row['p50_ms']
+            and (other['accuracy'] > row['accuracy'] or other['p50_ms'] < row['p50_ms'])
+            for other in rows if other is not row
+        )
+        if not dominated:
+            front.add(row['model'])
+    return front
+
+def main():
+    import architectures
+
+    parser = argparse.ArgumentParser(description='Accuracy vs latency, size and memory of the model architectures')
+    parser.add_argument('--models', nargs='+', choices=architectures.ARCHITECTURES,
+                        default=list(architectures.ARCHITECTURES))
+    parser.add_argument('--train-dir', default=TRAIN_DIR)
+    parser.add_argument('--valid-dir', default=VALID_DIR)
+    parser.add_argument('--epochs', type=int, default=10)
+    parser.add_argument('--models-dir', help='reuse bundled <model>.keras from here if present, else save trained models here')
+    parser.add_argument('--threads', type=int, help='CPU threads, e.g. 1-2 to approximate low-end hardware')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--worker', choices=architectures.ARCHITECTURES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    rows = []
+    for name in args.models:
+        command = [sys.executable, '-m', 'benchmarks.architectures', '--worker', name,
+                   '--train-dir', args.train_dir, '--valid-dir', args.valid_dir,
+                   '--epochs', str(args.epochs), '--iterations', str(args.iterations)]
+        if args.models_dir:
+            command += ['--models-dir', args.models_dir]
+        if args.threads:
+            command += ['--threads', str(args.threads)]
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+
+    front = pareto_front(rows)
+    for row in rows:
+        row['pareto'] = '*' if row['model'] in front else ''
+        if row['train_s'] is None:
+            row['train_s'] = '-'
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from benchmarks.timing import measure_latency, peak_rss_mb, print_table, reset_peak_rss, summarize
+
+# Compares the original load_img(target_size=...) decode against the
+# reduced-resolution decode_image() fast path on large JPEGs: per-image latency
+# and peak RSS growth, each measured in a fresh process
+#
+#     python -m benchmarks.decode --images photo1.jpg photo2.jpg
+def load_img_decode(image_bytes):
+    import tensorflow as tf
+    img = tf.keras.preprocessing.image.load_img(io.BytesIO(image_bytes), target_size=(128, 128))
+    return tf.keras.preprocessing.image.img_to_array(img)
+
+def draft_decode(image_bytes):
+    import inference
+    return inference.decode_image(image_bytes)
+
+METHODS = {'load_img': load_img_decode, 'draft': draft_decode}
+
+# Smooth gradients plus mild noise compress like a real photo
+def synthetic_photo(path, width=4000, height=3000):
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    rgb = np.stack([x / width * 255, y / height * 255, (x + y) / (width + height) * 255], axis=-1)
+    rgb += np.random.default_rng(0).normal(0, 8, rgb.shape)
+    Image.fromarray(np.clip(rgb, 0, 255).astype(np.uint8)).save(path, quality=92)
+
+def run_worker(method, paths, iterations):
+    # Import TensorFlow (including its lazily loaded Keras image utilities),
+    # PIL and inference before taking the baseline, so only decoding is
+    # measured; inference itself no longer imports TensorFlow
+    import tensorflow as tf
+
+    import inference  # noqa: F401
+    tf.keras.preprocessing.image
+    decode = METHODS[method]
+    images = [open(path, 'rb').read() for path in paths]
+    baseline = reset_peak_rss()
+    latencies = np.concatenate([measure_latency(lambda: decode(b), iterations, warmup=1) for b in images])
+    print(json.dumps({
+        'method': method,
+        **summarize(latencies),
+        'peak_rss_growth_mb': peak_rss_mb() - baseline,
+    }))
+
+def main():
+    parser = argparse.ArgumentParser(description='Decode latency and memory: load_img vs draft decode')
+    parser.add_argument('--images', nargs='+', help='JPEGs to decode (default: a synthetic 12 MP photo)')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--worker', choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.images, args.iterations)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = args.images
+        if not paths:
+            paths = [os.path.join(tmp, 'synthetic_12mp.jpg')]
+            synthetic_photo(paths[0])
+
+        rows = []
+        for method in METHODS:
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.decode', '--worker', method,
+                 '--iterations', str(args.iterations), '--images', *paths],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            rows.append(json.loads(output.strip().splitlines()[-1]))
+        print_table(rows)
+
+if __name__ == '__main__':
+    main()
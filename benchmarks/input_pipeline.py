@@ -0,0 +1,41 @@
+import argparse
+
+from benchmarks.timing import print_table
+from datasets import TRAIN_DIR
+
+# Images/sec the input stage alone can deliver: the notebook's
+# image_dataset_from_directory call against data_pipeline.make_dataset with and
+# without its cache. Each is read for several passes; the first pass of a
+# cached pipeline pays the decoding, later passes read the cache.
+#
+#     python -m benchmarks.input_pipeline --directory train --epochs 3
+def main():
+    parser = argparse.ArgumentParser(description='Input pipeline throughput')
+    parser.add_argument('--directory', default=TRAIN_DIR)
+    parser.add_argument('--epochs', type=int, default=3)
+    args = parser.parse_args()
+
+    import tensorflow as tf
+
+    import data_pipeline
+    import inference
+
+    notebook = tf.keras.utils.image_dataset_from_directory(
+        args.directory, labels='inferred', label_mode='categorical', color_mode='rgb',
+        batch_size=inference.BATCH_SIZE, image_size=inference.IMAGE_SIZE, shuffle=True, interpolation='bilinear')
+    count = len(notebook.file_paths)
+    variants = [('image_dataset_from_directory', notebook)]
+    for name, cache in (('pipeline, no cache', None), ('pipeline, memory cache', 'memory')):
+        dataset, _, _ = data_pipeline.make_dataset(args.directory, cache=cache)
+        variants.append((name, dataset))
+
+    rows = []
+    for name, dataset in variants:
+        rates = data_pipeline.measure_throughput(dataset, count, args.epochs)
+        row = {'input': name}
+        row.update({f'epoch_{i + 1}_img_s': rate for i, rate in enumerate(rates)})
+        rows.append(row)
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
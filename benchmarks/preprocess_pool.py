@@ -0,0 +1,56 @@
+import argparse
+import io
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+import inference
+from benchmarks.timing import print_table
+from preprocess_pool import PreprocessPool
+
+# Decode throughput of the in-process preprocess_images() loop against
+# PreprocessPool at increasing worker counts, on synthetic phone-sized JPEGs
+#
+#     python -m benchmarks.preprocess_pool --images 512 --workers 1 2 4 8 16 32
+def synthetic_jpegs(count, size=(3000, 4000), distinct=8):
+    rng = np.random.default_rng(0)
+    images = []
+    for _ in range(distinct):
+        # Smooth gradients plus noise compress like a real photo
+        base = np.linspace(0, 255, size[1], dtype=np.float32)[None, :, None]
+        pixels = np.clip(base + rng.normal(0, 20, (size[0], size[1], 3)), 0, 255).astype(np.uint8)
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, format='JPEG', quality=90)
+        images.append(buffer.getvalue())
+    return [images[i % distinct] for i in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser(description='Images/sec of serial vs process-pool decoding')
+    parser.add_argument('--images', type=int, default=256)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()])
+    args = parser.parse_args()
+
+    images = synthetic_jpegs(args.images)
+    rows = []
+    start = time.perf_counter()
+    for _ in inference.preprocess_images(images):
+        pass
+    serial = args.images / (time.perf_counter() - start)
+    rows.append({'mode': 'serial', 'workers': 1, 'img_per_s': serial, 'speedup': 1.0})
+
+    for workers in sorted(set(args.workers)):
+        with PreprocessPool(workers) as pool:
+            # First pass pays for worker start-up and imports
+            for _ in pool.map_batches(images[:inference.BATCH_SIZE]):
+                pass
+            start = time.perf_counter()
+            for _ in pool.map_batches(images):
+                pass
+            rate = args.images / (time.perf_counter() - start)
+        rows.append({'mode': 'pool', 'workers': workers, 'img_per_s': rate, 'speedup': rate / serial})
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
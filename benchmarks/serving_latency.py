@@ -0,0 +1,38 @@
+import argparse
+
+import numpy as np
+
+import backends
+import inference
+from benchmarks.timing import measure_latency, print_table, summarize
+
+# Compares per-call latency of the original model.predict() path against the
+# compiled backends in backends.py
+#
+#     python -m benchmarks.serving_latency --batch-sizes 1 32
+def main():
+    parser = argparse.ArgumentParser(description='p50/p99 latency of model.predict vs compiled serving')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, inference.BATCH_SIZE])
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--no-xla', action='store_true', help='skip the XLA-compiled mode')
+    args = parser.parse_args()
+
+    model = backends.KerasBackend(args.model).model
+    servers = {
+        'predict': lambda batch: model.predict(batch, verbose=0),
+        'compiled': backends.CompiledBackend(args.model).predict_on_batch,
+    }
+    if not args.no_xla:
+        servers['xla'] = backends.XLABackend(args.model).predict_on_batch
+
+    rows = []
+    for batch_size in args.batch_sizes:
+        batch = np.random.uniform(0, 255, (batch_size, *inference.IMAGE_SIZE, 3)).astype(np.float32)
+        for name, serve in servers.items():
+            stats = summarize(measure_latency(lambda: serve(batch), args.iterations))
+            rows.append({'mode': name, 'batch': batch_size, **stats})
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import inference
+from benchmarks.timing import measure_latency, peak_rss_mb, print_table, summarize
+from datasets import VALID_DIR, list_labeled_images
+
+# Accuracy, latency, memory and file size of the Keras model against its
+# TFLite exports on the validation set, each backend in a fresh process. Run
+# export_tflite.py first.
+#
+#     python -m benchmarks.tflite_backends --valid-dir valid --limit 2000
+BACKENDS = ('compiled', 'tflite-float16', 'tflite-int8')
+
+def run_worker(args):
+    paths, labels, _ = list_labeled_images(args.valid_dir, inference.get_class_names(args.model))
+    if args.limit:
+        # Deterministic subsample spread over the whole (class-ordered) list
+        keep = np.linspace(0, len(paths) - 1, min(args.limit, len(paths))).astype(int)
+        paths, labels = [paths[i] for i in keep], [labels[i] for i in keep]
+
+    start = time.perf_counter()
+    model = inference.load_model(args.model, args.worker)
+    load_s = time.perf_counter() - start
+
+    correct = 0
+    for i in range(0, len(paths), inference.BATCH_SIZE):
+        batch = np.stack([inference.decode_image(open(p, 'rb').read()) for p in paths[i:i + inference.BATCH_SIZE]])
+        predictions = inference.predict_batch(model, batch)
+        correct += int(np.sum(np.argmax(predictions, axis=1) == labels[i:i + inference.BATCH_SIZE]))
+
+    single = np.zeros((1, *inference.IMAGE_SIZE, 3), dtype=np.float32)
+    latency = summarize(measure_latency(lambda: inference.predict_batch(model, single), args.iterations))
+    artifact = inference.serving_artifact(args.model, args.worker)
+    print(json.dumps({
+        'backend': args.worker,
+        'accuracy': correct / len(paths),
+        'p50_ms': latency['p50_ms'],
+        'p99_ms': latency['p99_ms'],
+        'load_s': load_s,
+        'peak_rss_mb': peak_rss_mb(),
+        'size_mb': os.path.getsize(artifact) / 2**20,
+    }))
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare Keras and TFLite serving backends')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--valid-dir', default=VALID_DIR)
+    parser.add_argument('--limit', type=int, help='evaluate on at most this many validation images')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument('--worker', choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    rows = []
+    for backend in args.backends:
+        command = [sys.executable, '-m', 'benchmarks.tflite_backends', '--worker', backend,
+                   '--model', args.model, '--valid-dir', args.valid_dir, '--iterations', str(args.iterations)]
+        if args.limit:
+            command += ['--limit', str(args.limit)]
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+
+    # Deltas are relative to the first backend listed (the Keras model by default)
+    reference = rows[0]
+    for row in rows:
+        row['accuracy_delta'] = row['accuracy'] - reference['accuracy']
+        row['speedup'] = reference['p50_ms'] / row['p50_ms']
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import resource
+import sys
+import time
+
+import numpy as np
+
+# Call fn repeatedly and return per-call latencies in milliseconds
+def measure_latency(fn, iterations=200, warmup=10):
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return np.array(latencies)
+
+def summarize(latencies):
+    return {
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'mean_ms': float(np.mean(latencies)),
+    }
+
+# Print rows of dicts as an aligned plain-text table
+def print_table(rows):
+    columns = list(rows[0])
+    cells = [[f'{row[c]:.3f}' if isinstance(row[c], float) else str(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    print('  '.join(c.ljust(w) for c, w in zip(columns, widths)))
+    for r in cells:
+        print('  '.join(v.ljust(w) for v, w in zip(r, widths)))
+
+def _proc_status_mb(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+
+# Reset the peak-RSS watermark so import-time spikes do not hide the peak being
+# measured; falls back to ru_maxrss where /proc is unavailable
+def reset_peak_rss():
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return _proc_status_mb('VmRSS')
+    except OSError:
+        return peak_rss_mb()
+
+def peak_rss_mb():
+    try:
+        return _proc_status_mb('VmHWM')
+    except OSError:
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
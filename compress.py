@@ -0,0 +1,284 @@
+import argparse
+import gzip
+import os
+
+import numpy as np
+
+import inference
+import model_bundle
+from benchmarks.timing import measure_latency, print_table, summarize
+from datasets import TRAIN_DIR, VALID_DIR, image_batches, list_labeled_images, load_image
+
+# Post-training compression of a Sequential model (the notebook CNN or an
+# architectures.py variant). Structured pruning drops whole conv filters and
+# dense units with the smallest L1 norm and rebuilds the model without them,
+# so the result is a smaller ordinary Keras model, not a masked one; it is
+# fine-tuned on the train directory after each pruning step. Weight clustering
+# then optionally snaps every kernel to a few shared values, which leaves the
+# model the same size in memory but lets the file compress several times
+# better. The pruned model is saved to --output and the clustered one next to
+# it with a _clustered suffix, so both stages in the report stay on disk.
+#
+#     python compress.py --conv-ratio 0.5 --dense-ratio 0.75 --steps 2 --epochs 2 --clusters 16
+PRUNED_PATH = 'pruned_plant_disease_model.keras'
+FINE_TUNE_LEARNING_RATE = 1e-4
+
+def _layers():
+    import tensorflow as tf
+
+    return tf.keras.layers
+
+# Layers whose output channels can be removed
+def prunable(layer):
+    layers = _layers()
+    return isinstance(layer, (layers.Conv2D, layers.SeparableConv2D, layers.Dense))
+
+# L1 norm of each output filter / unit
+def filter_importance(layer):
+    if isinstance(layer, _layers().SeparableConv2D):
+        kernel = layer.pointwise_kernel.numpy()
+    else:
+        kernel = layer.kernel.numpy()
+    return np.abs(kernel).reshape(-1, kernel.shape[-1]).sum(axis=0)
+
+# Output channels to keep, by layer index. The last weighted layer is the
+# classifier and keeps all of its units.
+def prune_plan(model, conv_ratio, dense_ratio):
+    weighted = [i for i, layer in enumerate(model.layers) if layer.weights]
+    plan = {}
+    for i in weighted[:-1]:
+        layer = model.layers[i]
+        if not prunable(layer):
+            continue
+        ratio = dense_ratio if isinstance(layer, _layers().Dense) else conv_ratio
+        importance = filter_importance(layer)
+        keep = max(1, int(round(len(importance) * (1 - ratio))))
+        plan[i] = np.sort(np.argsort(importance)[::-1][:keep])
+    return plan
+
+# Rebuild model keeping only the planned output channels of each layer and the
+# matching input channels of the layer after it
+def prune(model, plan):
+    import tensorflow as tf
+
+    layers = _layers()
+    rebuilt = []
+    channels = None  # kept channels of the current activation, None for all
+    for i, layer in enumerate(model.layers):
+        config = layer.get_config()
+        weights = layer.get_weights()
+        keep = plan.get(i)
+
+        if isinstance(layer, layers.SeparableConv2D):
+            if layer.depth_multiplier != 1:
+                raise ValueError(f'{layer.name}: only depth_multiplier=1 can be pruned')
+            depthwise, pointwise = weights[0], weights[1]
+            if channels is not None:
+                depthwise, pointwise = depthwise[:, :, channels], pointwise[:, :, channels]
+            if keep is not None:
+                pointwise = pointwise[..., keep]
+                config['filters'] = len(keep)
+            weights = [depthwise, pointwise] + [b if keep is None else b[keep] for b in weights[2:]]
+        elif isinstance(layer, layers.Conv2D):
+            kernel = weights[0]
+            if channels is not None:
+                kernel = kernel[:, :, channels]
+            if keep is not None:
+                kernel = kernel[..., keep]
+                config['filters'] = len(keep)
+            weights = [kernel] + [b if keep is None else b[keep] for b in weights[1:]]
+        elif isinstance(layer, layers.Dense):
+            kernel = weights[0]
+            if channels is not None:
+                kernel = kernel[channels]
+            if keep is not None:
+                kernel = kernel[:, keep]
+                config['units'] = len(keep)
+            weights = [kernel] + [b if keep is None else b[keep] for b in weights[1:]]
+        elif isinstance(layer, layers.BatchNormalization):
+            if channels is not None:
+                weights = [w[channels] for w in weights]
+        elif isinstance(layer, layers.Flatten):
+            # Flatten orders features (row, column, channel), channel fastest
+            if channels is not None:
+                _, height, width, depth = layer.input.shape
+                positions = np.arange(height * width)[:, None] * depth
+                keep = (positions + channels[None, :]).ravel()
+        elif weights:
+            raise ValueError(f'Cannot prune through {type(layer).__name__} layer {layer.name}')
+
+        if keep is not None:
+            channels = keep
+        rebuilt.append((layer.__class__.from_config(config), weights))
+
+    pruned = tf.keras.Sequential([tf.keras.Input(model.input_shape[1:])] + [layer for layer, _ in rebuilt],
+                                 name=model.name)
+    for layer, weights in rebuilt:
+        layer.set_weights(weights)
+    return pruned
+
+# Multiply-adds times two, from each layer's input and output shapes
+def count_flops(model):
+    layers = _layers()
+    flops = 0
+    for layer in model.layers:
+        if not prunable(layer):
+            continue
+        inputs = layer.input.shape[-1]
+        outputs = layer.output.shape[-1]
+        if isinstance(layer, layers.Dense):
+            flops += 2 * inputs * outputs
+            continue
+        height, width = layer.output.shape[1:3]
+        kernel_size = int(np.prod(layer.kernel_size))
+        if isinstance(layer, layers.SeparableConv2D):
+            flops += 2 * height * width * (kernel_size * inputs + inputs * outputs)
+        else:
+            flops += 2 * height * width * kernel_size * inputs * outputs
+    return flops
+
+# 1-D k-means with centroids initialised evenly between the extremes (the
+# usual choice for weight clustering: it keeps the rare large weights)
+def cluster_values(values, clusters, iterations=20):
+    flat = values.ravel()
+    centroids = np.linspace(flat.min(), flat.max(), clusters)
+    for _ in range(iterations):
+        assignment = np.searchsorted((centroids[1:] + centroids[:-1]) / 2, flat)
+        counts = np.bincount(assignment, minlength=clusters)
+        sums = np.bincount(assignment, weights=flat, minlength=clusters)
+        occupied = counts > 0
+        centroids[occupied] = sums[occupied] / counts[occupied]
+    assignment = np.searchsorted((centroids[1:] + centroids[:-1]) / 2, flat)
+    return centroids[assignment].reshape(values.shape).astype(values.dtype)
+
+# Snap every conv and dense kernel to its own set of shared values in place;
+# biases and batch-norm parameters are left alone
+def cluster_weights(model, clusters):
+    layers = _layers()
+    for layer in model.layers:
+        if isinstance(layer, layers.SeparableConv2D):
+            kernels = [layer.depthwise_kernel, layer.pointwise_kernel]
+        elif prunable(layer):
+            kernels = [layer.kernel]
+        else:
+            continue
+        for kernel in kernels:
+            kernel.assign(cluster_values(kernel.numpy(), clusters))
+
+def labeled_batches(paths, labels, num_classes, batch_size, seed=0):
+    import tensorflow as tf
+
+    return (tf.data.Dataset.from_tensor_slices((paths, labels))
+            .shuffle(len(paths), seed=seed, reshuffle_each_iteration=True)
+            .map(lambda path, label: (load_image(path), tf.one_hot(label, num_classes)),
+                 num_parallel_calls=tf.data.AUTOTUNE)
+            .batch(batch_size)
+            .prefetch(tf.data.AUTOTUNE))
+
+def fine_tune(model, dataset, epochs):
+    import tensorflow as tf
+
+    model.compile(optimizer=tf.keras.optimizers.Adam(FINE_TUNE_LEARNING_RATE),
+                  loss='categorical_crossentropy', metrics=['accuracy'])
+    model.fit(dataset, epochs=epochs)
+
+# Top-1 predictions for paths, and batch-1 latency
+def evaluate(model, paths, batch_size, iterations=200):
+    import tensorflow as tf
+
+    serve = tf.function(lambda images: model(images, training=False),
+                        input_signature=[tf.TensorSpec([None, *inference.IMAGE_SIZE, 3], tf.float32)])
+    top1 = np.concatenate([np.argmax(serve(batch).numpy(), axis=1) for batch in image_batches(paths, batch_size)])
+    single = np.zeros((1, *inference.IMAGE_SIZE, 3), dtype=np.float32)
+    return top1, summarize(measure_latency(lambda: serve(single), iterations))
+
+def clustered_path(output_path):
+    return f'{os.path.splitext(output_path)[0]}_clustered.keras'
+
+# Uncompiled copy, so saved files carry no optimizer state
+def save_for_serving(model, path, class_names):
+    import tensorflow as tf
+
+    served = tf.keras.Sequential([tf.keras.Input(model.input_shape[1:]), *model.layers], name=model.name)
+    model_bundle.save_bundle(served, path, class_names)
+    with open(path, 'rb') as f:
+        compressed = len(gzip.compress(f.read(), compresslevel=6))
+    return os.path.getsize(path) / 2**20, compressed / 2**20
+
+def main():
+    parser = argparse.ArgumentParser(description='Prune and cluster a trained model')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--output', default=PRUNED_PATH,
+                        help='pruned model; --clusters also writes <output>_clustered.keras')
+    parser.add_argument('--train-dir', default=TRAIN_DIR)
+    parser.add_argument('--valid-dir', default=VALID_DIR)
+    parser.add_argument('--conv-ratio', type=float, default=0.5, help='fraction of conv filters to remove')
+    parser.add_argument('--dense-ratio', type=float, default=0.75, help='fraction of hidden dense units to remove')
+    parser.add_argument('--steps', type=int, default=1, help='prune gradually, fine-tuning after each step')
+    parser.add_argument('--epochs', type=int, default=2, help='fine-tuning epochs per step')
+    parser.add_argument('--clusters', type=int, help='cluster each kernel into this many shared values')
+    parser.add_argument('--batch-size', type=int, default=inference.BATCH_SIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    import tensorflow as tf
+
+    tf.keras.utils.set_random_seed(args.seed)
+    class_names = inference.get_class_names(args.model)
+    train_paths, train_labels, _ = list_labeled_images(args.train_dir, class_names)
+    valid_paths, valid_labels, _ = list_labeled_images(args.valid_dir, class_names)
+    valid_labels = np.array(valid_labels)
+    training_set = labeled_batches(train_paths, train_labels, len(class_names), args.batch_size, args.seed)
+
+    summary, per_class = [], {}
+
+    # Measured as soon as each stage exists: clustering changes the pruned
+    # model's weights in place
+    def record(name, stage_model, size_mb, gzip_mb=None):
+        top1, latency = evaluate(stage_model, valid_paths, args.batch_size)
+        summary.append({
+            'model': name,
+            'params_m': stage_model.count_params() / 1e6,
+            'mflops': count_flops(stage_model) / 1e6,
+            'p50_ms': latency['p50_ms'],
+            'p99_ms': latency['p99_ms'],
+            'size_mb': size_mb,
+            'gzip_mb': gzip_mb if gzip_mb is not None else '-',
+            'accuracy': float(np.mean(top1 == valid_labels)),
+        })
+        per_class[name] = top1 == valid_labels
+
+    model = tf.keras.models.load_model(args.model)
+    record('original', model, os.path.getsize(args.model) / 2**20)
+
+    # Equal per-step ratios that compound to the requested totals
+    conv_step = 1 - (1 - args.conv_ratio) ** (1 / args.steps)
+    dense_step = 1 - (1 - args.dense_ratio) ** (1 / args.steps)
+    pruned = model
+    for step in range(args.steps):
+        pruned = prune(pruned, prune_plan(pruned, conv_step, dense_step))
+        print(f'Step {step + 1}/{args.steps}: {pruned.count_params():,} parameters, fine-tuning')
+        fine_tune(pruned, training_set, args.epochs)
+    record('pruned', pruned, *save_for_serving(pruned, args.output, class_names))
+
+    saved = [args.output]
+    if args.clusters:
+        cluster_weights(pruned, args.clusters)
+        saved.append(clustered_path(args.output))
+        record(f'clustered ({args.clusters})', pruned, *save_for_serving(pruned, saved[-1], class_names))
+
+    print_table(summary)
+    print()
+    rows = []
+    for index, class_name in enumerate(class_names):
+        mask = valid_labels == index
+        if not mask.any():
+            continue
+        row = {'class': class_name, 'images': int(mask.sum())}
+        row.update({name: float(correct[mask].mean()) for name, correct in per_class.items()})
+        rows.append(row)
+    print_table(rows)
+    print(f'\nSaved {", ".join(saved)}')
+
+if __name__ == '__main__':
+    main()
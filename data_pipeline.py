@@ -0,0 +1,101 @@
+import time
+
+import tensorflow as tf
+
+import augmentation
+import inference
+import shards
+from datasets import list_labeled_images, load_image
+
+# tf.data input stage for training and evaluation. Files are listed in the
+# same order image_dataset_from_directory uses, decoded on parallel map calls,
+# optionally cached after the first epoch, shuffled with a fixed seed and
+# prefetched so decoding overlaps with the training step.
+#
+# The cache holds images already resized and rounded to uint8 (about 48 KB
+# each at 128x128, so roughly 3.4 GB for the full train split and 0.8 GB for
+# valid); they are cast back to float32 0-255 when batched. The rounding moves
+# pixels by less than half a level against image_dataset_from_directory's
+# unrounded float resize. Pass a file path as cache to keep it on disk instead
+# of in memory.
+AUTOTUNE = tf.data.AUTOTUNE
+SHUFFLE_BUFFER = 8192
+
+def decode(path, label):
+    return tf.cast(tf.round(load_image(path)), tf.uint8), label
+
+def to_float(images, labels):
+    return tf.cast(images, tf.float32), labels
+
+# Returns (dataset, class_names, image_count). With class_names given (e.g.
+# from a model bundle), labels index into it and other folders are skipped.
+# A directory written by shards.py is read from its memory-mapped shards, with
+# no decoding (and so no cache). originals_only skips the pre-augmented copies
+# on disk and augment applies augmentation.augment() after the cache, so every
+# epoch sees new variants.
+def make_dataset(directory, class_names=None, batch_size=inference.BATCH_SIZE, shuffle=True, seed=0,
+                 cache='memory', shuffle_buffer=SHUFFLE_BUFFER, parallel_calls=AUTOTUNE, prefetch=AUTOTUNE,
+                 deterministic=True, originals_only=False, augment=False):
+    if shards.is_shard_dir(directory):
+        if originals_only:
+            raise ValueError(f'{directory} is a shard set; pass originals_only when writing it with shards.py')
+        return shards.make_dataset(directory, class_names, batch_size, shuffle, seed, prefetch, augment)
+
+    paths, labels, class_names = list_labeled_images(directory, class_names)
+    if originals_only:
+        paths, labels, _ = augmentation.select_originals(paths, labels)
+    if not paths:
+        raise FileNotFoundError(f'No images found under {directory}')
+
+    dataset = tf.data.Dataset.from_tensor_slices((paths, tf.one_hot(labels, len(class_names))))
+    if shuffle:
+        # Shuffling file names is cheap, so this one covers the whole split.
+        # With a cache it only fixes the order the cache is filled in.
+        dataset = dataset.shuffle(len(paths), seed=seed, reshuffle_each_iteration=cache is None)
+    dataset = dataset.map(decode, num_parallel_calls=parallel_calls, deterministic=deterministic)
+    if cache is not None:
+        dataset = dataset.cache('' if cache == 'memory' else cache)
+        if shuffle:
+            # Decoded images are large, so later epochs reshuffle through a
+            # bounded buffer
+            dataset = dataset.shuffle(min(shuffle_buffer, len(paths)), seed=seed, reshuffle_each_iteration=True)
+    if augment:
+        dataset = augmentation.augment_dataset(dataset, seed, parallel_calls)
+    dataset = dataset.batch(batch_size).map(to_float, num_parallel_calls=parallel_calls, deterministic=deterministic)
+    if prefetch is not None:
+        dataset = dataset.prefetch(prefetch)
+    return dataset, class_names, len(paths)
+
+# Read a dataset as fast as it can be produced; images per second for each
+# pass (the first pass fills any cache)
+def measure_throughput(dataset, image_count, epochs=2):
+    rates = []
+    for _ in range(epochs):
+        start = time.perf_counter()
+        for _ in dataset:
+            pass
+        rates.append(image_count / (time.perf_counter() - start))
+    return rates
+
+# Keras callback adding training wall time and images per second to the epoch
+# logs (and so to the saved history). The clock stops when validation starts.
+class ThroughputLogger(tf.keras.callbacks.Callback):
+    def __init__(self, image_count):
+        super().__init__()
+        self.image_count = image_count
+        self._start = None
+        self._elapsed = None
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._start = time.perf_counter()
+        self._elapsed = None
+
+    def on_test_begin(self, logs=None):
+        if self._start is not None and self._elapsed is None:
+            self._elapsed = time.perf_counter() - self._start
+
+    def on_epoch_end(self, epoch, logs=None):
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._start
+        if logs is not None:
+            logs['train_seconds'] = elapsed
+            logs['images_per_sec'] = self.image_count / elapsed
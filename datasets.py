@@ -0,0 +1,68 @@
+import os
+
+from inference import IMAGE_SIZE
+
+# Dataset folders, relative to the dataset root the notebooks are run from
+TRAIN_DIR = 'train'
+VALID_DIR = 'valid'
+
+# Same extensions image_dataset_from_directory accepts
+IMAGE_EXTENSIONS = ('.bmp', '.gif', '.jpeg', '.jpg', '.png')
+
+# List (paths, labels, class_names) for a class-per-folder image directory in
+# the same order image_dataset_from_directory uses: classes are the sorted
+# sub-folder names and files are sorted within each class. When class_names is
+# given (e.g. the model's label list), labels index into it and folders that
+# are not in it are skipped. A split with a manifest (see manifest.py) is
+# listed from it instead of walking the folders.
+def list_labeled_images(directory, class_names=None):
+    import manifest
+
+    listing = manifest.current_manifest(directory)
+    if listing is not None:
+        folders, images = manifest.entries(directory, listing)
+        files = [(path, folder) for path, folder, *_ in images]
+    else:
+        folders = sorted(entry.name for entry in os.scandir(directory) if entry.is_dir())
+        files = None
+    if class_names is None:
+        class_names = folders
+    label_of = {name: i for i, name in enumerate(class_names)}
+
+    paths, labels = [], []
+    if files is not None:
+        for path, folder in files:
+            if folder in label_of:
+                paths.append(path)
+                labels.append(label_of[folder])
+        return paths, labels, list(class_names)
+
+    for folder in folders:
+        if folder not in label_of:
+            continue
+        for root, _, names in sorted(os.walk(os.path.join(directory, folder))):
+            for name in sorted(names):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(root, name))
+                    labels.append(label_of[folder])
+    return paths, labels, list(class_names)
+
+# Decode one image file the way image_dataset_from_directory does in
+# train_plant_disease.ipynb (bilinear resize, float32 0-255), for tf.data
+# pipelines built from list_labeled_images
+def load_image(path):
+    import tensorflow as tf
+
+    image = tf.io.decode_image(tf.io.read_file(path), channels=3, expand_animations=False)
+    image = tf.image.resize(image, IMAGE_SIZE, method='bilinear')
+    image.set_shape((*IMAGE_SIZE, 3))
+    return image
+
+# Decoded images for paths, in order
+def image_batches(paths, batch_size):
+    import tensorflow as tf
+
+    return (tf.data.Dataset.from_tensor_slices(paths)
+            .map(load_image, num_parallel_calls=tf.data.AUTOTUNE)
+            .batch(batch_size)
+            .prefetch(tf.data.AUTOTUNE))
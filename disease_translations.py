@@ -0,0 +1,616 @@
+# Disease detail texts in the app's other languages, keyed like
+# knowledge_base.DISEASE_DETAILS. Scientific names of pathogens are kept in
+# Latin script.
+DISEASE_DETAILS_TELUGU = {
+    'Apple___Apple_scab': {
+        'symptoms': "ఆకులపై ఆలివ్-ఆకుపచ్చ నుండి గోధుమ రంగు మచ్చలు, పండ్లపై గరుకుగా ఉండే గాయాలు.",
+        'causes': "Venturia inaequalis శిలీంధ్రం.",
+        'reasons_for_cause': "ఆపిల్ స్కాబ్ Venturia inaequalis అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది చల్లని, తడి వాతావరణంలో బాగా పెరుగుతుంది. వసంతకాలంలో రాలిన ఆకుల నుండి బీజాంశాలు విడుదలై కొత్త ఆకులు మరియు పండ్లకు సోకుతాయి.",
+        'precautions': "సంక్రమణ మూలాన్ని తగ్గించడానికి శరదృతువులో రాలిన ఆకులను సేకరించి నాశనం చేయండి. గాలి ప్రసరణను మెరుగుపరచి తేమను తగ్గించడానికి చెట్లను కత్తిరించండి. వసంతకాలంలో ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, కొమ్మల కత్తిరింపు, రాలిన ఆకులను తొలగించడం.",
+        'detailed_info': "ఆపిల్ స్కాబ్ ఆపిల్ మరియు క్రాబ్‌ఆపిల్ చెట్లను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులు మరియు పండ్లకు గణనీయమైన నష్టం కలిగించి, చెట్టు బలాన్ని మరియు దిగుబడిని తగ్గిస్తుంది."
+    },
+    'Apple___Black_rot': {
+        'symptoms': "ఆకులపై గోధుమ రంగు మచ్చలు, కొమ్మలపై పుండ్లు (కాంకర్లు), కుళ్లిపోతున్న పండ్లు.",
+        'causes': "Diplodia seriata శిలీంధ్రం.",
+        'reasons_for_cause': "బ్లాక్ రాట్ Diplodia seriata అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది గాయాలు లేదా సహజ రంధ్రాల ద్వారా చెట్లలోకి ప్రవేశిస్తుంది. ఈ శిలీంధ్రం ఎండిన కలప మరియు సోకిన మొక్క భాగాలలో జీవించగలదు.",
+        'precautions': "కత్తిరింపు లేదా ఇతర పనుల సమయంలో చెట్లకు గాయాలు కాకుండా చూడండి. ఎండిన లేదా వ్యాధి సోకిన కలపను వెంటనే తొలగించండి. గాయాలకు సంక్రమణ రాకుండా శిలీంధ్రనాశకాలను పూయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, కొమ్మల కత్తిరింపు, సోకిన కలపను తొలగించడం.",
+        'detailed_info': "బ్లాక్ రాట్ ఆపిల్, పియర్ మరియు ఇతర పండ్ల చెట్లను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకు మచ్చలు, పుండ్లు మరియు పండ్ల కుళ్లును కలిగించి, పంటకు గణనీయమైన నష్టం చేస్తుంది."
+    },
+    'Apple___Cedar_apple_rust': {
+        'symptoms': "ఆకులపై పసుపు-నారింజ రంగు మచ్చలు, పండ్లపై ఉబ్బిన గాయాలు.",
+        'causes': "Gymnosporangium juniperi-virginianae శిలీంధ్రం.",
+        'reasons_for_cause': "సెడార్ ఆపిల్ రస్ట్ Gymnosporangium juniperi-virginianae అనే శిలీంధ్రం వల్ల వస్తుంది, దీనికి తన జీవిత చక్రం పూర్తి చేయడానికి ఆపిల్ మరియు సెడార్ చెట్లు రెండూ అవసరం. వసంతకాలంలో సెడార్ గడ్డల నుండి బీజాంశాలు విడుదలై ఆపిల్ చెట్లకు సోకుతాయి.",
+        'precautions': "వ్యాధి చక్రాన్ని విచ్ఛిన్నం చేయడానికి ఆపిల్ చెట్ల సమీపంలోని సెడార్ చెట్లను తొలగించండి. బీజాంశాలు విడుదలయ్యే సమయంలో ఆపిల్ చెట్లను రక్షించడానికి శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, సమీపంలోని సెడార్ చెట్లను తొలగించడం.",
+        'detailed_info': "సెడార్ ఆపిల్ రస్ట్ తన జీవిత చక్రం పూర్తి చేయడానికి ఆపిల్ మరియు సెడార్ చెట్లు రెండూ అవసరమయ్యే శిలీంధ్ర వ్యాధి. ఇది ఆపిల్ ఆకులపై పసుపు-నారింజ మచ్చలు మరియు సెడార్ చెట్లపై గడ్డలను కలిగిస్తుంది."
+    },
+    'Apple___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు కత్తిరింపు ద్వారా చెట్టు ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన ఆపిల్ చెట్టులో వ్యాధి లేదా చీడపీడల సంకేతాలు ఉండవు. ఆకులు పచ్చగా, నిగనిగలాడుతూ ఉంటాయి మరియు పండ్లపై మచ్చలు ఉండవు."
+    },
+    'Blueberry___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు కత్తిరింపు ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన బ్లూబెర్రీ మొక్క బలమైన పెరుగుదల, సమృద్ధిగా పండ్ల దిగుబడి కలిగి ఉంటుంది మరియు వ్యాధి లేదా చీడపీడల నష్టం ఉండదు."
+    },
+    'Cherry_(including_sour)___Powdery_mildew': {
+        'symptoms': "ఆకులు మరియు పండ్లపై తెల్లటి పొడి వంటి పెరుగుదల.",
+        'causes': "Podosphaera clandestina శిలీంధ్రం.",
+        'reasons_for_cause': "బూడిద తెగులు Podosphaera clandestina అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది తేమతో కూడిన వాతావరణంలో బాగా పెరుగుతుంది. బీజాంశాలు గాలి ద్వారా వ్యాపించి కొత్త మొక్క భాగాలకు సోకుతాయి.",
+        'precautions': "కత్తిరింపు ద్వారా మరియు మొక్కల మధ్య తగిన దూరం ఉంచడం ద్వారా గాలి ప్రసరణను మెరుగుపరచండి. తేమను పెంచే పైనుండి నీరు పోయడాన్ని నివారించండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, మంచి గాలి ప్రసరణ.",
+        'detailed_info': "బూడిద తెగులు చెర్రీలతో సహా అనేక రకాల మొక్కలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులు, కాండాలు మరియు పండ్లపై తెల్లటి పొడి వంటి పెరుగుదలను కలిగిస్తుంది."
+    },
+    'Cherry_(including_sour)___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు కత్తిరింపు ద్వారా చెట్టు ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన చెర్రీ చెట్టు బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు సమృద్ధిగా నాణ్యమైన పండ్లను కలిగి ఉంటుంది."
+    },
+    'Corn_(maize)___Cercospora_leaf_spot Gray_leaf_spot': {
+        'symptoms': "ఆకులపై బూడిద-గోధుమ రంగు దీర్ఘచతురస్రాకార గాయాలు.",
+        'causes': "Cercospora zeae-maydis శిలీంధ్రం.",
+        'reasons_for_cause': "గ్రే లీఫ్ స్పాట్ Cercospora zeae-maydis అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది పంట అవశేషాలలో జీవిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "మట్టిలో వ్యాధికారకాలు పేరుకుపోకుండా పంట మార్పిడి పాటించండి. వ్యాధి నిరోధక మొక్కజొన్న రకాలను వాడండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, పంట మార్పిడి, వ్యాధి నిరోధక రకాలు.",
+        'detailed_info': "గ్రే లీఫ్ స్పాట్ మొక్కజొన్నను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై బూడిద-గోధుమ గాయాలను కలిగించి, కిరణజన్య సంయోగక్రియను మరియు దిగుబడిని తగ్గిస్తుంది."
+    },
+    'Corn_(maize)___Common_rust_': {
+        'symptoms': "ఆకులపై ఎర్రటి-గోధుమ రంగు పొక్కులు.",
+        'causes': "Puccinia sorghi శిలీంధ్రం.",
+        'reasons_for_cause': "కామన్ రస్ట్ Puccinia sorghi అనే శిలీంధ్రం వల్ల వస్తుంది, దీనికి ప్రత్యామ్నాయ ఆతిథ్య మొక్క అవసరం. బీజాంశాలు గాలి ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "వ్యాధి నిరోధక మొక్కజొన్న రకాలను వాడండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, వ్యాధి నిరోధక రకాలు.",
+        'detailed_info': "కామన్ రస్ట్ మొక్కజొన్నను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులు మరియు కాండాలపై ఎర్రటి-గోధుమ పొక్కులను కలిగించి, దిగుబడిని మరియు గింజల నాణ్యతను తగ్గిస్తుంది."
+    },
+    'Corn_(maize)___Northern_Leaf_Blight': {
+        'symptoms': "ఆకులపై పొడవైన, దీర్ఘవృత్తాకార, బూడిద-ఆకుపచ్చ గాయాలు.",
+        'causes': "Exserohilum turcicum శిలీంధ్రం.",
+        'reasons_for_cause': "నార్తర్న్ లీఫ్ బ్లైట్ Exserohilum turcicum అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది పంట అవశేషాలలో జీవిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "మట్టిలో వ్యాధికారకాలు పేరుకుపోకుండా పంట మార్పిడి పాటించండి. వ్యాధి నిరోధక మొక్కజొన్న రకాలను వాడండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, పంట మార్పిడి, వ్యాధి నిరోధక రకాలు.",
+        'detailed_info': "నార్తర్న్ లీఫ్ బ్లైట్ మొక్కజొన్నను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై పొడవైన, దీర్ఘవృత్తాకార గాయాలను కలిగించి, కిరణజన్య సంయోగక్రియను మరియు దిగుబడిని తగ్గిస్తుంది."
+    },
+    'Corn_(maize)___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు కలుపు నియంత్రణ ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన మొక్కజొన్న మొక్క బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు బాగా అభివృద్ధి చెందిన కంకులను కలిగి ఉంటుంది. దీనికి వ్యాధి లేదా చీడపీడల నష్టం ఉండదు."
+    },
+    'Grape___Black_rot': {
+        'symptoms': "ఆకులపై ఎర్రటి-గోధుమ మచ్చలు, పండ్లపై నల్లని గాయాలు.",
+        'causes': "Guignardia bidwellii శిలీంధ్రం.",
+        'reasons_for_cause': "బ్లాక్ రాట్ Guignardia bidwellii అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది సోకిన మొక్క భాగాలలో జీవిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులు మరియు పండ్లకు సోకుతాయి.",
+        'precautions': "సోకిన మొక్క భాగాలను తొలగించి నాశనం చేయండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, సోకిన మొక్క భాగాలను తొలగించడం.",
+        'detailed_info': "బ్లాక్ రాట్ ద్రాక్షను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై ఎర్రటి-గోధుమ మచ్చలు మరియు నల్లగా ముడుచుకుపోయిన ద్రాక్ష పండ్లను కలిగిస్తుంది."
+    },
+    'Grape___Esca_(Black_Measles)': {
+        'symptoms': "ఆకు మచ్చలు, కలప కుళ్లు, పండ్ల రంగు మారడం.",
+        'causes': "అనేక శిలీంధ్రాల సమూహం.",
+        'reasons_for_cause': "ఎస్కా గాయాల ద్వారా ద్రాక్ష తీగలకు సోకే అనేక శిలీంధ్రాల సమూహం వల్ల వస్తుంది. ఈ శిలీంధ్రాలు ఎండిన కలప మరియు సోకిన మొక్క భాగాలలో జీవించగలవు.",
+        'precautions': "కత్తిరింపు లేదా ఇతర పనుల సమయంలో ద్రాక్ష తీగలకు గాయాలు కాకుండా చూడండి. ఎండిన లేదా వ్యాధి సోకిన కలపను వెంటనే తొలగించండి. గాయాలపై రక్షణ పూతలు పూయండి.",
+        'treatments': "కత్తిరింపు, గాయాల రక్షణ, కాండం శస్త్రచికిత్స.",
+        'detailed_info': "ఎస్కా, బ్లాక్ మీజిల్స్ అని కూడా పిలుస్తారు, ద్రాక్ష తీగలను ప్రభావితం చేసే సంక్లిష్ట శిలీంధ్ర వ్యాధి. ఇది ఆకు మచ్చలు, కలప కుళ్లు మరియు పండ్ల రంగు మారడాన్ని కలిగిస్తుంది."
+    },
+    'Grape___Leaf_blight_(Isariopsis_Leaf_Spot)': {
+        'symptoms': "ఆకులపై చిన్న, గుండ్రని మచ్చలు.",
+        'causes': "Isariopsis clavispora శిలీంధ్రం.",
+        'reasons_for_cause': "ఇసారియోప్సిస్ ఆకు మచ్చ Isariopsis clavispora అనే శిలీంధ్రం వల్ల వస్తుంది. ఈ శిలీంధ్రం రాలిన ఆకులు మరియు సోకిన మొక్క భాగాలలో జీవిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "సోకిన ఆకులను తొలగించి నాశనం చేయండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, సోకిన ఆకులను తొలగించడం.",
+        'detailed_info': "ఇసారియోప్సిస్ ఆకు మచ్చ ద్రాక్షను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై చిన్న, గుండ్రని మచ్చలను కలిగిస్తుంది, దీని వల్ల ఆకులు రాలిపోవచ్చు."
+    },
+    'Grape___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు కత్తిరింపు ద్వారా తీగ ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన ద్రాక్ష తీగ బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు సమృద్ధిగా నాణ్యమైన పండ్లను కలిగి ఉంటుంది."
+    },
+    'Orange___Haunglongbing_(Citrus_greening)': {
+        'symptoms': "ఆకులపై అసమానమైన మచ్చల రంగు మార్పు, వంకర ఆకారపు పండ్లు.",
+        'causes': "Candidatus Liberibacter asiaticus బ్యాక్టీరియా.",
+        'reasons_for_cause': "హువాంగ్‌లాంగ్‌బింగ్ (HLB) Candidatus Liberibacter asiaticus అనే బ్యాక్టీరియా వల్ల వస్తుంది, ఇది సిల్లిడ్ పురుగుల ద్వారా వ్యాపిస్తుంది. ఈ బ్యాక్టీరియా నిమ్మజాతి చెట్ల పోషక నాళాలకు (ఫ్లోయమ్) సోకి పోషకాల సరఫరాను అడ్డుకుంటుంది.",
+        'precautions': "కీటకనాశకాలతో సిల్లిడ్ పురుగుల సంఖ్యను నియంత్రించండి. సోకిన చెట్లను వెంటనే తొలగించండి.",
+        'treatments': "నివారణ లేదు; సిల్లిడ్‌లను నియంత్రించండి, సోకిన చెట్లను తొలగించండి.",
+        'detailed_info': "హువాంగ్‌లాంగ్‌బింగ్ (HLB), సిట్రస్ గ్రీనింగ్ అని కూడా పిలుస్తారు, నిమ్మజాతి చెట్లను ప్రభావితం చేసే వినాశకరమైన బ్యాక్టీరియా వ్యాధి. ఇది ఆకులపై అసమానమైన మచ్చలను మరియు వంకరగా, చేదుగా ఉండే పండ్లను కలిగిస్తుంది."
+    },
+    'Peach___Bacterial_spot': {
+        'symptoms': "ఆకులు మరియు పండ్లపై చిన్న, ముదురు మచ్చలు.",
+        'causes': "Xanthomonas campestris pv. pruni బ్యాక్టీరియా.",
+        'reasons_for_cause': "బ్యాక్టీరియల్ స్పాట్ Xanthomonas campestris pv. pruni అనే బ్యాక్టీరియా వల్ల వస్తుంది, ఇది గాయాలు లేదా సహజ రంధ్రాల ద్వారా చెట్లలోకి ప్రవేశిస్తుంది. ఈ బ్యాక్టీరియా వెచ్చని, తడి వాతావరణంలో బాగా పెరుగుతుంది.",
+        'precautions': "కత్తిరింపు లేదా ఇతర పనుల సమయంలో చెట్లకు గాయాలు కాకుండా చూడండి. ముందుజాగ్రత్తగా రాగి ఆధారిత శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "రాగి ఆధారిత శిలీంధ్రనాశకాలు, కొమ్మల కత్తిరింపు.",
+        'detailed_info': "బ్యాక్టీరియల్ స్పాట్ పీచ్, ప్లమ్ మరియు ఇతర టెంకగల పండ్ల చెట్లను ప్రభావితం చేసే బ్యాక్టీరియా వ్యాధి. ఇది ఆకులు మరియు పండ్లపై చిన్న, ముదురు మచ్చలను కలిగిస్తుంది."
+    },
+    'Peach___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు కత్తిరింపు ద్వారా చెట్టు ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన పీచ్ చెట్టు బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు సమృద్ధిగా నాణ్యమైన పండ్లను కలిగి ఉంటుంది."
+    },
+    'Pepper,_bell___Bacterial_spot': {
+        'symptoms': "ఆకులు మరియు పండ్లపై ముదురు, నీటితో తడిసినట్లు కనిపించే మచ్చలు.",
+        'causes': "Xanthomonas vesicatoria బ్యాక్టీరియా.",
+        'reasons_for_cause': "బ్యాక్టీరియల్ స్పాట్ Xanthomonas vesicatoria అనే బ్యాక్టీరియా వల్ల వస్తుంది, ఇది చిమ్మే నీరు మరియు కలుషిత విత్తనాల ద్వారా వ్యాపిస్తుంది. ఈ బ్యాక్టీరియా వెచ్చని, తేమతో కూడిన వాతావరణంలో బాగా పెరుగుతుంది.",
+        'precautions': "వ్యాధి రహిత విత్తనాలను వాడండి. పైనుండి నీరు పోయడాన్ని నివారించండి. ముందుజాగ్రత్తగా రాగి ఆధారిత శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "రాగి ఆధారిత శిలీంధ్రనాశకాలు, సోకిన మొక్కలను తొలగించడం.",
+        'detailed_info': "బ్యాక్టీరియల్ స్పాట్ మిరప మరియు టమాటాలను ప్రభావితం చేసే బ్యాక్టీరియా వ్యాధి. ఇది ఆకులు మరియు పండ్లపై ముదురు, నీటితో తడిసినట్లు కనిపించే మచ్చలను కలిగిస్తుంది."
+    },
+    'Pepper,_bell___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు చీడపీడల నియంత్రణ ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన బెల్ పెప్పర్ (క్యాప్సికం) మొక్క బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు సమృద్ధిగా నాణ్యమైన పండ్లను కలిగి ఉంటుంది."
+    },
+    'Potato___Early_blight': {
+        'symptoms': "ఆకులపై ముదురు, ఏకకేంద్ర వలయాల మచ్చలు.",
+        'causes': "Alternaria solani శిలీంధ్రం.",
+        'reasons_for_cause': "ఎర్లీ బ్లైట్ Alternaria solani అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది పంట అవశేషాలలో జీవిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "మట్టిలో వ్యాధికారకాలు పేరుకుపోకుండా పంట మార్పిడి పాటించండి. వ్యాధి రహిత విత్తన బంగాళాదుంపలను వాడండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, పంట మార్పిడి.",
+        'detailed_info': "ఎర్లీ బ్లైట్ బంగాళాదుంపలు మరియు టమాటాలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై ముదురు, ఏకకేంద్ర వలయాల మచ్చలను కలిగిస్తుంది."
+    },
+    'Potato___Late_blight': {
+        'symptoms': "ఆకులపై నీటితో తడిసినట్లు కనిపించే గాయాలు, తెల్లటి బూజు.",
+        'causes': "Phytophthora infestans ఊమైసీట్.",
+        'reasons_for_cause': "లేట్ బ్లైట్ Phytophthora infestans అనే ఊమైసీట్ వల్ల వస్తుంది, ఇది చల్లని, తడి వాతావరణంలో వేగంగా వ్యాపిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులు మరియు దుంపలకు సోకుతాయి.",
+        'precautions': "వ్యాధి రహిత విత్తన బంగాళాదుంపలను వాడండి. పైనుండి నీరు పోయడాన్ని నివారించండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, సోకిన మొక్కలను తొలగించడం.",
+        'detailed_info': "లేట్ బ్లైట్ బంగాళాదుంపలు మరియు టమాటాలను ప్రభావితం చేసే వినాశకరమైన వ్యాధి. ఇది ఆకులపై నీటితో తడిసినట్లు కనిపించే గాయాలు మరియు తెల్లటి బూజును కలిగిస్తుంది."
+    },
+    'Potato___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు చీడపీడల నియంత్రణ ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన బంగాళాదుంప మొక్క బలమైన పెరుగుదల మరియు సమృద్ధిగా దుంపల ఉత్పత్తిని కలిగి ఉంటుంది. దీనికి వ్యాధి లేదా చీడపీడల నష్టం ఉండదు."
+    },
+    'Raspberry___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు చీడపీడల నియంత్రణ ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన రాస్ప్‌బెర్రీ మొక్క బలమైన పెరుగుదల, సమృద్ధిగా పండ్ల దిగుబడి కలిగి ఉంటుంది మరియు వ్యాధి లేదా చీడపీడల నష్టం ఉండదు."
+    },
+    'Soybean___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు కలుపు నియంత్రణ ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన సోయాబీన్ మొక్క బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు సమృద్ధిగా కాయల ఉత్పత్తిని కలిగి ఉంటుంది. దీనికి వ్యాధి లేదా చీడపీడల నష్టం ఉండదు."
+    },
+    'Squash___Powdery_mildew': {
+        'symptoms': "ఆకులు మరియు కాండాలపై తెల్లటి పొడి వంటి పెరుగుదల.",
+        'causes': "శిలీంధ్రాలు (వివిధ జాతులు).",
+        'reasons_for_cause': "బూడిద తెగులు తేమతో కూడిన వాతావరణంలో బాగా పెరిగే వివిధ జాతుల శిలీంధ్రాల వల్ల వస్తుంది. బీజాంశాలు గాలి ద్వారా వ్యాపించి కొత్త మొక్క భాగాలకు సోకుతాయి.",
+        'precautions': "కత్తిరింపు ద్వారా మరియు మొక్కల మధ్య తగిన దూరం ఉంచడం ద్వారా గాలి ప్రసరణను మెరుగుపరచండి. తేమను పెంచే పైనుండి నీరు పోయడాన్ని నివారించండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, మంచి గాలి ప్రసరణ.",
+        'detailed_info': "బూడిద తెగులు గుమ్మడి జాతి మొక్కలతో సహా అనేక రకాల మొక్కలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులు మరియు కాండాలపై తెల్లటి పొడి వంటి పెరుగుదలను కలిగిస్తుంది."
+    },
+    'Strawberry___Leaf_scorch': {
+        'symptoms': "ఆకులపై చిన్న ఊదా రంగు మచ్చలు, అవి కలిసిపోయి ముదురు రంగులోకి మారతాయి.",
+        'causes': "Diplocarpon earlianum శిలీంధ్రం.",
+        'reasons_for_cause': "లీఫ్ స్కార్చ్ Diplocarpon earlianum అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది సోకిన మొక్క భాగాలలో జీవిస్తుంది. బీజాంశాలు చిమ్మే నీటి ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "సోకిన ఆకులను తొలగించి నాశనం చేయండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, సోకిన ఆకులను తొలగించడం.",
+        'detailed_info': "లీఫ్ స్కార్చ్ స్ట్రాబెర్రీలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై చిన్న ఊదా మచ్చలను కలిగిస్తుంది, అవి కలిసిపోయి ముదురు రంగులోకి మారతాయి."
+    },
+    'Strawberry___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు చీడపీడల నియంత్రణ ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన స్ట్రాబెర్రీ మొక్క బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు సమృద్ధిగా నాణ్యమైన పండ్లను కలిగి ఉంటుంది."
+    },
+    'Tomato___Bacterial_spot': {
+        'symptoms': "ఆకులు మరియు పండ్లపై చిన్న, ముదురు మచ్చలు.",
+        'causes': "Xanthomonas vesicatoria బ్యాక్టీరియా.",
+        'reasons_for_cause': "బ్యాక్టీరియల్ స్పాట్ Xanthomonas vesicatoria అనే బ్యాక్టీరియా వల్ల వస్తుంది, ఇది చిమ్మే నీరు మరియు కలుషిత విత్తనాల ద్వారా వ్యాపిస్తుంది. ఈ బ్యాక్టీరియా వెచ్చని, తేమతో కూడిన వాతావరణంలో బాగా పెరుగుతుంది.",
+        'precautions': "వ్యాధి రహిత విత్తనాలను వాడండి. పైనుండి నీరు పోయడాన్ని నివారించండి. ముందుజాగ్రత్తగా రాగి ఆధారిత శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "రాగి ఆధారిత శిలీంధ్రనాశకాలు, సోకిన మొక్కలను తొలగించడం.",
+        'detailed_info': "బ్యాక్టీరియల్ స్పాట్ టమాటా మరియు మిరపను ప్రభావితం చేసే బ్యాక్టీరియా వ్యాధి. ఇది ఆకులు మరియు పండ్లపై చిన్న, ముదురు మచ్చలను కలిగిస్తుంది."
+    },
+    'Tomato___Early_blight': {
+        'symptoms': "ఆకులపై ముదురు, ఏకకేంద్ర వలయాల మచ్చలు.",
+        'causes': "Alternaria solani శిలీంధ్రం.",
+        'reasons_for_cause': "ఎర్లీ బ్లైట్ Alternaria solani అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది పంట అవశేషాలలో జీవిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "మట్టిలో వ్యాధికారకాలు పేరుకుపోకుండా పంట మార్పిడి పాటించండి. వ్యాధి రహిత నారును వాడండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, పంట మార్పిడి.",
+        'detailed_info': "ఎర్లీ బ్లైట్ టమాటాలు మరియు బంగాళాదుంపలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై ముదురు, ఏకకేంద్ర వలయాల మచ్చలను కలిగిస్తుంది."
+    },
+    'Tomato___Late_blight': {
+        'symptoms': "ఆకులపై నీటితో తడిసినట్లు కనిపించే గాయాలు, తెల్లటి బూజు.",
+        'causes': "Phytophthora infestans ఊమైసీట్.",
+        'reasons_for_cause': "లేట్ బ్లైట్ Phytophthora infestans అనే ఊమైసీట్ వల్ల వస్తుంది, ఇది చల్లని, తడి వాతావరణంలో వేగంగా వ్యాపిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులు మరియు పండ్లకు సోకుతాయి.",
+        'precautions': "వ్యాధి రహిత నారును వాడండి. పైనుండి నీరు పోయడాన్ని నివారించండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, సోకిన మొక్కలను తొలగించడం.",
+        'detailed_info': "లేట్ బ్లైట్ టమాటాలు మరియు బంగాళాదుంపలను ప్రభావితం చేసే వినాశకరమైన వ్యాధి. ఇది ఆకులపై నీటితో తడిసినట్లు కనిపించే గాయాలు మరియు తెల్లటి బూజును కలిగిస్తుంది."
+    },
+    'Tomato___Leaf_Mold': {
+        'symptoms': "ఆకు పైభాగంలో లేత ఆకుపచ్చ లేదా పసుపు మచ్చలు, అడుగు భాగంలో బూడిద-ఊదా రంగు బూజు.",
+        'causes': "Passalora fulva శిలీంధ్రం.",
+        'reasons_for_cause': "లీఫ్ మోల్డ్ Passalora fulva అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది తేమతో కూడిన వాతావరణంలో బాగా పెరుగుతుంది. బీజాంశాలు గాలి ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "కత్తిరింపు ద్వారా మరియు మొక్కల మధ్య తగిన దూరం ఉంచడం ద్వారా గాలి ప్రసరణను మెరుగుపరచండి. తేమను పెంచే పైనుండి నీరు పోయడాన్ని నివారించండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, మంచి గాలి ప్రసరణ.",
+        'detailed_info': "లీఫ్ మోల్డ్ టమాటాలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకు పైభాగంలో లేత ఆకుపచ్చ లేదా పసుపు మచ్చలను మరియు అడుగు భాగంలో బూడిద-ఊదా రంగు బూజును కలిగిస్తుంది."
+    },
+    'Tomato___Septoria_leaf_spot': {
+        'symptoms': "ఆకులపై ముదురు అంచులు మరియు లేత మధ్యభాగం కలిగిన చిన్న, గుండ్రని మచ్చలు.",
+        'causes': "Septoria lycopersici శిలీంధ్రం.",
+        'reasons_for_cause': "సెప్టోరియా ఆకు మచ్చ Septoria lycopersici అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది పంట అవశేషాలలో జీవిస్తుంది. బీజాంశాలు చిమ్మే నీటి ద్వారా వ్యాపించి కొత్త ఆకులకు సోకుతాయి.",
+        'precautions': "మట్టిలో వ్యాధికారకాలు పేరుకుపోకుండా పంట మార్పిడి పాటించండి. సోకిన ఆకులను తొలగించి నాశనం చేయండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, సోకిన ఆకులను తొలగించడం, పంట మార్పిడి.",
+        'detailed_info': "సెప్టోరియా ఆకు మచ్చ టమాటాలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులపై ముదురు అంచులు మరియు లేత మధ్యభాగం కలిగిన చిన్న, గుండ్రని మచ్చలను కలిగిస్తుంది."
+    },
+    'Tomato___Spider_mites Two-spotted_spider_mite': {
+        'symptoms': "ఆకులపై సన్నని గూడు వంటి దారాలు, ఆకులు పసుపుపచ్చగా మారడం లేదా చుక్కలుగా మచ్చలు.",
+        'causes': "సాలీడు నల్లి (Tetranychus urticae).",
+        'reasons_for_cause': "సాలీడు నల్లులు వేడి, పొడి వాతావరణంలో బాగా పెరిగే అతి చిన్న చీడలు. ఇవి మొక్క రసాన్ని పీల్చి ఆకులకు నష్టం కలిగిస్తాయి.",
+        'precautions': "మట్టిలో తగినంత తేమను ఉంచండి. ప్రత్యామ్నాయ ఆతిథ్య మొక్కలుగా పనిచేసే కలుపు మొక్కలను నియంత్రించండి. పరభక్షక నల్లుల వంటి ఉపయోగకరమైన కీటకాలను ప్రవేశపెట్టండి.",
+        'treatments': "కీటకనాశకాలు, నల్లినాశకాలు, జీవ నియంత్రణ.",
+        'detailed_info': "సాలీడు నల్లులు టమాటాలను ఆశించే అతి చిన్న చీడలు. ఇవి ఆకులపై సన్నని గూడు వంటి దారాలను మరియు ఆకులు పసుపుపచ్చగా మారడం లేదా చుక్కల మచ్చలను కలిగిస్తాయి."
+    },
+    'Tomato___Target_Spot': {
+        'symptoms': "ఆకులు మరియు పండ్లపై ఏకకేంద్ర వలయాలు కలిగిన చిన్న, గుండ్రని మచ్చలు.",
+        'causes': "Corynespora cassiicola శిలీంధ్రం.",
+        'reasons_for_cause': "టార్గెట్ స్పాట్ Corynespora cassiicola అనే శిలీంధ్రం వల్ల వస్తుంది, ఇది పంట అవశేషాలలో జీవిస్తుంది. బీజాంశాలు గాలి మరియు వర్షం ద్వారా వ్యాపించి కొత్త ఆకులు మరియు పండ్లకు సోకుతాయి.",
+        'precautions': "మట్టిలో వ్యాధికారకాలు పేరుకుపోకుండా పంట మార్పిడి పాటించండి. ముందుజాగ్రత్తగా శిలీంధ్రనాశకాలను పిచికారీ చేయండి.",
+        'treatments': "శిలీంధ్రనాశకాలు, పంట మార్పిడి.",
+        'detailed_info': "టార్గెట్ స్పాట్ టమాటాలను ప్రభావితం చేసే శిలీంధ్ర వ్యాధి. ఇది ఆకులు మరియు పండ్లపై ఏకకేంద్ర వలయాలు కలిగిన చిన్న, గుండ్రని మచ్చలను కలిగిస్తుంది."
+    },
+    'Tomato___Tomato_Yellow_Leaf_Curl_Virus': {
+        'symptoms': "ఆకులు పసుపుపచ్చగా మారి ముడుచుకుపోవడం, పెరుగుదల కుంటుపడటం.",
+        'causes': "టమాటా పసుపు ఆకు ముడత వైరస్ (TYLCV).",
+        'reasons_for_cause': "టమాటా పసుపు ఆకు ముడత వైరస్ (TYLCV) తెల్లదోమల ద్వారా వ్యాపిస్తుంది. ఈ వైరస్ టమాటా మొక్కలకు సోకి, ఆకులు పసుపుపచ్చగా మారి ముడుచుకుపోవడాన్ని మరియు పెరుగుదల కుంటుపడటాన్ని కలిగిస్తుంది.",
+        'precautions': "కీటకనాశకాలతో తెల్లదోమల సంఖ్యను నియంత్రించండి. వ్యాధి నిరోధక టమాటా రకాలను వాడండి. సోకిన మొక్కలను వెంటనే తొలగించండి.",
+        'treatments': "తెల్లదోమల నియంత్రణకు కీటకనాశకాలు, వ్యాధి నిరోధక రకాలు.",
+        'detailed_info': "టమాటా పసుపు ఆకు ముడత వైరస్ (TYLCV) టమాటాలను ప్రభావితం చేసే వైరస్ వ్యాధి. ఇది ఆకులు పసుపుపచ్చగా మారి ముడుచుకుపోవడాన్ని మరియు పెరుగుదల కుంటుపడటాన్ని కలిగిస్తుంది."
+    },
+    'Tomato___Tomato_mosaic_virus': {
+        'symptoms': "ఆకులపై మచ్చల రంగు మార్పు (మొజాయిక్), కుంటుపడిన పెరుగుదల, తగ్గిన పండ్ల దిగుబడి.",
+        'causes': "టమాటా మొజాయిక్ వైరస్ (ToMV).",
+        'reasons_for_cause': "టమాటా మొజాయిక్ వైరస్ (ToMV) స్పర్శ ద్వారా వ్యాపిస్తుంది. ఈ వైరస్ టమాటా మొక్కలకు సోకి, ఆకులపై మొజాయిక్ మచ్చలు, కుంటుపడిన పెరుగుదల మరియు తగ్గిన పండ్ల దిగుబడిని కలిగిస్తుంది.",
+        'precautions': "వ్యాధి రహిత నారును వాడండి. టమాటా మొక్కలను తాకిన తర్వాత చేతులు మరియు పరికరాలను బాగా కడగండి. సోకిన మొక్కలను వెంటనే తొలగించండి.",
+        'treatments': "సోకిన మొక్కలను తొలగించడం, పరిశుభ్రత.",
+        'detailed_info': "టమాటా మొజాయిక్ వైరస్ (ToMV) టమాటాలను ప్రభావితం చేసే వైరస్ వ్యాధి. ఇది ఆకులపై మొజాయిక్ మచ్చలు, కుంటుపడిన పెరుగుదల మరియు తగ్గిన పండ్ల దిగుబడిని కలిగిస్తుంది."
+    },
+    'Tomato___healthy': {
+        'symptoms': "కనిపించే లక్షణాలు లేవు.",
+        'causes': "వర్తించదు",
+        'reasons_for_cause': "వర్తించదు",
+        'precautions': "సరైన నీటిపారుదల, ఎరువులు మరియు చీడపీడల నియంత్రణ ద్వారా మొక్క ఆరోగ్యాన్ని కాపాడండి.",
+        'treatments': "వర్తించదు",
+        'detailed_info': "ఆరోగ్యకరమైన టమాటా మొక్క బలమైన పెరుగుదల, ముదురు ఆకుపచ్చ ఆకులు మరియు సమృద్ధిగా నాణ్యమైన పండ్లను కలిగి ఉంటుంది."
+    }
+}
+
+DISEASE_DETAILS_TAMIL = {
+    'Apple___Apple_scab': {
+        'symptoms': "இலைகளில் ஆலிவ்-பச்சை முதல் பழுப்பு நிறப் புள்ளிகள், பழங்களில் சொரசொரப்பான புண்கள்.",
+        'causes': "Venturia inaequalis பூஞ்சை.",
+        'reasons_for_cause': "ஆப்பிள் ஸ்கேப் Venturia inaequalis என்ற பூஞ்சையால் ஏற்படுகிறது, இது குளிர்ந்த, ஈரமான சூழலில் நன்கு வளரும். வசந்த காலத்தில் உதிர்ந்த இலைகளிலிருந்து வித்துகள் வெளியேறி புதிய இலைகளையும் பழங்களையும் தாக்குகின்றன.",
+        'precautions': "தொற்றின் மூலத்தைக் குறைக்க இலையுதிர் காலத்தில் உதிர்ந்த இலைகளைச் சேகரித்து அழிக்கவும். காற்றோட்டத்தை மேம்படுத்தி ஈரப்பதத்தைக் குறைக்க மரங்களைக் கவாத்து செய்யவும். வசந்த காலத்தில் முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், கவாத்து, உதிர்ந்த இலைகளை அகற்றுதல்.",
+        'detailed_info': "ஆப்பிள் ஸ்கேப் என்பது ஆப்பிள் மற்றும் காட்டு ஆப்பிள் மரங்களைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளுக்கும் பழங்களுக்கும் கணிசமான சேதத்தை ஏற்படுத்தி, மரத்தின் வீரியத்தையும் விளைச்சலையும் குறைக்கும்."
+    },
+    'Apple___Black_rot': {
+        'symptoms': "இலைகளில் பழுப்பு நிறப் புள்ளிகள், கிளைகளில் புற்றுப் புண்கள், அழுகும் பழங்கள்.",
+        'causes': "Diplodia seriata பூஞ்சை.",
+        'reasons_for_cause': "கருப்பு அழுகல் Diplodia seriata என்ற பூஞ்சையால் ஏற்படுகிறது, இது காயங்கள் அல்லது இயற்கையான துளைகள் வழியாக மரங்களுக்குள் நுழைகிறது. இந்தப் பூஞ்சை காய்ந்த மரப்பகுதிகளிலும் பாதிக்கப்பட்ட தாவரப் பகுதிகளிலும் உயிர்வாழும்.",
+        'precautions': "கவாத்து அல்லது பிற பணிகளின் போது மரங்களில் காயம் ஏற்படுவதைத் தவிர்க்கவும். காய்ந்த அல்லது நோயுற்ற மரப்பகுதிகளை உடனே அகற்றவும். காயங்களைத் தொற்றிலிருந்து பாதுகாக்க பூஞ்சைக்கொல்லிகளைப் பூசவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், கவாத்து, பாதிக்கப்பட்ட மரப்பகுதிகளை அகற்றுதல்.",
+        'detailed_info': "கருப்பு அழுகல் என்பது ஆப்பிள், பேரிக்காய் மற்றும் பிற பழ மரங்களைப் பாதிக்கும் பூஞ்சை நோய். இது இலைப் புள்ளிகள், புற்றுப் புண்கள் மற்றும் பழ அழுகலை ஏற்படுத்தி, கணிசமான பயிர் இழப்புக்கு வழிவகுக்கும்."
+    },
+    'Apple___Cedar_apple_rust': {
+        'symptoms': "இலைகளில் மஞ்சள்-ஆரஞ்சு நிறப் புள்ளிகள், பழங்களில் உயர்ந்த புண்கள்.",
+        'causes': "Gymnosporangium juniperi-virginianae பூஞ்சை.",
+        'reasons_for_cause': "சீடார் ஆப்பிள் துரு Gymnosporangium juniperi-virginianae என்ற பூஞ்சையால் ஏற்படுகிறது, இது தன் வாழ்க்கைச் சுழற்சியை முடிக்க ஆப்பிள் மற்றும் சீடார் மரங்கள் இரண்டும் தேவை. வசந்த காலத்தில் சீடார் முடிச்சுகளிலிருந்து வித்துகள் வெளியேறி ஆப்பிள் மரங்களைத் தாக்குகின்றன.",
+        'precautions': "நோய்ச் சுழற்சியை உடைக்க ஆப்பிள் மரங்களுக்கு அருகிலுள்ள சீடார் மரங்களை அகற்றவும். வித்துகள் வெளியாகும் காலத்தில் ஆப்பிள் மரங்களைப் பாதுகாக்க பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், அருகிலுள்ள சீடார் மரங்களை அகற்றுதல்.",
+        'detailed_info': "சீடார் ஆப்பிள் துரு என்பது தன் வாழ்க்கைச் சுழற்சியை முடிக்க ஆப்பிள் மற்றும் சீடார் மரங்கள் இரண்டும் தேவைப்படும் பூஞ்சை நோய். இது ஆப்பிள் இலைகளில் மஞ்சள்-ஆரஞ்சுப் புள்ளிகளையும் சீடார் மரங்களில் முடிச்சுகளையும் ஏற்படுத்துகிறது."
+    },
+    'Apple___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் கவாத்து மூலம் மரத்தின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான ஆப்பிள் மரத்தில் நோய் அல்லது பூச்சித் தாக்குதலின் அறிகுறிகள் இருக்காது. இலைகள் பச்சையாகவும் பொலிவாகவும் இருக்கும், பழங்களில் கறைகள் இருக்காது."
+    },
+    'Blueberry___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் கவாத்து மூலம் செடியின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான புளூபெர்ரி செடி வீரியமான வளர்ச்சி, ஏராளமான பழ உற்பத்தி ஆகியவற்றைக் கொண்டிருக்கும்; நோய் அல்லது பூச்சிச் சேதம் இருக்காது."
+    },
+    'Cherry_(including_sour)___Powdery_mildew': {
+        'symptoms': "இலைகளிலும் பழங்களிலும் வெள்ளைப் பொடி போன்ற வளர்ச்சி.",
+        'causes': "Podosphaera clandestina பூஞ்சை.",
+        'reasons_for_cause': "சாம்பல் நோய் Podosphaera clandestina என்ற பூஞ்சையால் ஏற்படுகிறது, இது ஈரப்பதமான சூழலில் நன்கு வளரும். வித்துகள் காற்றின் மூலம் பரவி புதிய தாவரத் திசுக்களைத் தாக்குகின்றன.",
+        'precautions': "கவாத்து செய்தும் செடிகளுக்கு இடையே போதிய இடைவெளி விட்டும் காற்றோட்டத்தை மேம்படுத்தவும். ஈரப்பதத்தை அதிகரிக்கும் மேல்நீர்ப் பாசனத்தைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், நல்ல காற்றோட்டம்.",
+        'detailed_info': "சாம்பல் நோய் என்பது செர்ரி உட்படப் பல வகையான தாவரங்களைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகள், தண்டுகள் மற்றும் பழங்களில் வெள்ளைப் பொடி போன்ற வளர்ச்சியை ஏற்படுத்துகிறது."
+    },
+    'Cherry_(including_sour)___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் கவாத்து மூலம் மரத்தின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான செர்ரி மரம் வலுவான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் ஏராளமான தரமான பழங்களைக் கொண்டிருக்கும்."
+    },
+    'Corn_(maize)___Cercospora_leaf_spot Gray_leaf_spot': {
+        'symptoms': "இலைகளில் சாம்பல்-பழுப்பு நிற செவ்வக வடிவப் புண்கள்.",
+        'causes': "Cercospora zeae-maydis பூஞ்சை.",
+        'reasons_for_cause': "சாம்பல் இலைப்புள்ளி Cercospora zeae-maydis என்ற பூஞ்சையால் ஏற்படுகிறது, இது பயிர்க் கழிவுகளில் உயிர்வாழும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "மண்ணில் நோய்க்காரணிகள் பெருகுவதைக் குறைக்க பயிர்ச் சுழற்சியைப் பின்பற்றவும். நோய் எதிர்ப்புத் திறன் கொண்ட மக்காச்சோள ரகங்களைப் பயன்படுத்தவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பயிர்ச் சுழற்சி, நோய் எதிர்ப்பு ரகங்கள்.",
+        'detailed_info': "சாம்பல் இலைப்புள்ளி என்பது மக்காச்சோளத்தைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் சாம்பல்-பழுப்புப் புண்களை ஏற்படுத்தி, ஒளிச்சேர்க்கையையும் விளைச்சலையும் குறைக்கும்."
+    },
+    'Corn_(maize)___Common_rust_': {
+        'symptoms': "இலைகளில் சிவப்பு-பழுப்பு நிறக் கொப்புளங்கள்.",
+        'causes': "Puccinia sorghi பூஞ்சை.",
+        'reasons_for_cause': "பொதுத் துரு நோய் Puccinia sorghi என்ற பூஞ்சையால் ஏற்படுகிறது, இதற்கு ஒரு மாற்று ஓம்புயிர் தாவரம் தேவை. வித்துகள் காற்றின் மூலம் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "நோய் எதிர்ப்புத் திறன் கொண்ட மக்காச்சோள ரகங்களைப் பயன்படுத்தவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், நோய் எதிர்ப்பு ரகங்கள்.",
+        'detailed_info': "பொதுத் துரு நோய் என்பது மக்காச்சோளத்தைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளிலும் தண்டுகளிலும் சிவப்பு-பழுப்புக் கொப்புளங்களை ஏற்படுத்தி, விளைச்சலையும் தானியத் தரத்தையும் குறைக்கும்."
+    },
+    'Corn_(maize)___Northern_Leaf_Blight': {
+        'symptoms': "இலைகளில் நீண்ட, நீள்வட்ட, சாம்பல்-பச்சை நிறப் புண்கள்.",
+        'causes': "Exserohilum turcicum பூஞ்சை.",
+        'reasons_for_cause': "வடக்கு இலைக் கருகல் Exserohilum turcicum என்ற பூஞ்சையால் ஏற்படுகிறது, இது பயிர்க் கழிவுகளில் உயிர்வாழும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "மண்ணில் நோய்க்காரணிகள் பெருகுவதைக் குறைக்க பயிர்ச் சுழற்சியைப் பின்பற்றவும். நோய் எதிர்ப்புத் திறன் கொண்ட மக்காச்சோள ரகங்களைப் பயன்படுத்தவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பயிர்ச் சுழற்சி, நோய் எதிர்ப்பு ரகங்கள்.",
+        'detailed_info': "வடக்கு இலைக் கருகல் என்பது மக்காச்சோளத்தைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் நீண்ட, நீள்வட்டப் புண்களை ஏற்படுத்தி, ஒளிச்சேர்க்கையையும் விளைச்சலையும் குறைக்கும்."
+    },
+    'Corn_(maize)___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் களைக் கட்டுப்பாடு மூலம் பயிரின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான மக்காச்சோளப் பயிர் வீரியமான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் நன்கு வளர்ந்த கதிர்களைக் கொண்டிருக்கும். இதில் நோய் அல்லது பூச்சிச் சேதம் இருக்காது."
+    },
+    'Grape___Black_rot': {
+        'symptoms': "இலைகளில் சிவப்பு-பழுப்புப் புள்ளிகள், பழங்களில் கருப்புப் புண்கள்.",
+        'causes': "Guignardia bidwellii பூஞ்சை.",
+        'reasons_for_cause': "கருப்பு அழுகல் Guignardia bidwellii என்ற பூஞ்சையால் ஏற்படுகிறது, இது பாதிக்கப்பட்ட தாவரப் பகுதிகளில் உயிர்வாழும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளையும் பழங்களையும் தாக்குகின்றன.",
+        'precautions': "பாதிக்கப்பட்ட தாவரப் பகுதிகளை அகற்றி அழிக்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட தாவரப் பகுதிகளை அகற்றுதல்.",
+        'detailed_info': "கருப்பு அழுகல் என்பது திராட்சையைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் சிவப்பு-பழுப்புப் புள்ளிகளையும் கருத்துச் சுருங்கிய திராட்சைப் பழங்களையும் ஏற்படுத்துகிறது."
+    },
+    'Grape___Esca_(Black_Measles)': {
+        'symptoms': "இலைப் புள்ளிகள், மரப்பகுதி அழுகல், பழங்களின் நிறமாற்றம்.",
+        'causes': "பல பூஞ்சைகளின் தொகுப்பு.",
+        'reasons_for_cause': "எஸ்கா நோய் காயங்கள் வழியாகத் திராட்சைக் கொடிகளைத் தாக்கும் பல பூஞ்சைகளின் தொகுப்பால் ஏற்படுகிறது. இந்தப் பூஞ்சைகள் காய்ந்த மரப்பகுதிகளிலும் பாதிக்கப்பட்ட தாவரப் பகுதிகளிலும் உயிர்வாழும்.",
+        'precautions': "கவாத்து அல்லது பிற பணிகளின் போது திராட்சைக் கொடிகளில் காயம் ஏற்படுவதைத் தவிர்க்கவும். காய்ந்த அல்லது நோயுற்ற மரப்பகுதிகளை உடனே அகற்றவும். காயங்களில் பாதுகாப்புப் பூச்சுகளைப் பூசவும்.",
+        'treatments': "கவாத்து, காயப் பாதுகாப்பு, அடிமர அறுவை சிகிச்சை.",
+        'detailed_info': "எஸ்கா, கருப்புத் தட்டம்மை என்றும் அழைக்கப்படுகிறது, திராட்சைக் கொடிகளைப் பாதிக்கும் ஒரு சிக்கலான பூஞ்சை நோய். இது இலைப் புள்ளிகள், மரப்பகுதி அழுகல் மற்றும் பழங்களின் நிறமாற்றத்தை ஏற்படுத்தும்."
+    },
+    'Grape___Leaf_blight_(Isariopsis_Leaf_Spot)': {
+        'symptoms': "இலைகளில் சிறிய, வட்டமான புள்ளிகள்.",
+        'causes': "Isariopsis clavispora பூஞ்சை.",
+        'reasons_for_cause': "இசாரியோப்சிஸ் இலைப்புள்ளி Isariopsis clavispora என்ற பூஞ்சையால் ஏற்படுகிறது. இந்தப் பூஞ்சை உதிர்ந்த இலைகளிலும் பாதிக்கப்பட்ட தாவரப் பகுதிகளிலும் உயிர்வாழும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "பாதிக்கப்பட்ட இலைகளை அகற்றி அழிக்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட இலைகளை அகற்றுதல்.",
+        'detailed_info': "இசாரியோப்சிஸ் இலைப்புள்ளி என்பது திராட்சையைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் சிறிய, வட்டமான புள்ளிகளை ஏற்படுத்துகிறது, இதனால் இலைகள் உதிரக்கூடும்."
+    },
+    'Grape___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் கவாத்து மூலம் கொடியின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான திராட்சைக் கொடி வலுவான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் ஏராளமான தரமான பழங்களைக் கொண்டிருக்கும்."
+    },
+    'Orange___Haunglongbing_(Citrus_greening)': {
+        'symptoms': "இலைகளில் சீரற்ற திட்டுத் திட்டான நிறமாற்றம், சமச்சீரற்ற பழங்கள்.",
+        'causes': "Candidatus Liberibacter asiaticus பாக்டீரியா.",
+        'reasons_for_cause': "ஹுவாங்லாங்பிங் (HLB) Candidatus Liberibacter asiaticus என்ற பாக்டீரியாவால் ஏற்படுகிறது, இது சில்லிட் பூச்சிகளால் பரப்பப்படுகிறது. இந்தப் பாக்டீரியா எலுமிச்சை வகை மரங்களின் உணவுக்கடத்தும் திசுவைத் (புளோயம்) தாக்கி ஊட்டச்சத்துக் கடத்தலைத் தடுக்கிறது.",
+        'precautions': "பூச்சிக்கொல்லிகள் மூலம் சில்லிட் பூச்சிகளின் எண்ணிக்கையைக் கட்டுப்படுத்தவும். பாதிக்கப்பட்ட மரங்களை உடனே அகற்றவும்.",
+        'treatments': "குணப்படுத்த முடியாது; சில்லிட் பூச்சிகளைக் கட்டுப்படுத்தவும், பாதிக்கப்பட்ட மரங்களை அகற்றவும்.",
+        'detailed_info': "ஹுவாங்லாங்பிங் (HLB), சிட்ரஸ் பசுமை நோய் என்றும் அழைக்கப்படுகிறது, எலுமிச்சை வகை மரங்களைப் பாதிக்கும் பேரழிவு தரும் பாக்டீரியா நோய். இது இலைகளில் சீரற்ற திட்டுகளையும் சமச்சீரற்ற, கசப்பான பழங்களையும் ஏற்படுத்துகிறது."
+    },
+    'Peach___Bacterial_spot': {
+        'symptoms': "இலைகளிலும் பழங்களிலும் சிறிய, கருமையான புள்ளிகள்.",
+        'causes': "Xanthomonas campestris pv. pruni பாக்டீரியா.",
+        'reasons_for_cause': "பாக்டீரியா புள்ளி நோய் Xanthomonas campestris pv. pruni என்ற பாக்டீரியாவால் ஏற்படுகிறது, இது காயங்கள் அல்லது இயற்கையான துளைகள் வழியாக மரங்களுக்குள் நுழைகிறது. இந்தப் பாக்டீரியா வெப்பமான, ஈரமான சூழலில் நன்கு வளரும்.",
+        'precautions': "கவாத்து அல்லது பிற பணிகளின் போது மரங்களில் காயம் ஏற்படுவதைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக தாமிர அடிப்படையிலான பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "தாமிர அடிப்படையிலான பூஞ்சைக்கொல்லிகள், கவாத்து.",
+        'detailed_info': "பாக்டீரியா புள்ளி நோய் என்பது பீச், பிளம் மற்றும் பிற கொட்டைப் பழ மரங்களைப் பாதிக்கும் பாக்டீரியா நோய். இது இலைகளிலும் பழங்களிலும் சிறிய, கருமையான புள்ளிகளை ஏற்படுத்துகிறது."
+    },
+    'Peach___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் கவாத்து மூலம் மரத்தின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான பீச் மரம் வீரியமான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் ஏராளமான தரமான பழங்களைக் கொண்டிருக்கும்."
+    },
+    'Pepper,_bell___Bacterial_spot': {
+        'symptoms': "இலைகளிலும் பழங்களிலும் கருமையான, நீர் ஊறியது போன்ற புள்ளிகள்.",
+        'causes': "Xanthomonas vesicatoria பாக்டீரியா.",
+        'reasons_for_cause': "பாக்டீரியா புள்ளி நோய் Xanthomonas vesicatoria என்ற பாக்டீரியாவால் ஏற்படுகிறது, இது தெறிக்கும் நீர் மற்றும் மாசுபட்ட விதைகள் மூலம் பரவுகிறது. இந்தப் பாக்டீரியா வெப்பமான, ஈரப்பதமான சூழலில் நன்கு வளரும்.",
+        'precautions': "நோயற்ற விதைகளைப் பயன்படுத்தவும். மேல்நீர்ப் பாசனத்தைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக தாமிர அடிப்படையிலான பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "தாமிர அடிப்படையிலான பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட செடிகளை அகற்றுதல்.",
+        'detailed_info': "பாக்டீரியா புள்ளி நோய் என்பது மிளகாய் மற்றும் தக்காளியைப் பாதிக்கும் பாக்டீரியா நோய். இது இலைகளிலும் பழங்களிலும் கருமையான, நீர் ஊறியது போன்ற புள்ளிகளை ஏற்படுத்துகிறது."
+    },
+    'Pepper,_bell___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் பூச்சிக் கட்டுப்பாடு மூலம் செடியின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான குடைமிளகாய்ச் செடி வலுவான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் ஏராளமான தரமான காய்களைக் கொண்டிருக்கும்."
+    },
+    'Potato___Early_blight': {
+        'symptoms': "இலைகளில் கருமையான, பொதுமைய வளையப் புள்ளிகள்.",
+        'causes': "Alternaria solani பூஞ்சை.",
+        'reasons_for_cause': "முன்பருவக் கருகல் Alternaria solani என்ற பூஞ்சையால் ஏற்படுகிறது, இது பயிர்க் கழிவுகளில் உயிர்வாழும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "மண்ணில் நோய்க்காரணிகள் பெருகுவதைக் குறைக்க பயிர்ச் சுழற்சியைப் பின்பற்றவும். நோயற்ற விதை உருளைக்கிழங்குகளைப் பயன்படுத்தவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பயிர்ச் சுழற்சி.",
+        'detailed_info': "முன்பருவக் கருகல் என்பது உருளைக்கிழங்கு மற்றும் தக்காளியைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் கருமையான, பொதுமைய வளையப் புள்ளிகளை ஏற்படுத்துகிறது."
+    },
+    'Potato___Late_blight': {
+        'symptoms': "இலைகளில் நீர் ஊறியது போன்ற புண்கள், வெள்ளைப் பூஞ்சணம்.",
+        'causes': "Phytophthora infestans ஊமைசீட்.",
+        'reasons_for_cause': "பின்பருவக் கருகல் Phytophthora infestans என்ற ஊமைசீட்டால் ஏற்படுகிறது, இது குளிர்ந்த, ஈரமான சூழலில் வேகமாகப் பரவும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளையும் கிழங்குகளையும் தாக்குகின்றன.",
+        'precautions': "நோயற்ற விதை உருளைக்கிழங்குகளைப் பயன்படுத்தவும். மேல்நீர்ப் பாசனத்தைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட செடிகளை அகற்றுதல்.",
+        'detailed_info': "பின்பருவக் கருகல் என்பது உருளைக்கிழங்கு மற்றும் தக்காளியைப் பாதிக்கும் பேரழிவு தரும் நோய். இது இலைகளில் நீர் ஊறியது போன்ற புண்களையும் வெள்ளைப் பூஞ்சணத்தையும் ஏற்படுத்துகிறது."
+    },
+    'Potato___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் பூச்சிக் கட்டுப்பாடு மூலம் செடியின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான உருளைக்கிழங்குச் செடி வீரியமான வளர்ச்சி மற்றும் ஏராளமான கிழங்கு உற்பத்தியைக் கொண்டிருக்கும். இதில் நோய் அல்லது பூச்சிச் சேதம் இருக்காது."
+    },
+    'Raspberry___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் பூச்சிக் கட்டுப்பாடு மூலம் செடியின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான ராஸ்பெர்ரி செடி வீரியமான வளர்ச்சி, ஏராளமான பழ உற்பத்தி ஆகியவற்றைக் கொண்டிருக்கும்; நோய் அல்லது பூச்சிச் சேதம் இருக்காது."
+    },
+    'Soybean___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் களைக் கட்டுப்பாடு மூலம் பயிரின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான சோயாபீன் பயிர் வலுவான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் ஏராளமான காய் உற்பத்தியைக் கொண்டிருக்கும். இதில் நோய் அல்லது பூச்சிச் சேதம் இருக்காது."
+    },
+    'Squash___Powdery_mildew': {
+        'symptoms': "இலைகளிலும் தண்டுகளிலும் வெள்ளைப் பொடி போன்ற வளர்ச்சி.",
+        'causes': "பூஞ்சைகள் (பல்வேறு இனங்கள்).",
+        'reasons_for_cause': "சாம்பல் நோய் ஈரப்பதமான சூழலில் நன்கு வளரும் பல்வேறு இனப் பூஞ்சைகளால் ஏற்படுகிறது. வித்துகள் காற்றின் மூலம் பரவி புதிய தாவரத் திசுக்களைத் தாக்குகின்றன.",
+        'precautions': "கவாத்து செய்தும் செடிகளுக்கு இடையே போதிய இடைவெளி விட்டும் காற்றோட்டத்தை மேம்படுத்தவும். ஈரப்பதத்தை அதிகரிக்கும் மேல்நீர்ப் பாசனத்தைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், நல்ல காற்றோட்டம்.",
+        'detailed_info': "சாம்பல் நோய் என்பது பூசணி வகைகள் உட்படப் பல வகையான தாவரங்களைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளிலும் தண்டுகளிலும் வெள்ளைப் பொடி போன்ற வளர்ச்சியை ஏற்படுத்துகிறது."
+    },
+    'Strawberry___Leaf_scorch': {
+        'symptoms': "இலைகளில் சிறிய ஊதா நிறப் புள்ளிகள், அவை ஒன்றிணைந்து கருமையாகும்.",
+        'causes': "Diplocarpon earlianum பூஞ்சை.",
+        'reasons_for_cause': "இலைக் கருகல் Diplocarpon earlianum என்ற பூஞ்சையால் ஏற்படுகிறது, இது பாதிக்கப்பட்ட தாவரப் பகுதிகளில் உயிர்வாழும். வித்துகள் தெறிக்கும் நீரின் மூலம் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "பாதிக்கப்பட்ட இலைகளை அகற்றி அழிக்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட இலைகளை அகற்றுதல்.",
+        'detailed_info': "இலைக் கருகல் என்பது ஸ்ட்ராபெர்ரியைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் சிறிய ஊதாப் புள்ளிகளை ஏற்படுத்துகிறது, அவை ஒன்றிணைந்து கருமையாகும்."
+    },
+    'Strawberry___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் பூச்சிக் கட்டுப்பாடு மூலம் செடியின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான ஸ்ட்ராபெர்ரி செடி வலுவான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் ஏராளமான தரமான பழங்களைக் கொண்டிருக்கும்."
+    },
+    'Tomato___Bacterial_spot': {
+        'symptoms': "இலைகளிலும் பழங்களிலும் சிறிய, கருமையான புள்ளிகள்.",
+        'causes': "Xanthomonas vesicatoria பாக்டீரியா.",
+        'reasons_for_cause': "பாக்டீரியா புள்ளி நோய் Xanthomonas vesicatoria என்ற பாக்டீரியாவால் ஏற்படுகிறது, இது தெறிக்கும் நீர் மற்றும் மாசுபட்ட விதைகள் மூலம் பரவுகிறது. இந்தப் பாக்டீரியா வெப்பமான, ஈரப்பதமான சூழலில் நன்கு வளரும்.",
+        'precautions': "நோயற்ற விதைகளைப் பயன்படுத்தவும். மேல்நீர்ப் பாசனத்தைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக தாமிர அடிப்படையிலான பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "தாமிர அடிப்படையிலான பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட செடிகளை அகற்றுதல்.",
+        'detailed_info': "பாக்டீரியா புள்ளி நோய் என்பது தக்காளி மற்றும் மிளகாயைப் பாதிக்கும் பாக்டீரியா நோய். இது இலைகளிலும் பழங்களிலும் சிறிய, கருமையான புள்ளிகளை ஏற்படுத்துகிறது."
+    },
+    'Tomato___Early_blight': {
+        'symptoms': "இலைகளில் கருமையான, பொதுமைய வளையப் புள்ளிகள்.",
+        'causes': "Alternaria solani பூஞ்சை.",
+        'reasons_for_cause': "முன்பருவக் கருகல் Alternaria solani என்ற பூஞ்சையால் ஏற்படுகிறது, இது பயிர்க் கழிவுகளில் உயிர்வாழும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "மண்ணில் நோய்க்காரணிகள் பெருகுவதைக் குறைக்க பயிர்ச் சுழற்சியைப் பின்பற்றவும். நோயற்ற நாற்றுகளைப் பயன்படுத்தவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பயிர்ச் சுழற்சி.",
+        'detailed_info': "முன்பருவக் கருகல் என்பது தக்காளி மற்றும் உருளைக்கிழங்கைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் கருமையான, பொதுமைய வளையப் புள்ளிகளை ஏற்படுத்துகிறது."
+    },
+    'Tomato___Late_blight': {
+        'symptoms': "இலைகளில் நீர் ஊறியது போன்ற புண்கள், வெள்ளைப் பூஞ்சணம்.",
+        'causes': "Phytophthora infestans ஊமைசீட்.",
+        'reasons_for_cause': "பின்பருவக் கருகல் Phytophthora infestans என்ற ஊமைசீட்டால் ஏற்படுகிறது, இது குளிர்ந்த, ஈரமான சூழலில் வேகமாகப் பரவும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளையும் பழங்களையும் தாக்குகின்றன.",
+        'precautions': "நோயற்ற நாற்றுகளைப் பயன்படுத்தவும். மேல்நீர்ப் பாசனத்தைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட செடிகளை அகற்றுதல்.",
+        'detailed_info': "பின்பருவக் கருகல் என்பது தக்காளி மற்றும் உருளைக்கிழங்கைப் பாதிக்கும் பேரழிவு தரும் நோய். இது இலைகளில் நீர் ஊறியது போன்ற புண்களையும் வெள்ளைப் பூஞ்சணத்தையும் ஏற்படுத்துகிறது."
+    },
+    'Tomato___Leaf_Mold': {
+        'symptoms': "இலையின் மேற்பரப்பில் வெளிர் பச்சை அல்லது மஞ்சள் புள்ளிகள், அடிப்பரப்பில் சாம்பல்-ஊதா நிறப் பூஞ்சணம்.",
+        'causes': "Passalora fulva பூஞ்சை.",
+        'reasons_for_cause': "இலைப் பூஞ்சண நோய் Passalora fulva என்ற பூஞ்சையால் ஏற்படுகிறது, இது ஈரப்பதமான சூழலில் நன்கு வளரும். வித்துகள் காற்றின் மூலம் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "கவாத்து செய்தும் செடிகளுக்கு இடையே போதிய இடைவெளி விட்டும் காற்றோட்டத்தை மேம்படுத்தவும். ஈரப்பதத்தை அதிகரிக்கும் மேல்நீர்ப் பாசனத்தைத் தவிர்க்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், நல்ல காற்றோட்டம்.",
+        'detailed_info': "இலைப் பூஞ்சண நோய் என்பது தக்காளியைப் பாதிக்கும் பூஞ்சை நோய். இது இலையின் மேற்பரப்பில் வெளிர் பச்சை அல்லது மஞ்சள் புள்ளிகளையும் அடிப்பரப்பில் சாம்பல்-ஊதா நிறப் பூஞ்சணத்தையும் ஏற்படுத்துகிறது."
+    },
+    'Tomato___Septoria_leaf_spot': {
+        'symptoms': "இலைகளில் கருமையான விளிம்புகளும் வெளிர் மையமும் கொண்ட சிறிய, வட்டமான புள்ளிகள்.",
+        'causes': "Septoria lycopersici பூஞ்சை.",
+        'reasons_for_cause': "செப்டோரியா இலைப்புள்ளி Septoria lycopersici என்ற பூஞ்சையால் ஏற்படுகிறது, இது பயிர்க் கழிவுகளில் உயிர்வாழும். வித்துகள் தெறிக்கும் நீரின் மூலம் பரவி புதிய இலைகளைத் தாக்குகின்றன.",
+        'precautions': "மண்ணில் நோய்க்காரணிகள் பெருகுவதைக் குறைக்க பயிர்ச் சுழற்சியைப் பின்பற்றவும். பாதிக்கப்பட்ட இலைகளை அகற்றி அழிக்கவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பாதிக்கப்பட்ட இலைகளை அகற்றுதல், பயிர்ச் சுழற்சி.",
+        'detailed_info': "செப்டோரியா இலைப்புள்ளி என்பது தக்காளியைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளில் கருமையான விளிம்புகளும் வெளிர் மையமும் கொண்ட சிறிய, வட்டமான புள்ளிகளை ஏற்படுத்துகிறது."
+    },
+    'Tomato___Spider_mites Two-spotted_spider_mite': {
+        'symptoms': "இலைகளில் மெல்லிய வலைப்பின்னல், இலைகள் மஞ்சளாதல் அல்லது புள்ளிப் புள்ளியாக நிறமிழத்தல்.",
+        'causes': "சிலந்திப் பேன் (Tetranychus urticae).",
+        'reasons_for_cause': "சிலந்திப் பேன்கள் வெப்பமான, வறண்ட சூழலில் பெருகும் மிகச் சிறிய பூச்சிகள். இவை தாவரச் சாற்றை உறிஞ்சி இலைகளுக்குச் சேதம் விளைவிக்கின்றன.",
+        'precautions': "மண்ணில் போதுமான ஈரப்பதத்தைப் பராமரிக்கவும். மாற்று ஓம்புயிர்களாகச் செயல்படும் களைகளைக் கட்டுப்படுத்தவும். இரைகொல்லிப் பேன்கள் போன்ற நன்மை செய்யும் பூச்சிகளை அறிமுகப்படுத்தவும்.",
+        'treatments': "பூச்சிக்கொல்லிகள், சிலந்திப்பேன் கொல்லிகள், உயிரியல் கட்டுப்பாடு.",
+        'detailed_info': "சிலந்திப் பேன்கள் தக்காளியைத் தாக்கக்கூடிய மிகச் சிறிய பூச்சிகள். இவை இலைகளில் மெல்லிய வலைப்பின்னலையும் இலைகள் மஞ்சளாதல் அல்லது புள்ளிப் புள்ளியாக நிறமிழத்தலையும் ஏற்படுத்துகின்றன."
+    },
+    'Tomato___Target_Spot': {
+        'symptoms': "இலைகளிலும் பழங்களிலும் பொதுமைய வளையங்களுடன் கூடிய சிறிய, வட்டமான புள்ளிகள்.",
+        'causes': "Corynespora cassiicola பூஞ்சை.",
+        'reasons_for_cause': "இலக்குப் புள்ளி நோய் Corynespora cassiicola என்ற பூஞ்சையால் ஏற்படுகிறது, இது பயிர்க் கழிவுகளில் உயிர்வாழும். வித்துகள் காற்று மற்றும் மழையால் பரவி புதிய இலைகளையும் பழங்களையும் தாக்குகின்றன.",
+        'precautions': "மண்ணில் நோய்க்காரணிகள் பெருகுவதைக் குறைக்க பயிர்ச் சுழற்சியைப் பின்பற்றவும். முன்னெச்சரிக்கையாக பூஞ்சைக்கொல்லிகளைத் தெளிக்கவும்.",
+        'treatments': "பூஞ்சைக்கொல்லிகள், பயிர்ச் சுழற்சி.",
+        'detailed_info': "இலக்குப் புள்ளி நோய் என்பது தக்காளியைப் பாதிக்கும் பூஞ்சை நோய். இது இலைகளிலும் பழங்களிலும் பொதுமைய வளையங்களுடன் கூடிய சிறிய, வட்டமான புள்ளிகளை ஏற்படுத்துகிறது."
+    },
+    'Tomato___Tomato_Yellow_Leaf_Curl_Virus': {
+        'symptoms': "இலைகள் மஞ்சளாகிச் சுருளுதல், வளர்ச்சி குன்றுதல்.",
+        'causes': "தக்காளி மஞ்சள் இலைச் சுருள் வைரஸ் (TYLCV).",
+        'reasons_for_cause': "தக்காளி மஞ்சள் இலைச் சுருள் வைரஸ் (TYLCV) வெள்ளை ஈக்களால் பரப்பப்படுகிறது. இந்த வைரஸ் தக்காளிச் செடிகளைத் தாக்கி, இலைகள் மஞ்சளாகிச் சுருளுதலையும் வளர்ச்சி குன்றுதலையும் ஏற்படுத்துகிறது.",
+        'precautions': "பூச்சிக்கொல்லிகள் மூலம் வெள்ளை ஈக்களின் எண்ணிக்கையைக் கட்டுப்படுத்தவும். நோய் எதிர்ப்புத் திறன் கொண்ட தக்காளி ரகங்களைப் பயன்படுத்தவும். பாதிக்கப்பட்ட செடிகளை உடனே அகற்றவும்.",
+        'treatments': "வெள்ளை ஈக்களைக் கட்டுப்படுத்தப் பூச்சிக்கொல்லிகள், நோய் எதிர்ப்பு ரகங்கள்.",
+        'detailed_info': "தக்காளி மஞ்சள் இலைச் சுருள் வைரஸ் (TYLCV) என்பது தக்காளியைப் பாதிக்கும் வைரஸ் நோய். இது இலைகள் மஞ்சளாகிச் சுருளுதலையும் வளர்ச்சி குன்றுதலையும் ஏற்படுத்துகிறது."
+    },
+    'Tomato___Tomato_mosaic_virus': {
+        'symptoms': "இலைகளில் திட்டுத் திட்டான நிறமாற்றம், வளர்ச்சி குன்றுதல், பழ விளைச்சல் குறைதல்.",
+        'causes': "தக்காளி மொசைக் வைரஸ் (ToMV).",
+        'reasons_for_cause': "தக்காளி மொசைக் வைரஸ் (ToMV) தொடுதல் மூலம் பரவுகிறது. இந்த வைரஸ் தக்காளிச் செடிகளைத் தாக்கி, இலைகளில் திட்டுத் திட்டான நிறமாற்றம், வளர்ச்சி குன்றுதல் மற்றும் பழ விளைச்சல் குறைதலை ஏற்படுத்துகிறது.",
+        'precautions': "நோயற்ற நாற்றுகளைப் பயன்படுத்தவும். தக்காளிச் செடிகளைக் கையாண்ட பின் கைகளையும் கருவிகளையும் நன்கு கழுவவும். பாதிக்கப்பட்ட செடிகளை உடனே அகற்றவும்.",
+        'treatments': "பாதிக்கப்பட்ட செடிகளை அகற்றுதல், சுகாதாரம்.",
+        'detailed_info': "தக்காளி மொசைக் வைரஸ் (ToMV) என்பது தக்காளியைப் பாதிக்கும் வைரஸ் நோய். இது இலைகளில் திட்டுத் திட்டான நிறமாற்றம், வளர்ச்சி குன்றுதல் மற்றும் பழ விளைச்சல் குறைதலை ஏற்படுத்துகிறது."
+    },
+    'Tomato___healthy': {
+        'symptoms': "காணக்கூடிய அறிகுறிகள் இல்லை.",
+        'causes': "பொருந்தாது",
+        'reasons_for_cause': "பொருந்தாது",
+        'precautions': "சரியான நீர்ப்பாசனம், உரமிடுதல் மற்றும் பூச்சிக் கட்டுப்பாடு மூலம் செடியின் ஆரோக்கியத்தைப் பராமரிக்கவும்.",
+        'treatments': "பொருந்தாது",
+        'detailed_info': "ஆரோக்கியமான தக்காளிச் செடி வீரியமான வளர்ச்சி, அடர் பச்சை இலைகள் மற்றும் ஏராளமான தரமான பழங்களைக் கொண்டிருக்கும்."
+    }
+}
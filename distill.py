@@ -0,0 +1,201 @@
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import architectures
+import data_pipeline
+import inference
+import model_bundle
+from benchmarks.timing import measure_latency, print_table, summarize
+from datasets import TRAIN_DIR, VALID_DIR, image_batches, list_labeled_images
+
+# Trains a small student model on the train directory against the trained
+# model's soft targets. The teacher scores every training image once and its
+# logits are cached on disk, keyed by teacher version, the backend that ran it
+# and the file list, so reruns with a different temperature or student skip the
+# teacher entirely. Training images are decoded once, on the first epoch, and
+# later epochs read them from the same cache data_pipeline uses, so each student
+# epoch is only a student forward and backward pass.
+#
+#     python distill.py --student lite --width 0.5 --temperature 4 --epochs 10
+STUDENT_PATH = 'student_plant_disease_model.keras'
+CACHE_DIR = '.distill_cache'
+TEMPERATURE = 4.0
+ALPHA = 0.9
+
+# Probabilities below this are clipped before taking the log; the teacher only
+# exposes softmax output, so its logits are recovered as log-probabilities
+# (softmax is shift-invariant, so they give the same soft targets)
+MIN_PROBABILITY = 1e-12
+
+# Run a backend over every path, in order
+def predict_paths(model, paths, batch_size):
+    return np.concatenate([inference.predict_batch(model, batch.numpy())
+                           for batch in image_batches(paths, batch_size)])
+
+# The backend is part of the key: a quantized teacher gives different logits
+# from the same model file
+def logits_cache_path(cache_dir, teacher_version, backend, paths):
+    digest = hashlib.sha256('\n'.join(paths).encode('utf-8'))
+    return os.path.join(cache_dir, f'{teacher_version}-{backend}-{digest.hexdigest()[:16]}.npy')
+
+# Teacher logits for paths, computed once per teacher version, backend and file
+# list ('auto' is keyed by the backend it resolves to). Written through a
+# temporary file so an interrupted run leaves no cache entry.
+def teacher_logits(teacher_path, paths, cache_dir=CACHE_DIR, serving_mode=inference.SERVING_MODE,
+                   batch_size=inference.BATCH_SIZE):
+    backend, _ = inference.resolve_serving_mode(teacher_path, serving_mode)
+    path = logits_cache_path(cache_dir, inference.model_version(teacher_path), backend, paths)
+    if os.path.exists(path):
+        logits = np.load(path)
+        if logits.shape[0] == len(paths):
+            return logits
+
+    teacher = inference.load_model(teacher_path, serving_mode)
+    start = time.perf_counter()
+    probabilities = predict_paths(teacher, paths, batch_size)
+    print(f'Teacher scored {len(paths)} images in {time.perf_counter() - start:.1f}s')
+    logits = np.log(np.maximum(probabilities, MIN_PROBABILITY)).astype(np.float32)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, logits)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return logits
+
+# Targets are the one-hot label and the teacher logits side by side, so the
+# standard fit() loop can carry both. Decoding and caching follow
+# data_pipeline.make_dataset: images are cached as uint8 after the first epoch
+# (in memory, or on disk when cache is a file path; None decodes every epoch)
+# and reshuffled through a bounded buffer.
+def training_batches(paths, labels, logits, num_classes, batch_size, seed=0, cache='memory',
+                     shuffle_buffer=data_pipeline.SHUFFLE_BUFFER):
+    import tensorflow as tf
+
+    targets = np.concatenate([np.eye(num_classes, dtype=np.float32)[labels], logits], axis=1)
+    dataset = (tf.data.Dataset.from_tensor_slices((paths, targets))
+               .shuffle(len(paths), seed=seed, reshuffle_each_iteration=cache is None)
+               .map(data_pipeline.decode, num_parallel_calls=tf.data.AUTOTUNE))
+    if cache is not None:
+        dataset = (dataset.cache('' if cache == 'memory' else cache)
+                   .shuffle(min(shuffle_buffer, len(paths)), seed=seed, reshuffle_each_iteration=True))
+    return (dataset.batch(batch_size)
+            .map(data_pipeline.to_float, num_parallel_calls=tf.data.AUTOTUNE)
+            .prefetch(tf.data.AUTOTUNE))
+
+# Hinton et al.'s loss: cross-entropy against the teacher's softened outputs,
+# scaled by T^2 to keep gradient magnitudes comparable across temperatures,
+# mixed with ordinary cross-entropy on the hard labels. (Cross-entropy and KL
+# divergence to the soft targets differ by the teacher's entropy, a constant.)
+def distillation_loss(num_classes, temperature=TEMPERATURE, alpha=ALPHA):
+    import tensorflow as tf
+
+    def loss(targets, student_logits):
+        labels, teacher = targets[:, :num_classes], targets[:, num_classes:]
+        soft = tf.nn.softmax_cross_entropy_with_logits(tf.nn.softmax(teacher / temperature),
+                                                       student_logits / temperature)
+        hard = tf.nn.softmax_cross_entropy_with_logits(labels, student_logits)
+        return alpha * temperature ** 2 * soft + (1 - alpha) * hard
+    return loss
+
+def label_accuracy(num_classes):
+    import tensorflow as tf
+
+    def accuracy(targets, student_logits):
+        return tf.keras.metrics.categorical_accuracy(targets[:, :num_classes], student_logits)
+    return accuracy
+
+def distill(teacher_path=inference.MODEL_PATH, student_path=STUDENT_PATH, train_dir=TRAIN_DIR,
+            student='lite', width=None, temperature=TEMPERATURE, alpha=ALPHA, epochs=10,
+            batch_size=inference.BATCH_SIZE, cache_dir=CACHE_DIR, serving_mode=inference.SERVING_MODE, seed=0,
+            image_cache='memory'):
+    import tensorflow as tf
+
+    class_names = inference.get_class_names(teacher_path)
+    paths, labels, _ = list_labeled_images(train_dir, class_names)
+    if not paths:
+        raise FileNotFoundError(f'No training images for the teacher classes under {train_dir}')
+    logits = teacher_logits(teacher_path, paths, cache_dir, serving_mode, batch_size)
+
+    tf.keras.utils.set_random_seed(seed)
+    options = {} if width is None else {'width': width}
+    model = architectures.build_model(student, num_classes=len(class_names), activation=None, **options)
+    model.compile(optimizer='adam', loss=distillation_loss(len(class_names), temperature, alpha),
+                  metrics=[label_accuracy(len(class_names))])
+    model.fit(training_batches(paths, labels, logits, len(class_names), batch_size, seed, image_cache),
+              epochs=epochs)
+
+    # Serve probabilities like every other model. The rebuilt model shares the
+    # trained layers but is uncompiled, so the distillation loss (which only
+    # exists here) is not saved with it.
+    served = tf.keras.Sequential([tf.keras.Input(model.input_shape[1:]), *model.layers, tf.keras.layers.Softmax()],
+                                 name=model.name)
+    model_bundle.save_bundle(served, student_path, class_names)
+    return student_path
+
+# Validation accuracy, top-1 agreement with the teacher and batch-1 latency
+def compare(teacher_path, student_path, valid_dir, serving_mode, batch_size=inference.BATCH_SIZE):
+    class_names = inference.get_class_names(teacher_path)
+    paths, labels, _ = list_labeled_images(valid_dir, class_names)
+    labels = np.array(labels)
+    single = np.zeros((1, *inference.IMAGE_SIZE, 3), dtype=np.float32)
+
+    rows = []
+    teacher_top1 = None
+    for name, path in (('teacher', teacher_path), ('student', student_path)):
+        model = inference.load_model(path, serving_mode)
+        top1 = np.argmax(predict_paths(model, paths, batch_size), axis=1)
+        if teacher_top1 is None:
+            teacher_top1 = top1
+        latency = summarize(measure_latency(lambda: model.predict_on_batch(single)))
+        rows.append({
+            'model': name,
+            'accuracy': float(np.mean(top1 == labels)),
+            'teacher_agreement': float(np.mean(top1 == teacher_top1)),
+            'p50_ms': latency['p50_ms'],
+            'p99_ms': latency['p99_ms'],
+            'size_mb': os.path.getsize(path) / 2**20,
+        })
+    rows[1]['speedup'] = rows[0]['p50_ms'] / rows[1]['p50_ms']
+    rows[0]['speedup'] = 1.0
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Distill the trained model into a smaller student')
+    parser.add_argument('--teacher', default=inference.MODEL_PATH)
+    parser.add_argument('--output', default=STUDENT_PATH)
+    parser.add_argument('--train-dir', default=TRAIN_DIR)
+    parser.add_argument('--valid-dir', default=VALID_DIR, help='used for the teacher/student comparison')
+    parser.add_argument('--student', choices=architectures.ARCHITECTURES, default='lite')
+    parser.add_argument('--width', type=float, help="filter multiplier for the 'lite' student")
+    parser.add_argument('--temperature', type=float, default=TEMPERATURE)
+    parser.add_argument('--alpha', type=float, default=ALPHA, help='weight of the soft-target loss')
+    parser.add_argument('--epochs', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=inference.BATCH_SIZE)
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='where teacher logits are cached')
+    parser.add_argument('--image-cache', default='memory',
+                        help="decoded training images: 'memory', 'none', or a file path prefix for an on-disk cache")
+    parser.add_argument('--serving-mode', choices=inference.SERVING_MODES, default=inference.SERVING_MODE,
+                        help='backend used to run the teacher and to time both models')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-compare', action='store_true', help='skip the validation comparison')
+    args = parser.parse_args()
+
+    distill(args.teacher, args.output, args.train_dir, args.student, args.width, args.temperature, args.alpha,
+            args.epochs, args.batch_size, args.cache_dir, args.serving_mode, args.seed,
+            None if args.image_cache == 'none' else args.image_cache)
+    print(f'Saved student to {args.output}')
+    if not args.no_compare:
+        print_table(compare(args.teacher, args.output, args.valid_dir, args.serving_mode, args.batch_size))
+
+if __name__ == '__main__':
+    main()
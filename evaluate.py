@@ -0,0 +1,125 @@
+import argparse
+import json
+import time
+
+import numpy as np
+
+import inference
+from datasets import VALID_DIR
+
+# Single-pass evaluation: the dataset is streamed once in large batches and
+# each batch only updates a classes x classes confusion matrix, from which
+# precision, recall, F1 and the classification report are derived. Memory does
+# not grow with the number of images.
+#
+#     python evaluate.py --data valid --batch-size 256
+#     python evaluate.py --data shards/valid --confusion-csv confusion.csv
+EVAL_BATCH_SIZE = 256
+
+class ConfusionMatrix:
+    def __init__(self, num_classes):
+        self.num_classes = num_classes
+        # Rows are true classes, columns predictions
+        self.matrix = np.zeros((num_classes, num_classes), dtype=np.int64)
+
+    def update(self, true_labels, predicted_labels):
+        pairs = np.asarray(true_labels, dtype=np.int64) * self.num_classes + np.asarray(predicted_labels)
+        self.matrix += np.bincount(pairs, minlength=self.num_classes ** 2).reshape(self.matrix.shape)
+
+    @property
+    def total(self):
+        return int(self.matrix.sum())
+
+    def accuracy(self):
+        return float(np.trace(self.matrix) / self.total) if self.total else 0.0
+
+    # Per-class precision, recall, F1 and support; 0 where undefined, as
+    # sklearn reports it
+    def per_class(self):
+        correct = np.diag(self.matrix).astype(np.float64)
+        support = self.matrix.sum(axis=1)
+        predicted = self.matrix.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(predicted > 0, correct / predicted, 0.0)
+            recall = np.where(support > 0, correct / support, 0.0)
+            f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+        return precision, recall, f1, support
+
+    # Same layout as sklearn.metrics.classification_report
+    def report(self, class_names, digits=2):
+        precision, recall, f1, support = self.per_class()
+        width = max(len('weighted avg'), *(len(name) for name in class_names), digits)
+        head_fmt = '{:>{width}s} ' + ' {:>9}' * 4
+        row_fmt = '{:>{width}s} ' + ' {:>9.{digits}f}' * 3 + ' {:>9}\n'
+
+        lines = head_fmt.format('', 'precision', 'recall', 'f1-score', 'support', width=width) + '\n\n'
+        for name, row in zip(class_names, zip(precision, recall, f1, support)):
+            lines += row_fmt.format(name, *row, width=width, digits=digits)
+        lines += '\n'
+
+        total = int(support.sum())
+        accuracy_fmt = '{:>{width}s} ' + ' {:>9.{digits}}' * 2 + ' {:>9.{digits}f}' + ' {:>9}\n'
+        lines += accuracy_fmt.format('accuracy', '', '', self.accuracy(), total, width=width, digits=digits)
+        weights = support / total if total else np.zeros_like(precision)
+        for name, average in (('macro avg', np.mean), ('weighted avg', lambda values: np.sum(values * weights))):
+            lines += row_fmt.format(name, average(precision), average(recall), average(f1), total,
+                                    width=width, digits=digits)
+        return lines
+
+    def save_csv(self, path, class_names):
+        with open(path, 'w') as f:
+            f.write(','.join(['true \\ predicted', *class_names]) + '\n')
+            for name, row in zip(class_names, self.matrix):
+                f.write(','.join([name, *map(str, row)]) + '\n')
+
+# Stream (images, one-hot labels) batches through a model (a Keras model or an
+# inference backend, anything with predict_on_batch) once
+def evaluate(model, dataset, num_classes):
+    confusion = ConfusionMatrix(num_classes)
+    for images, labels in dataset:
+        predictions = np.asarray(model.predict_on_batch(images.numpy()))
+        confusion.update(np.argmax(labels.numpy(), axis=1), np.argmax(predictions, axis=1))
+    return confusion
+
+# Evaluate on an image directory or shards.py output, in the model's label order
+def evaluate_directory(model, directory, class_names, batch_size=EVAL_BATCH_SIZE):
+    import data_pipeline
+
+    dataset, class_names, _ = data_pipeline.make_dataset(directory, class_names, batch_size=batch_size,
+                                                         shuffle=False, cache=None)
+    return evaluate(model, dataset, len(class_names))
+
+def main():
+    parser = argparse.ArgumentParser(description='Confusion matrix and classification report in one pass')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--data', default=VALID_DIR, help='image directory or shards.py output')
+    parser.add_argument('--serving-mode', choices=inference.SERVING_MODES, default=inference.SERVING_MODE)
+    parser.add_argument('--batch-size', type=int, default=EVAL_BATCH_SIZE)
+    parser.add_argument('--digits', type=int, default=2)
+    parser.add_argument('--confusion-csv', help='also write the confusion matrix here')
+    parser.add_argument('--json', help='also write accuracy and per-class metrics here')
+    args = parser.parse_args()
+
+    model = inference.load_model(args.model, args.serving_mode)
+    class_names = inference.get_class_names(args.model)
+    start = time.perf_counter()
+    confusion = evaluate_directory(model, args.data, class_names, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    print(confusion.report(class_names, args.digits))
+    print(f'{confusion.total} images in {elapsed:.1f}s ({confusion.total / elapsed:.1f} images/s)')
+    if args.confusion_csv:
+        confusion.save_csv(args.confusion_csv, class_names)
+    if args.json:
+        precision, recall, f1, support = confusion.per_class()
+        with open(args.json, 'w') as f:
+            json.dump({
+                'accuracy': confusion.accuracy(),
+                'classes': {
+                    name: {'precision': p, 'recall': r, 'f1': f_1, 'support': int(s)}
+                    for name, p, r, f_1, s in zip(class_names, precision, recall, f1, support)
+                },
+            }, f, indent=2)
+
+if __name__ == '__main__':
+    main()
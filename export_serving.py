@@ -0,0 +1,180 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import backends
+import inference
+import model_bundle
+
+WEIGHT_DTYPES = ('float32', 'float16', 'bfloat16')
+
+# Weights smaller than this stay float32: casting them saves nothing worth the
+# extra Cast node
+MIN_CAST_ELEMENTS = 1024
+
+# The notebook model is Sequential; rebuilding it without its Dropout layers
+# (which are identities at inference) gives a model with no training-only
+# layers and, being uncompiled, no optimizer state. Layers are shared, so no
+# weights are copied.
+def strip_for_inference(model):
+    import tensorflow as tf
+
+    if not isinstance(model, tf.keras.Sequential):
+        return model
+    layers = [layer for layer in model.layers if not isinstance(layer, tf.keras.layers.Dropout)]
+    stripped = tf.keras.Sequential([tf.keras.Input(model.input_shape[1:])] + layers, name=model.name)
+    return stripped
+
+# Trace the model at inference, turn every variable into a constant and let
+# Grappler fold constants and simplify arithmetic, leaving a plain GraphDef
+# with one input and one output (names fixed by FrozenGraphBackend)
+def freeze(model):
+    import tensorflow as tf
+    from tensorflow.core.protobuf import config_pb2
+    from tensorflow.python.framework.convert_to_constants import convert_variables_to_constants_v2
+    from tensorflow.python.grappler import tf_optimizer
+
+    input_name = backends.FrozenGraphBackend.input_name.split(':')[0]
+    output_name = backends.FrozenGraphBackend.output_name.split(':')[0]
+
+    @tf.function(input_signature=[tf.TensorSpec([None, *inference.IMAGE_SIZE, 3], tf.float32, name=input_name)])
+    def serve(images):
+        return tf.identity(model(images, training=False), name=output_name)
+
+    frozen = convert_variables_to_constants_v2(serve.get_concrete_function())
+    meta_graph = tf.compat.v1.train.export_meta_graph(graph_def=frozen.graph.as_graph_def(), graph=frozen.graph)
+    # Grappler only keeps what the 'train_op' collection fetches
+    meta_graph.collection_def['train_op'].node_list.value.append(output_name)
+
+    config = config_pb2.ConfigProto()
+    rewrite = config.graph_options.rewrite_options
+    rewrite.optimizers.extend(['constfold', 'arithmetic', 'dependency', 'constfold'])
+    rewrite.meta_optimizer_iterations = 1
+    return tf_optimizer.OptimizeGraph(config, meta_graph)
+
+# Store large float32 constants as float16 or bfloat16 followed by a Cast back
+# to float32 under the original name. The file shrinks by half; TensorFlow
+# folds the casts when the graph is first run, so compute stays float32.
+def store_weights(graph_def, dtype):
+    import tensorflow as tf
+
+    if dtype == 'float32':
+        return graph_def
+    target = tf.as_dtype(dtype)
+    optimized = tf.compat.v1.GraphDef()
+    for node in graph_def.node:
+        if node.op != 'Const' or node.attr['dtype'].type != tf.float32.as_datatype_enum:
+            optimized.node.append(node)
+            continue
+        value = tf.make_ndarray(node.attr['value'].tensor)
+        if value.size < MIN_CAST_ELEMENTS:
+            optimized.node.append(node)
+            continue
+
+        stored = optimized.node.add()
+        stored.CopyFrom(node)
+        stored.name = f'{node.name}/stored'
+        stored.attr['dtype'].type = target.as_datatype_enum
+        stored.attr['value'].tensor.CopyFrom(tf.make_tensor_proto(tf.cast(value, target).numpy()))
+
+        cast = optimized.node.add()
+        cast.name = node.name
+        cast.op = 'Cast'
+        cast.input.append(stored.name)
+        cast.device = node.device
+        cast.attr['SrcT'].type = target.as_datatype_enum
+        cast.attr['DstT'].type = tf.float32.as_datatype_enum
+        cast.attr['Truncate'].b = False
+    optimized.versions.CopyFrom(graph_def.versions)
+    optimized.library.CopyFrom(graph_def.library)
+    return optimized
+
+def serving_keras_path(model_path):
+    return f'{os.path.splitext(model_path)[0]}_serving.keras'
+
+# Load an artifact in this (fresh) process and time load plus first call;
+# for 'frozen', path is the model path the graph was exported from
+def measure_load(kind, path):
+    import tensorflow as tf  # import time is the same for every artifact
+
+    start = time.perf_counter()
+    if kind == 'frozen':
+        predict = backends.FrozenGraphBackend(path).predict_on_batch
+    else:
+        keras_model = tf.keras.models.load_model(path)
+        predict = lambda batch: keras_model(batch, training=False).numpy()
+    batch = np.random.default_rng(0).uniform(0, 255, (8, *inference.IMAGE_SIZE, 3)).astype(np.float32)
+    predictions = predict(batch)
+    return {'load_s': time.perf_counter() - start, 'predictions': predictions.tolist()}
+
+# Size, load time and output drift of each (name, kind, path) artifact, each
+# loaded in a fresh process
+def report(artifacts):
+    rows = []
+    reference = None
+    for name, kind, path in artifacts:
+        command = [sys.executable, os.path.abspath(__file__), '--measure-load', kind, path]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f'{name}: load failed\n{result.stderr[-2000:]}', file=sys.stderr)
+            continue
+        measured = json.loads(result.stdout.strip().splitlines()[-1])
+        predictions = np.array(measured['predictions'])
+        if reference is None:
+            reference = predictions
+        artifact = backends.FrozenGraphBackend.artifact(path) if kind == 'frozen' else path
+        rows.append({
+            'artifact': name,
+            'size_mb': os.path.getsize(artifact) / 2**20,
+            'load_s': measured['load_s'],
+            'max_abs_diff': float(np.max(np.abs(predictions - reference))),
+            'top1_agreement': float(np.mean(np.argmax(predictions, 1) == np.argmax(reference, 1))),
+        })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Export an inference-only model for serving')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--weights', choices=WEIGHT_DTYPES, default='float32',
+                        help='storage dtype of the frozen graph weights (compute stays float32)')
+    parser.add_argument('--no-report', action='store_true', help='skip the size and load-time comparison')
+    parser.add_argument('--measure-load', nargs=2, metavar=('KIND', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure_load:
+        print(json.dumps(measure_load(*args.measure_load)))
+        return
+
+    import tensorflow as tf
+
+    model = strip_for_inference(tf.keras.models.load_model(args.model))
+    class_names = inference.get_class_names(args.model)
+
+    # Uncompiled, so the optimizer and its slot variables are not saved
+    keras_path = serving_keras_path(args.model)
+    model.save(keras_path)
+    model_bundle.write_bundle(keras_path, class_names)
+    print(f'keras (no optimizer, no Dropout): {keras_path}')
+
+    frozen_path = backends.FrozenGraphBackend.artifact(args.model)
+    graph_def = store_weights(freeze(model), args.weights)
+    with open(frozen_path, 'wb') as f:
+        f.write(graph_def.SerializeToString())
+    print(f'frozen ({args.weights} weights, {len(graph_def.node)} nodes): {frozen_path}')
+
+    if not args.no_report:
+        from benchmarks.timing import print_table
+
+        print_table(report([
+            ('original .keras', 'keras', args.model),
+            ('serving .keras', 'keras', keras_path),
+            (f'frozen .pb ({args.weights})', 'frozen', args.model),
+        ]))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import os
+import random
+
+import tensorflow as tf
+
+import backends
+import inference
+from datasets import VALID_DIR, list_labeled_images
+
+QUANTIZATIONS = ('float16', 'int8')
+
+# Calibration batches for full-integer quantization, preprocessed exactly as
+# the serving path does
+def representative_dataset(paths):
+    def generator():
+        for path in paths:
+            yield [inference.preprocess_image(path)]
+    return generator
+
+# Converts from an exported SavedModel, which works across Keras versions where
+# from_keras_model does not
+def convert(saved_model_dir, quantization, calibration_paths=None):
+    converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_dir)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == 'float16':
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == 'int8':
+        # Every op in int8; the model takes raw 0-255 pixels, so a uint8
+        # input tensor carries the image without any rescaling
+        converter.representative_dataset = representative_dataset(calibration_paths)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.uint8
+        converter.inference_output_type = tf.uint8
+    else:
+        raise ValueError(f'Unknown quantization {quantization!r}')
+    return converter.convert()
+
+# Spread the calibration sample evenly over classes
+def calibration_sample(valid_dir, count, seed=0):
+    paths, labels, _ = list_labeled_images(valid_dir)
+    by_label = {}
+    for path, label in zip(paths, labels):
+        by_label.setdefault(label, []).append(path)
+
+    rng = random.Random(seed)
+    per_class = max(1, count // max(1, len(by_label)))
+    sample = []
+    for class_paths in by_label.values():
+        sample.extend(rng.sample(class_paths, min(per_class, len(class_paths))))
+    rng.shuffle(sample)
+    return sample[:count]
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the SavedModel and float16/INT8 TFLite models used for serving')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--valid-dir', default=VALID_DIR, help='calibration images for INT8')
+    parser.add_argument('--calibration-samples', type=int, default=500)
+    parser.add_argument('--quantizations', nargs='+', choices=QUANTIZATIONS, default=list(QUANTIZATIONS))
+    args = parser.parse_args()
+
+    model = tf.keras.models.load_model(args.model)
+    calibration_paths = None
+    if 'int8' in args.quantizations:
+        calibration_paths = calibration_sample(args.valid_dir, args.calibration_samples)
+        print(f'Calibrating INT8 on {len(calibration_paths)} images from {args.valid_dir}')
+
+    # The SavedModel is both the conversion source and the 'savedmodel' backend
+    saved_model_dir = backends.SavedModelBackend.artifact(args.model)
+    model.export(saved_model_dir)
+    print(f'savedmodel: {saved_model_dir}')
+
+    for quantization in args.quantizations:
+        path = backends.tflite_path(args.model, quantization)
+        with open(path, 'wb') as f:
+            f.write(convert(saved_model_dir, quantization, calibration_paths))
+        print(f'{quantization}: {path} ({os.path.getsize(path) / 2**20:.1f} MB)')
+
+if __name__ == '__main__':
+    main()
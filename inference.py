@@ -0,0 +1,185 @@
+import contextlib
+import hashlib
+import io
+import os
+
+import numpy as np
+from PIL import Image
+
+import model_bundle
+
+# TensorFlow is imported only by the backends that need it: decoding, labels
+# and model hashing stay cheap to import for pages and tools that never run
+# the model
+
+# Model shared by the Streamlit app and the HTTP service
+MODEL_PATH = 'trained_plant_disease_model.keras'
+
+# Model input size and the number of images scored per batched forward pass
+IMAGE_SIZE = (128, 128)
+BATCH_SIZE = 32
+
+# Backends from backends.py: 'keras' calls the Keras model eagerly, 'compiled'
+# and 'xla' through a traced tf.function, 'savedmodel' and the 'tflite-*'
+# modes run the artifacts written by export_tflite.py, and 'frozen' the
+# inference-only graph written by export_serving.py. 'auto' uses whichever
+# backend and thread count autotune.py measured fastest on this host.
+SERVING_MODES = ('keras', 'compiled', 'xla', 'savedmodel', 'frozen', 'tflite-float16', 'tflite-int8', 'auto')
+SERVING_MODE = os.environ.get('PLANT_SERVING_MODE', 'compiled')
+
+# Backend name and thread count a serving mode resolves to on this host
+def resolve_serving_mode(path=MODEL_PATH, serving_mode=SERVING_MODE):
+    if serving_mode not in SERVING_MODES:
+        raise ValueError(f"Unknown serving mode {serving_mode!r}, expected one of {SERVING_MODES}")
+    if serving_mode == 'auto':
+        import autotune
+        return autotune.tuned_backend(path)
+    return serving_mode, None
+
+# Path of the file or directory a serving mode actually runs
+def serving_artifact(path=MODEL_PATH, serving_mode=SERVING_MODE):
+    import backends
+
+    name, _ = resolve_serving_mode(path, serving_mode)
+    return backends.BACKENDS[name].artifact(path)
+
+# Load the backend for a serving mode and warm it up, so the first request
+# does not pay tracing or allocation cost. The backend's class_names come from
+# the bundle of the model it loaded, and its version (the prediction cache
+# key) is the bundle's checksum when it serves the verified model file itself;
+# any other artifact is hashed once here.
+def load_model(path=MODEL_PATH, serving_mode=SERVING_MODE):
+    import backends
+
+    bundle = get_bundle(path)
+    check_bundle(bundle)
+    verified = os.path.isfile(path)
+    if verified:
+        model_bundle.verify_bundle(path, bundle)
+
+    name, num_threads = resolve_serving_mode(path, serving_mode)
+    model = backends.load_backend(name, path, num_threads)
+    model.class_names = list(bundle['class_names'])
+    artifact = backends.BACKENDS[name].artifact(path)
+    model.version = bundle['version'] if verified and artifact == path else model_version(artifact)
+    model.warm_up()
+    return model
+
+# The decoder below implements one preprocessing pipeline; refuse bundles
+# trained with a different one rather than serve skewed predictions
+def check_bundle(bundle):
+    expected = {
+        'input_size': list(IMAGE_SIZE),
+        'interpolation': 'bilinear',
+        'color_mode': 'rgb',
+        'normalization': model_bundle.DEFAULT_NORMALIZATION,
+    }
+    for key, value in expected.items():
+        if bundle.get(key) != value:
+            raise model_bundle.BundleError(f'Model bundle expects {key}={bundle.get(key)!r}, '
+                                           f'but images are decoded with {value!r}')
+
+# Content hash of the model file (or of every file in a SavedModel directory);
+# cached predictions are keyed on it so a retrained model never serves stale
+# results
+def model_version(path=MODEL_PATH):
+    if os.path.isdir(path):
+        files = sorted(os.path.join(root, name) for root, _, names in os.walk(path) for name in names)
+    else:
+        files = [path]
+
+    digest = hashlib.sha256()
+    for file_path in files:
+        digest.update(os.path.relpath(file_path, path).encode('utf-8'))
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+# Images whose header declares more pixels than this are rejected before any
+# pixel data is decoded (about 64 MP, above any current phone camera)
+MAX_IMAGE_PIXELS = 64_000_000
+
+class ImageTooLargeError(ValueError):
+    pass
+
+# Decode raw image bytes into a single model-sized array. For JPEGs, draft()
+# makes libjpeg decode directly at 1/2, 1/4 or 1/8 scale in the DCT domain
+# (the smallest scale still at least IMAGE_SIZE), so a 12-48 MP phone photo is
+# never materialised at full resolution; a bilinear resize then gives the
+# exact model size, matching the interpolation used in training. Pass
+# dtype=np.uint8 to keep the raw pixels (a quarter of the float32 size).
+def decode_image(image_bytes, dtype=np.float32):
+    img = Image.open(io.BytesIO(image_bytes))
+    width, height = img.size
+    if width * height > MAX_IMAGE_PIXELS:
+        raise ImageTooLargeError(f'{width}x{height} image exceeds the {MAX_IMAGE_PIXELS} pixel limit')
+
+    img.draft('RGB', IMAGE_SIZE)
+    img = img.convert('RGB')
+    if img.size != IMAGE_SIZE:
+        img = img.resize(IMAGE_SIZE, Image.BILINEAR)
+    return np.asarray(img, dtype=dtype)
+
+# Accepts raw bytes, a file-like object or a path and returns a batch of one
+def preprocess_image(image):
+    if hasattr(image, 'read'):  # Check if it's a file-like object
+        image = image.read()
+    elif not isinstance(image, bytes):
+        with open(image, 'rb') as f:
+            image = f.read()
+    return np.array([decode_image(image)])
+
+# Decode raw image bytes chunk by chunk into fixed-size batches; the last batch
+# is zero-padded so every forward pass sees the same input shape
+def preprocess_images(images_bytes, batch_size=BATCH_SIZE):
+    for start in range(0, len(images_bytes), batch_size):
+        chunk = images_bytes[start:start + batch_size]
+        batch = np.zeros((batch_size, *IMAGE_SIZE, 3), dtype=np.float32)
+        for i, image_bytes in enumerate(chunk):
+            batch[i] = decode_image(image_bytes)
+        yield batch, len(chunk)
+
+# Stack already decoded images into one zero-padded fixed-size batch
+def stack_batch(arrays, batch_size=BATCH_SIZE):
+    batch = np.zeros((batch_size, *IMAGE_SIZE, 3), dtype=np.float32)
+    batch[:len(arrays)] = arrays
+    return batch
+
+def predict_batch(model, batch):
+    # predict_on_batch runs one forward pass without predict()'s per-call data
+    # adapter and callback setup
+    return np.asarray(model.predict_on_batch(batch))
+
+# With a preprocess_pool.PreprocessPool, decoding runs on worker processes and
+# the next batches are decoded while the model scores the current one
+def predict_images(model, images_bytes, batch_size=BATCH_SIZE, pool=None):
+    predictions = []
+    if pool is not None:
+        # closing() releases the pool right away if a batch fails to decode
+        with contextlib.closing(pool.map_batches(images_bytes)) as batches:
+            for batch, count, errors in batches:
+                if errors:
+                    raise ValueError(f'Could not decode image {min(errors)}: {errors[min(errors)]}')
+                predictions.append(predict_batch(model, batch)[:count])
+    else:
+        for batch, count in preprocess_images(images_bytes, batch_size):
+            predictions.append(predict_batch(model, batch)[:count])
+    return np.concatenate(predictions)
+
+# Indices of the k most probable classes, best first
+def top_k(probabilities, k=5):
+    return np.argsort(probabilities)[-k:][::-1]
+
+# A model's bundle, which holds its class names in model output order. A model
+# without one has no trustworthy label order, so it is refused rather than
+# labelled from a hard-coded list.
+def get_bundle(path=MODEL_PATH):
+    bundle = model_bundle.load_bundle(path)
+    if bundle is None:
+        raise model_bundle.BundleError(f'{path} has no bundle with its class names; write one with '
+                                       f'python model_bundle.py {path} --class-dir <training split>')
+    return bundle
+
+def get_class_names(path=MODEL_PATH):
+    return list(get_bundle(path)['class_names'])
@@ -0,0 +1,404 @@
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from disease_translations import DISEASE_DETAILS_TAMIL, DISEASE_DETAILS_TELUGU
+
+# Read-only disease knowledge base, built once per label list (the class names
+# of the loaded model's bundle) and then shared by every Streamlit session and
+# server thread. Everything is addressed by the model's class index, so
+# turning a prediction into its details is a tuple lookup: no st.cache_data
+# pickling or copying. Mappings are wrapped in MappingProxyType so callers
+# cannot mutate the shared copy.
+#
+#     knowledge = knowledge_base_for(model.class_names)
+#     entry = knowledge.entry(index)
+#     details = knowledge.details(index, 'Telugu')
+#     knowledge.by_crop['Tomato']  # class indices for one crop
+
+DETAIL_FIELDS = ('symptoms', 'causes', 'reasons_for_cause', 'precautions', 'treatments', 'detailed_info')
+DEFAULT_LANGUAGE = 'English'
+
+# class_name is the model label ('Corn_(maize)___Common_rust_'); crop and
+# disease are display names ('Corn (maize)', 'Common rust')
+Entry = namedtuple('Entry', ['index', 'class_name', 'crop', 'disease', 'healthy'])
+
+def _display_name(part):
+    return ' '.join(part.replace('_', ' ').split())
+
+def parse_class_name(class_name):
+    crop, _, disease = class_name.partition('___')
+    return _display_name(crop), _display_name(disease)
+
+class KnowledgeBase:
+    def __init__(self, class_names, details_by_language, default_language=DEFAULT_LANGUAGE):
+        self.class_names = tuple(class_names)
+        self.default_language = default_language
+        self._index = MappingProxyType({name: i for i, name in enumerate(self.class_names)})
+
+        entries = []
+        by_crop, by_disease = {}, {}
+        for i, name in enumerate(self.class_names):
+            crop, disease = parse_class_name(name)
+            entries.append(Entry(i, name, crop, disease, disease == 'healthy'))
+            by_crop.setdefault(crop, []).append(i)
+            by_disease.setdefault(disease, []).append(i)
+        self.entries = tuple(entries)
+        self.by_crop = MappingProxyType({crop: tuple(indices) for crop, indices in by_crop.items()})
+        self.by_disease = MappingProxyType({disease: tuple(indices) for disease, indices in by_disease.items()})
+
+        # One tuple per language, indexed by class. Classes or fields missing
+        # from a language fall back to the default language when the table is
+        # built, so lookups never need to check.
+        default = details_by_language[default_language]
+        self._details = {}
+        for language, details in details_by_language.items():
+            table = []
+            for name in self.class_names:
+                base = default.get(name)
+                if base is None:
+                    table.append(None)
+                    continue
+                text = details.get(name, {})
+                table.append(MappingProxyType({field: text.get(field, base[field]) for field in DETAIL_FIELDS}))
+            self._details[language] = tuple(table)
+
+    @property
+    def languages(self):
+        return tuple(self._details)
+
+    def index(self, class_name):
+        return self._index[class_name]
+
+    def entry(self, index):
+        return self.entries[index]
+
+    # Detail texts for a class index, or None when the class has none
+    def details(self, index, language=DEFAULT_LANGUAGE):
+        table = self._details.get(language) or self._details[self.default_language]
+        return table[index]
+
+DISEASE_DETAILS = {
+    'Apple___Apple_scab': {
+        'symptoms': "Olive-green to brown spots on leaves, scabby lesions on fruit.",
+        'causes': "Fungus Venturia inaequalis.",
+        'reasons_for_cause': "Apple scab is caused by the fungus Venturia inaequalis, which thrives in cool, wet conditions. Spores are released from fallen leaves in the spring and infect new leaves and fruit.",
+        'precautions': "Collect and destroy fallen leaves in the autumn to reduce the source of infection. Prune trees to improve air circulation and reduce humidity. Apply fungicides preventatively in the spring.",
+        'treatments': "Fungicides, pruning, removing fallen leaves.",
+        'detailed_info': "Apple scab is a fungal disease that affects apple and crabapple trees. It can cause significant damage to leaves and fruit, reducing the tree's vigor and yield."
+    },
+    'Apple___Black_rot': {
+        'symptoms': "Brown spots on leaves, cankers on branches, rotting fruit.",
+        'causes': "Fungus Diplodia seriata.",
+        'reasons_for_cause': "Black rot is caused by the fungus Diplodia seriata, which enters trees through wounds or natural openings. The fungus can survive in dead wood and infected plant parts.",
+        'precautions': "Avoid wounding trees during pruning or other activities. Remove dead or diseased wood promptly. Apply fungicides to protect wounds from infection.",
+        'treatments': "Fungicides, pruning, removing infected wood.",
+        'detailed_info': "Black rot is a fungal disease that affects apples, pears, and other fruit trees. It can cause leaf spots, cankers, and fruit rot, leading to significant crop losses."
+    },
+    'Apple___Cedar_apple_rust': {
+        'symptoms': "Yellow-orange spots on leaves, raised lesions on fruit.",
+        'causes': "Fungus Gymnosporangium juniperi-virginianae.",
+        'reasons_for_cause': "Cedar apple rust is caused by the fungus Gymnosporangium juniperi-virginianae, which requires both apple and cedar trees to complete its life cycle. Spores are released from cedar galls in the spring and infect apple trees.",
+        'precautions': "Remove cedar trees from the vicinity of apple trees to break the disease cycle. Apply fungicides to protect apple trees during periods of spore release.",
+        'treatments': "Fungicides, removing cedar trees from proximity.",
+        'detailed_info': "Cedar apple rust is a fungal disease that requires both apple and cedar trees to complete its life cycle. It causes yellow-orange spots on apple leaves and galls on cedar trees."
+    },
+    'Apple___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good tree health through proper watering, fertilization, and pruning.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy apple tree exhibits no signs of disease or pest infestation. Leaves are green and vibrant, and fruit is free from blemishes."
+    },
+    'Blueberry___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and pruning.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy blueberry plant is characterized by vigorous growth, abundant fruit production, and the absence of disease or pest damage."
+    },
+    'Cherry_(including_sour)___Powdery_mildew': {
+        'symptoms': "White powdery growth on leaves and fruit.",
+        'causes': "Fungus Podosphaera clandestina.",
+        'reasons_for_cause': "Powdery mildew is caused by the fungus Podosphaera clandestina, which thrives in humid conditions. Spores are spread by wind and infect new plant tissue.",
+        'precautions': "Improve air circulation around plants by pruning and spacing them adequately. Avoid overhead watering, which can increase humidity. Apply fungicides preventatively.",
+        'treatments': "Fungicides, good air circulation.",
+        'detailed_info': "Powdery mildew is a fungal disease that affects a wide range of plants, including cherries. It causes a white powdery growth on leaves, stems, and fruit."
+    },
+    'Cherry_(including_sour)___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good tree health through proper watering, fertilization, and pruning.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy cherry tree displays strong growth, dark green leaves, and abundant, high-quality fruit."
+    },
+    'Corn_(maize)___Cercospora_leaf_spot Gray_leaf_spot': {
+        'symptoms': "Grayish-brown rectangular lesions on leaves.",
+        'causes': "Fungus Cercospora zeae-maydis.",
+        'reasons_for_cause': "Gray leaf spot is caused by the fungus Cercospora zeae-maydis, which survives in crop residue. Spores are spread by wind and rain and infect new leaves.",
+        'precautions': "Practice crop rotation to reduce the buildup of inoculum in the soil. Use resistant corn varieties. Apply fungicides preventatively.",
+        'treatments': "Fungicides, crop rotation, resistant varieties.",
+        'detailed_info': "Gray leaf spot is a fungal disease that affects corn. It causes grayish-brown lesions on leaves, which can reduce photosynthetic activity and yield."
+    },
+    'Corn_(maize)___Common_rust_': {
+        'symptoms': "Reddish-brown pustules on leaves.",
+        'causes': "Fungus Puccinia sorghi.",
+        'reasons_for_cause': "Common rust is caused by the fungus Puccinia sorghi, which requires a alternate host. Spores are spread by wind and infect new leaves.",
+        'precautions': "Use resistant corn varieties. Apply fungicides preventatively.",
+        'treatments': "Fungicides, resistant varieties.",
+        'detailed_info': "Common rust is a fungal disease that affects corn. It causes reddish-brown pustules on leaves and stalks, which can reduce yield and grain quality."
+    },
+    'Corn_(maize)___Northern_Leaf_Blight': {
+        'symptoms': "Long, elliptical, gray-green lesions on leaves.",
+        'causes': "Fungus Exserohilum turcicum.",
+        'reasons_for_cause': "Northern leaf blight is caused by the fungus Exserohilum turcicum, which survives in crop residue. Spores are spread by wind and rain and infect new leaves.",
+        'precautions': "Practice crop rotation to reduce the buildup of inoculum in the soil. Use resistant corn varieties. Apply fungicides preventatively.",
+        'treatments': "Fungicides, crop rotation, resistant varieties.",
+        'detailed_info': "Northern leaf blight is a fungal disease that affects corn. It causes long, elliptical lesions on leaves, which can reduce photosynthetic activity and yield."
+    },
+    'Corn_(maize)___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and weed control.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy corn plant exhibits vigorous growth, dark green leaves, and well-developed ears. It is free from disease and pest damage."
+    },
+    'Grape___Black_rot': {
+        'symptoms': "Reddish-brown spots on leaves, black lesions on fruit.",
+        'causes': "Fungus Guignardia bidwellii.",
+        'reasons_for_cause': "Black rot is caused by the fungus Guignardia bidwellii, which survives in infected plant parts. Spores are spread by wind and rain and infect new leaves and fruit.",
+        'precautions': "Remove and destroy infected plant parts. Apply fungicides preventatively.",
+        'treatments': "Fungicides, removing infected plant parts.",
+        'detailed_info': "Black rot is a fungal disease that affects grapes. It causes reddish-brown spots on leaves and black, shriveled berries."
+    },
+    'Grape___Esca_(Black_Measles)': {
+        'symptoms': "Leaf spots, wood decay, fruit discoloration.",
+        'causes': "Complex of fungi.",
+        'reasons_for_cause': "Esca is caused by a complex of fungi that infect grapevines through wounds. The fungi can survive in dead wood and infected plant parts.",
+        'precautions': "Avoid wounding grapevines during pruning or other activities. Remove dead or diseased wood promptly. Apply wound protectants.",
+        'treatments': "Pruning, wound protection, trunk surgery.",
+        'detailed_info': "Esca, also known as black measles, is a complex fungal disease that affects grapevines. It can cause leaf spots, wood decay, and fruit discoloration."
+    },
+    'Grape___Leaf_blight_(Isariopsis_Leaf_Spot)': {
+        'symptoms': "Small, circular spots on leaves.",
+        'causes': "Fungus Isariopsis clavispora.",
+        'reasons_for_cause': "Isariopsis leaf spot is caused by the fungus Isariopsis clavispora. The fungus survives in leaf litter and infected plant parts. Spores are spread by wind and rain and infect new leaves.",
+        'precautions': "Remove and destroy infected leaves. Apply fungicides preventatively.",
+        'treatments': "Fungicides, removing infected leaves.",
+        'detailed_info': "Isariopsis leaf spot is a fungal disease that affects grapes. It causes small, circular spots on leaves, which can lead to defoliation."
+    },
+    'Grape___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good vine health through proper watering, fertilization, and pruning.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy grape vine exhibits strong growth, dark green leaves, and abundant, high-quality fruit."
+    },
+    'Orange___Haunglongbing_(Citrus_greening)': {
+        'symptoms': "Blotchy mottling of leaves, asymmetrical fruit.",
+        'causes': "Bacterium Candidatus Liberibacter asiaticus.",
+        'reasons_for_cause': "Huanglongbing (HLB) is caused by the bacterium Candidatus Liberibacter asiaticus, which is transmitted by psyllids. The bacterium infects the phloem of citrus trees, disrupting nutrient transport.",
+        'precautions': "Control psyllid populations with insecticides. Remove infected trees promptly.",
+        'treatments': "No cure, control psyllids, remove infected trees.",
+        'detailed_info': "Huanglongbing (HLB), also known as citrus greening, is a devastating bacterial disease that affects citrus trees. It causes blotchy mottling of leaves and asymmetrical, bitter fruit."
+    },
+    'Peach___Bacterial_spot': {
+        'symptoms': "Small, dark spots on leaves and fruit.",
+        'causes': "Bacterium Xanthomonas campestris pv. pruni.",
+        'reasons_for_cause': "Bacterial spot is caused by the bacterium Xanthomonas campestris pv. pruni, which enters trees through wounds or natural openings. The bacterium thrives in warm, wet conditions.",
+        'precautions': "Avoid wounding trees during pruning or other activities. Apply copper-based fungicides preventatively.",
+        'treatments': "Copper-based fungicides, pruning.",
+        'detailed_info': "Bacterial spot is a bacterial disease that affects peaches, plums, and other stone fruit trees. It causes small, dark spots on leaves and fruit."
+    },
+    'Peach___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good tree health through proper watering, fertilization, and pruning.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy peach tree exhibits vigorous growth, dark green leaves, and abundant, high-quality fruit."
+    },
+    'Pepper,_bell___Bacterial_spot': {
+        'symptoms': "Dark, water-soaked spots on leaves and fruit.",
+        'causes': "Bacterium Xanthomonas vesicatoria.",
+        'reasons_for_cause': "Bacterial spot is caused by the bacterium Xanthomonas vesicatoria, which is spread by splashing water and contaminated seed. The bacterium thrives in warm, humid conditions.",
+        'precautions': "Use disease-free seed. Avoid overhead watering. Apply copper-based fungicides preventatively.",
+        'treatments': "Copper-based fungicides, removing infected plants.",
+        'detailed_info': "Bacterial spot is a bacterial disease that affects peppers and tomatoes. It causes dark, water-soaked spots on leaves and fruit."
+    },
+    'Pepper,_bell___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and pest control.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy bell pepper plant displays strong growth, dark green leaves, and abundant, high-quality fruit."
+    },
+    'Potato___Early_blight': {
+        'symptoms': "Dark, concentric spots on leaves.",
+        'causes': "Fungus Alternaria solani.",
+        'reasons_for_cause': "Early blight is caused by the fungus Alternaria solani, which survives in crop residue. Spores are spread by wind and rain and infect new leaves.",
+        'precautions': "Practice crop rotation to reduce the buildup of inoculum in the soil. Use disease-free seed potatoes. Apply fungicides preventatively.",
+        'treatments': "Fungicides, crop rotation.",
+        'detailed_info': "Early blight is a fungal disease that affects potatoes and tomatoes. It causes dark, concentric spots on leaves."
+    },
+    'Potato___Late_blight': {
+        'symptoms': "Water-soaked lesions on leaves, white mold.",
+        'causes': "Oomycete Phytophthora infestans.",
+        'reasons_for_cause': "Late blight is caused by the oomycete Phytophthora infestans, which spreads rapidly in cool, wet conditions. Spores are spread by wind and rain and infect new leaves and tubers.",
+        'precautions': "Use disease-free seed potatoes. Avoid overhead watering. Apply fungicides preventatively.",
+        'treatments': "Fungicides, removing infected plants.",
+        'detailed_info': "Late blight is a devastating disease that affects potatoes and tomatoes. It causes water-soaked lesions on leaves and white mold."
+    },
+    'Potato___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and pest control.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy potato plant exhibits vigorous growth and abundant tuber production. It is free from disease and pest damage."
+    },
+    'Raspberry___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and pest control.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy raspberry plant is characterized by vigorous growth, abundant fruit production, and the absence of disease or pest damage."
+    },
+    'Soybean___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and weed control.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy soybean plant exhibits strong growth, dark green leaves, and abundant pod production. It is free from disease and pest damage."
+    },
+    'Squash___Powdery_mildew': {
+        'symptoms': "White powdery growth on leaves and stems.",
+        'causes': "Fungi (various species).",
+        'reasons_for_cause': "Powdery mildew is caused by various species of fungi that thrive in humid conditions. Spores are spread by wind and infect new plant tissue.",
+        'precautions': "Improve air circulation around plants by pruning and spacing them adequately. Avoid overhead watering, which can increase humidity. Apply fungicides preventatively.",
+        'treatments': "Fungicides, good air circulation.",
+        'detailed_info': "Powdery mildew is a fungal disease that affects a wide range of plants, including squash. It causes a white powdery growth on leaves and stems."
+    },
+    'Strawberry___Leaf_scorch': {
+        'symptoms': "Small, purple spots on leaves that merge and darken.",
+        'causes': "Fungus Diplocarpon earlianum.",
+        'reasons_for_cause': "Leaf scorch is caused by the fungus Diplocarpon earlianum, which survives in infected plant parts. Spores are spread by splashing water and infect new leaves.",
+        'precautions': "Remove and destroy infected leaves. Apply fungicides preventatively.",
+        'treatments': "Fungicides, removing infected leaves.",
+        'detailed_info': "Leaf scorch is a fungal disease that affects strawberries. It causes small, purple spots on leaves that merge and darken."
+    },
+    'Strawberry___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and pest control.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy strawberry plant displays strong growth, dark green leaves, and abundant, high-quality fruit."
+    },
+    'Tomato___Bacterial_spot': {
+        'symptoms': "Small, dark spots on leaves and fruit.",
+        'causes': "Bacterium Xanthomonas vesicatoria.",
+        'reasons_for_cause': "Bacterial spot is caused by the bacterium Xanthomonas vesicatoria, which is spread by splashing water and contaminated seed. The bacterium thrives in warm, humid conditions.",
+        'precautions': "Use disease-free seed. Avoid overhead watering. Apply copper-based fungicides preventatively.",
+        'treatments': "Copper-based fungicides, removing infected plants.",
+        'detailed_info': "Bacterial spot is a bacterial disease that affects tomatoes and peppers. It causes small, dark spots on leaves and fruit."
+    },
+    'Tomato___Early_blight': {
+        'symptoms': "Dark, concentric spots on leaves.",
+        'causes': "Fungus Alternaria solani.",
+        'reasons_for_cause': "Early blight is caused by the fungus Alternaria solani, which survives in crop residue. Spores are spread by wind and rain and infect new leaves.",
+        'precautions': "Practice crop rotation to reduce the buildup of inoculum in the soil. Use disease-free transplants. Apply fungicides preventatively.",
+        'treatments': "Fungicides, crop rotation.",
+        'detailed_info': "Early blight is a fungal disease that affects tomatoes and potatoes. It causes dark, concentric spots on leaves."
+    },
+    'Tomato___Late_blight': {
+        'symptoms': "Water-soaked lesions on leaves, white mold.",
+        'causes': "Oomycete Phytophthora infestans.",
+        'reasons_for_cause': "Late blight is caused by the oomycete Phytophthora infestans, which spreads rapidly in cool, wet conditions. Spores are spread by wind and rain and infect new leaves and fruit.",
+        'precautions': "Use disease-free transplants. Avoid overhead watering. Apply fungicides preventatively.",
+        'treatments': "Fungicides, removing infected plants.",
+        'detailed_info': "Late blight is a devastating disease that affects tomatoes and potatoes. It causes water-soaked lesions on leaves and white mold."
+    },
+    'Tomato___Leaf_Mold': {
+        'symptoms': "Pale green or yellow spots on upper leaf surface, gray-purple mold on lower surface.",
+        'causes': "Fungus Passalora fulva.",
+        'reasons_for_cause': "Leaf mold is caused by the fungus Passalora fulva, which thrives in humid conditions. Spores are spread by wind and infect new leaves.",
+        'precautions': "Improve air circulation around plants by pruning and spacing them adequately. Avoid overhead watering, which can increase humidity. Apply fungicides preventatively.",
+        'treatments': "Fungicides, good air circulation.",
+        'detailed_info': "Leaf mold is a fungal disease that affects tomatoes. It causes pale green or yellow spots on the upper leaf surface and gray-purple mold on the lower surface."
+    },
+    'Tomato___Septoria_leaf_spot': {
+        'symptoms': "Small, circular spots with dark borders and light centers on leaves.",
+        'causes': "Fungus Septoria lycopersici.",
+        'reasons_for_cause': "Septoria leaf spot is caused by the fungus Septoria lycopersici, which survives in crop residue. Spores are spread by splashing water and infect new leaves.",
+        'precautions': "Practice crop rotation to reduce the buildup of inoculum in the soil. Remove and destroy infected leaves. Apply fungicides preventatively.",
+        'treatments': "Fungicides, removing infected leaves, crop rotation.",
+        'detailed_info': "Septoria leaf spot is a fungal disease that affects tomatoes. It causes small, circular spots with dark borders and light centers on leaves."
+    },
+    'Tomato___Spider_mites Two-spotted_spider_mite': {
+        'symptoms': "Fine webbing on leaves, yellowing or stippling.",
+        'causes': "Spider mites (Tetranychus urticae).",
+        'reasons_for_cause': "Spider mites are tiny pests that thrive in hot, dry conditions. They feed on plant sap, causing damage to leaves.",
+        'precautions': "Maintain adequate soil moisture. Control weeds, which can serve as alternate hosts. Introduce beneficial insects, such as predatory mites.",
+        'treatments': "Insecticides, miticides, biological control.",
+        'detailed_info': "Spider mites are tiny pests that can infest tomatoes. They cause fine webbing on leaves and yellowing or stippling."
+    },
+    'Tomato___Target_Spot': {
+        'symptoms': "Small, circular spots with concentric rings on leaves and fruit.",
+        'causes': "Fungus Corynespora cassiicola.",
+        'reasons_for_cause': "Target spot is caused by the fungus Corynespora cassiicola, which survives in crop residue. Spores are spread by wind and rain and infect new leaves and fruit.",
+        'precautions': "Practice crop rotation to reduce the buildup of inoculum in the soil. Apply fungicides preventatively.",
+        'treatments': "Fungicides, crop rotation.",
+        'detailed_info': "Target spot is a fungal disease that affects tomatoes. It causes small, circular spots with concentric rings on leaves and fruit."
+    },
+    'Tomato___Tomato_Yellow_Leaf_Curl_Virus': {
+        'symptoms': "Yellowing and curling of leaves, stunted growth.",
+        'causes': "Tomato yellow leaf curl virus (TYLCV).",
+        'reasons_for_cause': "Tomato yellow leaf curl virus (TYLCV) is transmitted by whiteflies. The virus infects tomato plants, causing yellowing and curling of leaves and stunted growth.",
+        'precautions': "Control whitefly populations with insecticides. Use resistant tomato varieties. Remove infected plants promptly.",
+        'treatments': "Insecticides to control whiteflies, resistant varieties.",
+        'detailed_info': "Tomato yellow leaf curl virus (TYLCV) is a viral disease that affects tomatoes. It causes yellowing and curling of leaves and stunted growth."
+    },
+    'Tomato___Tomato_mosaic_virus': {
+        'symptoms': "Mottled leaves, stunted growth, reduced fruit yield.",
+        'causes': "Tomato mosaic virus (ToMV).",
+        'reasons_for_cause': "Tomato mosaic virus (ToMV) is transmitted by contact. The virus infects tomato plants, causing mottled leaves, stunted growth, and reduced fruit yield.",
+        'precautions': "Use disease-free transplants. Wash hands and tools thoroughly after handling tomato plants. Remove infected plants promptly.",
+        'treatments': "Removing infected plants, sanitation.",
+        'detailed_info': "Tomato mosaic virus (ToMV) is a viral disease that affects tomatoes. It causes mottled leaves, stunted growth, and reduced fruit yield."
+    },
+    'Tomato___healthy': {
+        'symptoms': "No visible symptoms.",
+        'causes': "N/A",
+        'reasons_for_cause': "N/A",
+        'precautions': "Maintain good plant health through proper watering, fertilization, and pest control.",
+        'treatments': "N/A",
+        'detailed_info': "A healthy tomato plant exhibits vigorous growth, dark green leaves, and abundant, high-quality fruit."
+    }
+}
+
+# Detail texts per language, one for every language in TRANSLATIONS. To add
+# a translation, add a dict keyed like DISEASE_DETAILS to
+# disease_translations.py; any class or field it leaves out is shown in
+# English.
+DETAILS_BY_LANGUAGE = {
+    'English': DISEASE_DETAILS,
+    'Telugu': DISEASE_DETAILS_TELUGU,
+    'Tamil': DISEASE_DETAILS_TAMIL,
+}
+
+# The shared knowledge base for a model's labels, built on first use
+@lru_cache(maxsize=None)
+def _knowledge_base(class_names):
+    return KnowledgeBase(class_names, DETAILS_BY_LANGUAGE)
+
+def knowledge_base_for(class_names):
+    return _knowledge_base(tuple(class_names))
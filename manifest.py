@@ -0,0 +1,159 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from datasets import IMAGE_EXTENSIONS
+
+# Cached listing of a class-per-folder split, stored next to it as
+# <split>.manifest.json (outside the split, so writing it does not change the
+# split's own mtime). For every folder it records the folder's mtime, its
+# sub-folders and its images (size, mtime, content hash). Adding, removing or
+# renaming a file changes its folder's mtime, so bringing the manifest up to
+# date costs one stat per folder plus a scan of the folders that changed;
+# images in unchanged folders are not listed or stat'ed again.
+# datasets.list_labeled_images reads it instead of walking the tree, so
+# pipeline start-up does not grow with the number of images.
+#
+#     python manifest.py train valid            # build or update
+#     python manifest.py train --verify         # also re-stat every image
+MANIFEST_FORMAT = 1
+MANIFEST_SUFFIX = '.manifest.json'
+HASH_WORKERS = 16
+
+def manifest_path(directory):
+    return os.path.normpath(directory) + MANIFEST_SUFFIX
+
+def content_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_manifest(directory):
+    try:
+        with open(manifest_path(directory)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    if manifest.get('format') != MANIFEST_FORMAT:
+        return None
+    return manifest
+
+# Folder entries are keyed by path relative to the split ('' for the split
+# itself) and hold {'mtime', 'dirs', 'files': {name: [size, mtime, hash]}}.
+# Returns (manifest, folders rescanned, images hashed).
+def update_manifest(directory, verify=False, workers=HASH_WORKERS):
+    old = (load_manifest(directory) or {}).get('folders', {})
+    folders = {}
+    to_hash = []
+    rescanned = 0
+    pending = ['']
+    while pending:
+        relative = pending.pop()
+        path = os.path.join(directory, relative)
+        mtime = os.stat(path).st_mtime_ns
+        previous = old.get(relative)
+        if previous is not None and previous['mtime'] == mtime:
+            entry = {'mtime': mtime, 'dirs': previous['dirs'], 'files': dict(previous['files'])}
+            if verify:
+                for name, (size, file_mtime, _) in previous['files'].items():
+                    stat = os.stat(os.path.join(path, name))
+                    if (stat.st_size, stat.st_mtime_ns) != (size, file_mtime):
+                        to_hash.append((relative, name, stat))
+        else:
+            rescanned += 1
+            entry = {'mtime': mtime, 'dirs': [], 'files': {}}
+            known = previous['files'] if previous else {}
+            with os.scandir(path) as scan:
+                for item in scan:
+                    if item.is_dir():
+                        entry['dirs'].append(item.name)
+                    elif item.name.lower().endswith(IMAGE_EXTENSIONS):
+                        stat = item.stat()
+                        cached = known.get(item.name)
+                        if cached is not None and cached[:2] == [stat.st_size, stat.st_mtime_ns]:
+                            entry['files'][item.name] = cached
+                        else:
+                            to_hash.append((relative, item.name, stat))
+            entry['dirs'].sort()
+        folders[relative] = entry
+        pending.extend(os.path.join(relative, name) for name in entry['dirs'])
+
+    if to_hash:
+        with ThreadPoolExecutor(workers) as pool:
+            paths = [os.path.join(directory, relative, name) for relative, name, _ in to_hash]
+            for (relative, name, stat), digest in zip(to_hash, pool.map(content_hash, paths)):
+                folders[relative]['files'][name] = [stat.st_size, stat.st_mtime_ns, digest]
+
+    manifest = {'format': MANIFEST_FORMAT, 'folders': folders}
+    path = manifest_path(directory)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
+    return manifest, rescanned, len(to_hash)
+
+# True when no folder has changed since the manifest was written: one stat per
+# folder, independent of the number of images
+def is_current(directory, manifest):
+    for relative, entry in manifest['folders'].items():
+        try:
+            if os.stat(os.path.join(directory, relative)).st_mtime_ns != entry['mtime']:
+                return False
+        except FileNotFoundError:
+            return False
+    return True
+
+# (class folder names, [(path, class folder, size, mtime, hash)]) in
+# list_labeled_images order: class folders sorted, then folders by path and
+# files by name within each
+def entries(directory, manifest):
+    folders = manifest['folders']
+    class_folders = folders['']['dirs']
+    images = []
+    for class_folder in class_folders:
+        below = sorted((relative for relative in folders
+                        if relative == class_folder or relative.startswith(class_folder + os.sep)),
+                       key=lambda relative: os.path.join(directory, relative))
+        for relative in below:
+            for name in sorted(folders[relative]['files']):
+                size, mtime, digest = folders[relative]['files'][name]
+                images.append((os.path.join(directory, relative, name), class_folder, size, mtime, digest))
+    return class_folders, images
+
+# The manifest for directory, updated first if any folder changed. None when
+# the split has no manifest (or it cannot be rewritten), so callers fall back
+# to listing the directory.
+def current_manifest(directory):
+    manifest = load_manifest(directory)
+    if manifest is None or is_current(directory, manifest):
+        return manifest
+    try:
+        return update_manifest(directory)[0]
+    except OSError as e:
+        print(f'{manifest_path(directory)} is out of date and could not be updated: {e}', file=sys.stderr)
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or update the cached listing of dataset splits')
+    parser.add_argument('directories', nargs='+')
+    parser.add_argument('--verify', action='store_true',
+                        help='also re-stat every image to catch files modified in place')
+    parser.add_argument('--workers', type=int, default=HASH_WORKERS, help='threads hashing new images')
+    args = parser.parse_args()
+
+    for directory in args.directories:
+        start = time.perf_counter()
+        manifest, rescanned, hashed = update_manifest(directory, args.verify, args.workers)
+        images = sum(len(entry['files']) for entry in manifest['folders'].values())
+        print(f'{directory}: {images} images in {len(manifest["folders"])} folders '
+              f'({rescanned} rescanned, {hashed} hashed) in {time.perf_counter() - start:.2f}s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import datetime
+import hashlib
+import json
+import os
+
+# A model bundle is the saved model file plus a small JSON descriptor next to
+# it (trained_plant_disease_model.keras -> trained_plant_disease_model.bundle.json)
+# holding everything needed to use the model without the dataset: the ordered
+# class names, the input size and resize interpolation used in training, how
+# pixels are normalised, and a checksum of the model file so a model replaced
+# without its descriptor is caught at load time.
+#
+#     save_bundle(model, 'trained_plant_disease_model.keras', training_set.class_names)
+#     bundle = load_bundle('trained_plant_disease_model.keras')
+#     bundle['class_names'][index]
+BUNDLE_FORMAT = 1
+
+# The model rescales nothing itself: it is trained on raw 0-255 RGB floats
+DEFAULT_NORMALIZATION = {'scale': 1.0, 'offset': 0.0}
+
+class BundleError(ValueError):
+    pass
+
+def bundle_path(model_path):
+    return f'{os.path.splitext(model_path)[0]}.bundle.json'
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Write the descriptor for an already saved model file
+def write_bundle(model_path, class_names, image_size=(128, 128), interpolation='bilinear',
+                 color_mode='rgb', normalization=DEFAULT_NORMALIZATION):
+    checksum = file_checksum(model_path)
+    bundle = {
+        'format': BUNDLE_FORMAT,
+        'model_file': os.path.basename(model_path),
+        'version': checksum[:16],
+        'sha256': checksum,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'class_names': list(class_names),
+        'input_size': list(image_size),
+        'interpolation': interpolation,
+        'color_mode': color_mode,
+        'normalization': dict(normalization),
+    }
+    path = bundle_path(model_path)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(bundle, f, indent=2)
+    os.replace(tmp_path, path)
+    return bundle
+
+# Save a Keras model and its descriptor; used by the training notebook
+def save_bundle(model, model_path, class_names, **preprocessing):
+    output_classes = model.output_shape[-1]
+    if output_classes != len(class_names):
+        raise BundleError(f'Model has {output_classes} outputs but {len(class_names)} class names were given')
+    model.save(model_path)
+    return write_bundle(model_path, class_names, **preprocessing)
+
+# Parsed descriptors, keyed on path and modification time so a rewritten
+# bundle is picked up without re-reading an unchanged one on every call
+_loaded = {}
+
+# The descriptor for a model, or None for a model saved without one
+def load_bundle(model_path):
+    path = bundle_path(model_path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path) as f:
+        bundle = json.load(f)
+    if bundle.get('format') != BUNDLE_FORMAT:
+        raise BundleError(f'{path}: unsupported bundle format {bundle.get("format")!r}')
+    _loaded[path] = (mtime, bundle)
+    return bundle
+
+# Check that the model file is the one the descriptor was written for
+def verify_bundle(model_path, bundle):
+    if file_checksum(model_path) != bundle['sha256']:
+        raise BundleError(f'{model_path} does not match {bundle_path(model_path)}; '
+                          'the model was replaced without its bundle')
+
+# Write a bundle for a model saved before bundles existed. Class names are the
+# sorted class directories, the order image_dataset_from_directory assigned
+# during training.
+#
+#     python model_bundle.py trained_plant_disease_model.keras --class-dir valid
+def main():
+    parser = argparse.ArgumentParser(description='Write the bundle descriptor for a saved model')
+    parser.add_argument('model')
+    parser.add_argument('--class-dir', required=True, help='dataset directory with one subdirectory per class')
+    args = parser.parse_args()
+
+    class_names = sorted(entry.name for entry in os.scandir(args.class_dir) if entry.is_dir())
+    bundle = write_bundle(args.model, class_names)
+    print(f'Wrote {bundle_path(args.model)}: {len(class_names)} classes, version {bundle["version"]}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,395 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import inference
+import model_bundle
+
+# A registry is a directory of published model versions, one subdirectory per
+# version holding the model file, its bundle descriptor and any exported
+# serving artifacts:
+#
+#     models/
+#         3997ace321769794/trained_plant_disease_model.keras
+#         3997ace321769794/trained_plant_disease_model.bundle.json
+#         3997ace321769794/trained_plant_disease_model_int8.tflite
+#         3997ace321769794/published.json
+#
+# published.json holds the version's publish sequence number, which orders
+# the versions: publishing again (or activating) an existing version gives it
+# the next number, so rolling back is publishing the older model again.
+# ModelRegistry serves the most recently published version and watches the
+# directory. A newly published version is loaded and warmed up on a background thread and then swapped in
+# with a single reference assignment, so requests never wait on a load. With
+# shadow_fraction set, the new version first runs as a candidate on a sample
+# of live batches, and is promoted once its top-1 agreement with the active
+# version is known. An activated version skips shadowing and is swapped in
+# directly.
+#
+#     python model_registry.py publish trained_plant_disease_model.keras --registry models
+#     python model_registry.py activate 3997ace321769794 --registry models
+POLL_INTERVAL = 10.0
+SHADOW_WINDOW = 1000
+PUBLISHED_FILE = 'published.json'
+
+Version = namedtuple('Version', ['version', 'model_path', 'created', 'class_names', 'sequence', 'activate'])
+
+# (sequence, activate) of a version directory; (0, False) for versions
+# published before sequence numbers were recorded
+def read_published(version_dir):
+    try:
+        with open(os.path.join(version_dir, PUBLISHED_FILE)) as f:
+            published = json.load(f)
+    except FileNotFoundError:
+        return 0, False
+    return published['sequence'], published.get('activate', False)
+
+def write_published(version_dir, sequence, activate=False):
+    path = os.path.join(version_dir, PUBLISHED_FILE)
+    with open(f'{path}.tmp', 'w') as f:
+        json.dump({'sequence': sequence, 'activate': activate, 'time': time.time()}, f)
+    os.replace(f'{path}.tmp', path)
+
+# Published versions in publish order, the most recent last. A version counts
+# once its directory has been renamed into place, which publish() does last.
+# Bundle creation times only break ties between versions published before
+# sequence numbers were recorded.
+def list_versions(registry_dir):
+    versions = []
+    for entry in os.scandir(registry_dir):
+        if not entry.is_dir() or entry.name.startswith('.'):
+            continue
+        for name in os.listdir(entry.path):
+            if not name.endswith('.bundle.json'):
+                continue
+            model_path = os.path.join(entry.path, name[:-len('.bundle.json')])
+            try:
+                bundle = model_bundle.load_bundle(model_path)
+            except (OSError, ValueError):
+                continue
+            # Exported artifacts such as the _serving.keras model carry bundles
+            # of their own; only the published model's bundle names the
+            # directory
+            if bundle is None or bundle['version'] != entry.name:
+                continue
+            model_path = os.path.join(entry.path, bundle['model_file'])
+            try:
+                sequence, activate = read_published(entry.path)
+            except (OSError, ValueError, KeyError):
+                continue
+            versions.append(Version(bundle['version'], model_path, bundle['created'], tuple(bundle['class_names']),
+                                    sequence, activate))
+    return sorted(versions, key=publish_order)
+
+def publish_order(version):
+    return version.sequence, version.created, version.version
+
+def _next_sequence(registry_dir):
+    return max((v.sequence for v in list_versions(registry_dir)), default=0) + 1
+
+# Make an already published version the most recent one again. Watching
+# registries swap it in without shadowing it first.
+def activate(registry_dir, version):
+    target = os.path.join(registry_dir, version)
+    if not any(v.version == version for v in list_versions(registry_dir)):
+        raise FileNotFoundError(f'No published version {version} in {registry_dir}')
+    write_published(target, _next_sequence(registry_dir), activate=True)
+    return target
+
+# Copy a bundled model and its serving artifacts into the registry. Bundles
+# of other models next to it (such as the _serving.keras export) are left
+# behind, so the version directory holds one bundle. Files are staged in a
+# temporary directory and renamed into place, so the watcher never sees a
+# partial version. Publishing a version that is already in the
+# registry makes it the most recent one again (a rollback).
+def publish(model_path, registry_dir, activate=False):
+    bundle = model_bundle.load_bundle(model_path)
+    if bundle is None:
+        raise model_bundle.BundleError(f'{model_path} has no bundle; save it with model_bundle.save_bundle()')
+    model_bundle.verify_bundle(model_path, bundle)
+
+    target = os.path.join(registry_dir, bundle['version'])
+    if os.path.exists(target):
+        write_published(target, _next_sequence(registry_dir), activate)
+        return target
+    os.makedirs(registry_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.publish-', dir=registry_dir)
+    try:
+        source_dir = os.path.dirname(os.path.abspath(model_path))
+        base = os.path.splitext(os.path.basename(model_path))[0]
+        for name in os.listdir(source_dir):
+            if name.endswith('.bundle.json'):
+                continue
+            if name == os.path.basename(model_path) or name.startswith(f'{base}_'):
+                source = os.path.join(source_dir, name)
+                if os.path.isdir(source):
+                    shutil.copytree(source, os.path.join(staging, name))
+                else:
+                    shutil.copy2(source, staging)
+        shutil.copy2(model_bundle.bundle_path(model_path), staging)
+        write_published(staging, _next_sequence(registry_dir), activate)
+        os.rename(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return target
+
+# Top-1 agreement and latency of a candidate against the active version
+class ShadowStats:
+    def __init__(self, window=SHADOW_WINDOW):
+        self.images = 0
+        self.agreed = 0
+        self.active_ms = deque(maxlen=window)
+        self.candidate_ms = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, active_top1, candidate_top1, active_ms, candidate_ms):
+        with self._lock:
+            self.images += len(active_top1)
+            self.agreed += int(np.sum(active_top1 == candidate_top1))
+            self.active_ms.append(active_ms)
+            self.candidate_ms.append(candidate_ms)
+
+    def summary(self):
+        with self._lock:
+            def percentiles(values):
+                if not values:
+                    return None
+                return {'p50_ms': float(np.percentile(values, 50)), 'p99_ms': float(np.percentile(values, 99))}
+            return {
+                'images': self.images,
+                'agreement': self.agreed / self.images if self.images else None,
+                'active': percentiles(self.active_ms),
+                'candidate': percentiles(self.candidate_ms),
+            }
+
+# Loaded version: the warmed-up backend plus what it was loaded from
+Loaded = namedtuple('Loaded', ['version', 'model'])
+
+# Serves the active version through the backend interface (predict_on_batch,
+# warm_up), so it can stand in for a loaded model anywhere.
+class ModelRegistry:
+    def __init__(self, registry_dir, serving_mode=inference.SERVING_MODE, poll_interval=POLL_INTERVAL,
+                 shadow_fraction=0.0, promote_after=None, min_agreement=0.99, warm_up_sizes=None):
+        self.registry_dir = registry_dir
+        self.serving_mode = serving_mode
+        self.poll_interval = poll_interval
+        self.shadow_fraction = shadow_fraction
+        self.promote_after = promote_after
+        self.min_agreement = min_agreement
+        self.warm_up_sizes = warm_up_sizes
+
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._candidate = None
+        self._shadow = None
+        self._shadow_executor = ThreadPoolExecutor(1, thread_name_prefix='shadow')
+        self._shadow_pending = False
+        self._rejected = set()
+        self.history = []
+
+        versions = list_versions(registry_dir)
+        if not versions:
+            raise FileNotFoundError(f'No published model versions in {registry_dir}')
+        self._active = self._load(versions[-1])
+        self._record('serving', versions[-1].version)
+
+        self._stop = threading.Event()
+        self._watcher = threading.Thread(target=self._watch, name='model-registry', daemon=True)
+        self._watcher.start()
+
+    @property
+    def version(self):
+        return self._active.version.version
+
+    @property
+    def class_names(self):
+        return list(self._active.version.class_names)
+
+    # Called with the new version string after every swap, e.g. to re-key a
+    # prediction cache
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def predict_on_batch(self, batch):
+        active, candidate = self._active, self._candidate
+        start = time.perf_counter()
+        predictions = active.model.predict_on_batch(batch)
+        active_ms = (time.perf_counter() - start) * 1000
+        # At most one shadow batch is queued, so a slow candidate only lowers
+        # the sampled fraction instead of building a backlog
+        if candidate is not None and not self._shadow_pending and random.random() < self.shadow_fraction:
+            self._shadow_pending = True
+            self._shadow_executor.submit(self._score_shadow, candidate, np.array(batch, copy=True),
+                                         np.argmax(predictions, axis=1), active_ms)
+        return predictions
+
+    def warm_up(self, batch_sizes=(1, inference.BATCH_SIZE)):
+        self.warm_up_sizes = tuple(batch_sizes)
+        self._active.model.warm_up(batch_sizes)
+
+    def _load(self, version):
+        model = inference.load_model(version.model_path, self.serving_mode)
+        if self.warm_up_sizes:
+            model.warm_up(self.warm_up_sizes)
+        return Loaded(version, model)
+
+    def _record(self, event, version, **details):
+        self.history.append({'time': time.time(), 'event': event, 'version': version, **details})
+        print(f'model registry: {event} {version} {details or ""}'.rstrip(), file=sys.stderr)
+
+    def _score_shadow(self, candidate, batch, active_top1, active_ms):
+        try:
+            start = time.perf_counter()
+            predictions = candidate.model.predict_on_batch(batch)
+            candidate_ms = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            self._reject(candidate, f'shadow scoring failed: {e}')
+            return
+        finally:
+            self._shadow_pending = False
+        shadow = self._shadow
+        if candidate is not self._candidate or shadow is None:
+            return
+        shadow.record(active_top1, np.argmax(predictions, axis=1), active_ms, candidate_ms)
+
+        summary = shadow.summary()
+        if self.promote_after and summary['images'] >= self.promote_after:
+            if summary['agreement'] >= self.min_agreement:
+                self.promote()
+            else:
+                self._reject(candidate, f"agreement {summary['agreement']:.4f} below {self.min_agreement}")
+
+    # Make the candidate the active version
+    def promote(self):
+        with self._lock:
+            candidate, shadow = self._candidate, self._shadow
+            if candidate is None:
+                return False
+            self._swap(candidate, shadow.summary() if shadow else None)
+        return True
+
+    def _swap(self, loaded, shadow_summary=None):
+        self._active = loaded
+        self._candidate = None
+        self._shadow = None
+        self._record('promoted', loaded.version.version, shadow=shadow_summary)
+        for callback in self._listeners:
+            callback(loaded.version.version)
+
+    def _reject(self, candidate, reason):
+        with self._lock:
+            if self._candidate is candidate:
+                self._candidate = None
+                self._shadow = None
+            self._rejected.add(self._rejection_key(candidate.version))
+        self._record('rejected', candidate.version.version, reason=reason)
+
+    # Rejections are per publish, so publishing or activating a rejected
+    # version again retries it
+    def _rejection_key(self, version):
+        return version.version, version.sequence
+
+    def check(self):
+        versions = list_versions(self.registry_dir)
+        if not versions:
+            return
+        newest = versions[-1]
+        active, candidate = self._active, self._candidate
+        if newest.version == active.version.version:
+            with self._lock:
+                # Re-published while a newer one was shadowing: withdraw it
+                if self._candidate is not None:
+                    self._record('withdrawn', self._candidate.version.version)
+                    self._candidate = None
+                    self._shadow = None
+                self._active = Loaded(newest, active.model)
+            return
+        if candidate is not None and newest.version == candidate.version.version:
+            if newest.activate and newest.sequence != candidate.version.sequence:
+                with self._lock:
+                    if self._candidate is candidate:
+                        self._swap(Loaded(newest, candidate.model))
+            return
+        if self._rejection_key(newest) in self._rejected:
+            return
+        if publish_order(newest) <= publish_order(active.version):
+            return
+        # Labels feed the knowledge base and per-class output everywhere, so a
+        # version with a different label set needs a restart
+        if newest.class_names != active.version.class_names:
+            self._rejected.add(self._rejection_key(newest))
+            self._record('rejected', newest.version, reason='class names differ from the active version')
+            return
+
+        self._record('loading', newest.version)
+        try:
+            loaded = self._load(newest)
+        except Exception as e:
+            self._rejected.add(self._rejection_key(newest))
+            self._record('rejected', newest.version, reason=f'load failed: {e}')
+            return
+        with self._lock:
+            if self.shadow_fraction > 0 and not newest.activate:
+                self._candidate = loaded
+                self._shadow = ShadowStats()
+                self._record('shadowing', newest.version, fraction=self.shadow_fraction)
+            else:
+                self._swap(loaded)
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f'model registry: check failed: {e}', file=sys.stderr)
+
+    def status(self):
+        candidate, shadow = self._candidate, self._shadow
+        return {
+            'active': self._active.version.version,
+            'candidate': candidate.version.version if candidate else None,
+            'shadow': shadow.summary() if shadow else None,
+            'rejected': sorted({version for version, _ in self._rejected}),
+            'history': self.history[-20:],
+        }
+
+    def close(self):
+        self._stop.set()
+        self._shadow_executor.shutdown(wait=False)
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the model registry directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    publish_parser = subparsers.add_parser('publish', help='copy a bundled model into the registry')
+    publish_parser.add_argument('model')
+    publish_parser.add_argument('--registry', required=True)
+    publish_parser.add_argument('--activate', action='store_true',
+                                help='swap it in without shadowing it first')
+    activate_parser = subparsers.add_parser('activate', help='serve an already published version again')
+    activate_parser.add_argument('version')
+    activate_parser.add_argument('--registry', required=True)
+    list_parser = subparsers.add_parser('list', help='list published versions')
+    list_parser.add_argument('--registry', required=True)
+    args = parser.parse_args()
+
+    if args.command == 'publish':
+        print(f'Published {publish(args.model, args.registry, args.activate)}')
+    elif args.command == 'activate':
+        print(f'Activated {activate(args.registry, args.version)}')
+    else:
+        for version in list_versions(args.registry):
+            print(f'{version.sequence:4d}  {version.version}  {version.created}  {version.model_path}')
+
+if __name__ == '__main__':
+    main()
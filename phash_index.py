@@ -0,0 +1,265 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from augmentation import split_variant
+from datasets import IMAGE_EXTENSIONS, TRAIN_DIR, VALID_DIR
+
+# Near-duplicate index over the dataset splits. Every image gets a 64-bit DCT
+# perceptual hash that is the same for all eight quarter-turn/flip
+# orientations of a picture, and a group: the UUID its file name starts with
+# (all the _90deg/_flipTB/... copies of a leaf share it), merged with any
+# image whose hash is within a few bits. The index is stored next to the
+# splits and only new or changed files are hashed on each update.
+#
+# Groups found in more than one split are leakage: the same leaf is trained on
+# and then scored as unseen. The split command writes a grouped split, every
+# group entirely in train or entirely in valid, as a symlink tree the loaders
+# read like the original folders.
+#
+#     python phash_index.py update --root "Project....4/Disease"
+#     python phash_index.py report --root "Project....4/Disease"
+#     python phash_index.py split --root "Project....4/Disease" --output grouped --valid-fraction 0.2
+INDEX_FORMAT = 1
+INDEX_FILE = 'phash_index.json'
+HASH_SIZE = 8
+DCT_SIZE = 32
+MAX_DISTANCE = 4
+# Hash bands for candidate search: two hashes within MAX_DISTANCE bits agree
+# exactly on at least one of MAX_DISTANCE + 1 bands
+BANDS = MAX_DISTANCE + 1
+# Bands shared by more images than this (e.g. a blank background) are not
+# compared pairwise
+MAX_BUCKET = 5000
+
+_UUID = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+def _dct_matrix(n):
+    k = np.arange(n)
+    matrix = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+_DCT = _dct_matrix(DCT_SIZE)
+# Mirroring an image negates its odd-frequency DCT coefficients along that axis
+_SIGNS = (-1.0) ** np.arange(HASH_SIZE)
+
+# Smallest of the pHashes of the eight orientations of the image, all taken
+# from one DCT: flips flip coefficient signs, a transpose transposes them
+def perceptual_hash(path):
+    with Image.open(path) as img:
+        img.draft('L', (DCT_SIZE * 2, DCT_SIZE * 2))
+        pixels = np.asarray(img.convert('L').resize((DCT_SIZE, DCT_SIZE), Image.BILINEAR), dtype=np.float64)
+    low = (_DCT @ pixels @ _DCT.T)[:HASH_SIZE, :HASH_SIZE]
+
+    weights = 1 << np.arange(HASH_SIZE * HASH_SIZE - 1, -1, -1, dtype=np.uint64)
+    hashes = []
+    for block in (low, low.T):
+        for rows in (1.0, _SIGNS[:, None]):
+            for columns in (1.0, _SIGNS[None, :]):
+                oriented = block * rows * columns
+                bits = (oriented > np.median(oriented)).ravel()
+                hashes.append(int(np.sum(weights[bits])))
+    return min(hashes)
+
+def group_key(path):
+    name = os.path.basename(path)
+    match = _UUID.match(name)
+    return match.group(0).lower() if match else split_variant(name)[0]
+
+# Class-per-folder images of each split, as paths relative to root
+def scan(root, splits):
+    found = {}
+    for split in splits:
+        top = os.path.join(root, split)
+        for directory, _, files in os.walk(top):
+            for name in files:
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    path = os.path.join(directory, name)
+                    relative = os.path.relpath(path, root).replace(os.sep, '/')
+                    if relative.count('/') >= 2:
+                        stat = os.stat(path)
+                        found[relative] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+def _hash_file(path):
+    try:
+        return f'{perceptual_hash(path):016x}'
+    except (OSError, ValueError):
+        return None
+
+def load_index(root):
+    try:
+        with open(os.path.join(root, INDEX_FILE)) as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return {'format': INDEX_FORMAT, 'images': {}}
+    if index.get('format') != INDEX_FORMAT:
+        raise ValueError(f'{INDEX_FILE}: unsupported index format {index.get("format")!r}')
+    return index
+
+# Bring the stored index up to date with the files on disk: hash new or
+# modified files on worker processes, forget deleted ones. Entries are
+# [size, mtime_ns, hash]; hash is None for files that could not be read.
+def update_index(root, splits=(TRAIN_DIR, VALID_DIR), workers=None):
+    index = load_index(root)
+    images = index['images']
+    found = scan(root, splits)
+    stale = [path for path, stat in found.items() if path not in images or tuple(images[path][:2]) != stat]
+    removed = [path for path in images if path not in found and path.split('/', 1)[0] in splits]
+
+    if stale:
+        with ProcessPoolExecutor(workers) as pool:
+            hashes = pool.map(_hash_file, [os.path.join(root, path) for path in stale], chunksize=64)
+            for path, value in zip(stale, hashes):
+                images[path] = [*found[path], value]
+    for path in removed:
+        del images[path]
+
+    fd, tmp_path = tempfile.mkstemp(dir=root, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, os.path.join(root, INDEX_FILE))
+    return index, len(stale), len(removed)
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Bit differences between uint64 hash arrays (broadcast)
+def hamming(a, b):
+    xor = np.bitwise_xor(a, b)
+    return _POPCOUNT[xor.view(np.uint8)].reshape(*xor.shape, 8).sum(-1)
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        i, j = self.find(i), self.find(j)
+        if i != j:
+            self.parent[max(i, j)] = min(i, j)
+
+# Group id for every hashed image: file-name groups merged with perceptual
+# near-duplicates. Returns (paths, group ids) with ids named after the
+# group's smallest file-name key, so they are stable across updates.
+def find_groups(index, max_distance=MAX_DISTANCE):
+    paths = sorted(path for path, entry in index['images'].items() if entry[2] is not None)
+    hashes = np.array([int(index['images'][path][2], 16) for path in paths], dtype=np.uint64)
+    keys = [group_key(path) for path in paths]
+    groups = _UnionFind(len(paths))
+
+    first = {}
+    for i, key in enumerate(keys):
+        groups.union(first.setdefault(key, i), i)
+
+    band_bits = 64 // BANDS
+    for band in range(BANDS):
+        values = (hashes >> np.uint64(band * band_bits)) & np.uint64((1 << band_bits) - 1)
+        buckets = defaultdict(list)
+        for i, value in enumerate(values.tolist()):
+            buckets[value].append(i)
+        for members in buckets.values():
+            if len(members) < 2 or len(members) > MAX_BUCKET:
+                continue
+            members = np.array(members)
+            distances = hamming(hashes[members][:, None], hashes[members][None, :])
+            for a, b in zip(*np.nonzero(np.triu(distances <= max_distance, 1))):
+                groups.union(int(members[a]), int(members[b]))
+
+    names = {}
+    for i in range(len(paths)):
+        root = groups.find(i)
+        names[root] = min(names.get(root, keys[i]), keys[i])
+    return paths, [names[groups.find(i)] for i in range(len(paths))]
+
+def split_of(path):
+    return path.split('/', 1)[0]
+
+# Groups present in more than one split, and how many images of each split
+# belong to them
+def leakage(paths, group_ids):
+    splits_of = defaultdict(set)
+    for path, group in zip(paths, group_ids):
+        splits_of[group].add(split_of(path))
+    leaked = {group for group, splits in splits_of.items() if len(splits) > 1}
+    images = Counter(split_of(path) for path, group in zip(paths, group_ids) if group in leaked)
+    return leaked, images
+
+# Deterministic group -> split assignment from a hash of the group id, so a
+# group keeps its side as images are added
+def assign_split(group, valid_fraction, seed=0):
+    digest = hashlib.sha1(f'{seed}:{group}'.encode('utf-8')).digest()
+    return VALID_DIR if int.from_bytes(digest[:8], 'big') / 2**64 < valid_fraction else TRAIN_DIR
+
+# Write output/<split>/<class>/<file> symlinks for a grouped split, replacing
+# any earlier split there (stale links could put a group on both sides)
+def write_split(root, paths, group_ids, output, valid_fraction, seed=0):
+    for split in (TRAIN_DIR, VALID_DIR):
+        shutil.rmtree(os.path.join(output, split), ignore_errors=True)
+    counts = Counter()
+    for path, group in zip(paths, group_ids):
+        split = assign_split(group, valid_fraction, seed)
+        # Keeps any nesting below the class folder, which the loaders walk
+        target = os.path.join(output, split, *path.split('/')[1:])
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.symlink(os.path.abspath(os.path.join(root, path)), target)
+        counts[split] += 1
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description='Perceptual-hash index, leakage report and grouped split')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, help_text in (('update', 'hash new and changed images'), ('report', 'report cross-split leakage'),
+                            ('split', 'write a leak-free grouped split')):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('--root', default='.', help='dataset root holding the split folders and the index')
+        sub.add_argument('--splits', nargs='+', default=[TRAIN_DIR, VALID_DIR])
+        sub.add_argument('--workers', type=int, default=os.cpu_count())
+        sub.add_argument('--max-distance', type=int, default=MAX_DISTANCE,
+                         help=f'hash bits two near-duplicates may differ in (at most {MAX_DISTANCE})')
+        if name == 'split':
+            sub.add_argument('--output', required=True)
+            sub.add_argument('--valid-fraction', type=float, default=0.2)
+            sub.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    if args.max_distance > MAX_DISTANCE:
+        parser.error(f'--max-distance above {MAX_DISTANCE} needs more hash bands')
+
+    index, hashed, removed = update_index(args.root, args.splits, args.workers)
+    unreadable = sum(1 for entry in index['images'].values() if entry[2] is None)
+    print(f'{len(index["images"])} images indexed ({hashed} hashed, {removed} removed, {unreadable} unreadable)',
+          file=sys.stderr)
+    if args.command == 'update':
+        return
+
+    paths, group_ids = find_groups(index, args.max_distance)
+    if args.command == 'report':
+        leaked, images = leakage(paths, group_ids)
+        sizes = Counter(group_ids)
+        print(f'{len(sizes)} groups, {sum(1 for size in sizes.values() if size > 1)} with more than one image')
+        print(f'{len(leaked)} groups span more than one split')
+        for split in args.splits:
+            total = sum(1 for path in paths if split_of(path) == split)
+            share = images[split] / total if total else 0.0
+            print(f'  {split}: {images[split]} of {total} images ({share:.1%}) are in a leaked group')
+    else:
+        counts = write_split(args.root, paths, group_ids, args.output, args.valid_fraction, args.seed)
+        print(f'Wrote {counts[TRAIN_DIR]} train and {counts[VALID_DIR]} valid links to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+# Prediction cache keyed by a hash of the raw image bytes plus the model
+# version, so the same photo uploaded from any session or client is scored once
+# per model. Memory is an LRU bounded by entry count and bytes; an optional
+# directory tier keeps results across restarts.
+class PredictionCache:
+    def __init__(self, model_version, max_entries=10000, max_bytes=16 * 1024 * 1024, disk_dir=None):
+        self.model_version = model_version
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # Re-key for a newly deployed model; entries for the old version are
+    # dropped from memory (on disk they are simply never looked up again)
+    def set_model_version(self, model_version):
+        with self._lock:
+            self.model_version = model_version
+            self._entries.clear()
+            self._bytes = 0
+
+    def key_for(self, image_bytes):
+        digest = hashlib.blake2b(self.model_version.encode('utf-8'), digest_size=20)
+        digest.update(image_bytes)
+        return digest.hexdigest()
+
+    def lookup(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+        result = self._load_from_disk(key)
+        if result is not None:
+            self._store(key, result)
+            with self._lock:
+                self.hits += 1
+        return result
+
+    def put(self, key, result):
+        result = np.array(result, copy=True)
+        result.setflags(write=False)
+        self._save_to_disk(key, result)
+        self._store(key, result)
+        return result
+
+    # Return the cached result for image_bytes, computing it with
+    # compute(image_bytes) on a miss. Concurrent callers with the same image
+    # wait on the first caller's computation instead of running their own.
+    def get_or_compute(self, image_bytes, compute):
+        key = self.key_for(image_bytes)
+        result = self.lookup(key)
+        if result is not None:
+            return result
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+                self.misses += 1
+        if not owner:
+            return future.result()
+
+        try:
+            result = self.put(key, compute(image_bytes))
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _store(self, key, result):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = result
+            self._bytes += result.nbytes
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key[:2], f'{key}.npy')
+
+    def _load_from_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            result = np.load(self._disk_path(key))
+        except (OSError, ValueError):
+            return None
+        result.setflags(write=False)
+        return result
+
+    # Write through a temporary file so readers never see a partial entry
+    def _save_to_disk(self, key, result):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, result)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
@@ -0,0 +1,75 @@
+import os
+import signal
+import sys
+import time
+
+import backends
+import inference
+
+# Prefork deployment: the parent imports the serving runtime once, then forks
+# the workers, so the TensorFlow / TFLite libraries and their import-time heap
+# are shared copy-on-write instead of being loaded by every replica. That is
+# all that is shared. Every worker loads its own copy of the weights after the
+# fork, in every serving mode: TensorFlow's thread pools do not survive fork(),
+# so no model may be loaded or run in the parent. With a tflite-* mode the
+# .tflite file is mmapped and its pages sit once in the page cache, but the
+# weights the interpreter computes with are private to each worker: XNNPACK
+# repacks them at load and float16 models are expanded to float32.
+
+# Import the runtime of the backend a serving mode resolves to
+def preload(model_path=inference.MODEL_PATH, serving_mode=inference.SERVING_MODE):
+    name, _ = inference.resolve_serving_mode(model_path, serving_mode)
+    backends.BACKENDS[name].preload()
+
+# Fork count workers running target(index) and restart any that exit, until
+# the parent gets SIGINT or SIGTERM, which is passed on to every worker
+def run_workers(count, target):
+    children = {}
+
+    def spawn(index):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                target(index)
+            except KeyboardInterrupt:
+                pass
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        children[pid] = index
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for index in range(count):
+        spawn(index)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        index = children.pop(pid)
+        if not stopping:
+            print(f'Worker {index} (pid {pid}) exited with status {status}, restarting', file=sys.stderr)
+            time.sleep(1)  # don't spin if a worker fails on start-up
+            if not stopping:
+                spawn(index)
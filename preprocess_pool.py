@@ -0,0 +1,117 @@
+import multiprocessing
+import os
+import threading
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from inference import BATCH_SIZE, IMAGE_SIZE, decode_image
+
+# Images handed to one worker task; small enough to spread a single batch over
+# many cores, large enough to amortise the task round trip
+IMAGES_PER_TASK = 4
+
+# Set in each worker process by _attach()
+_worker_shm = None
+_worker_batches = None
+
+def _attach(shm_name, shape):
+    global _worker_batches, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_batches = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+
+# Decode a run of images straight into rows of a shared batch slot; only the
+# row errors travel back through the pipe
+def _decode_into(slot, row, sources):
+    errors = {}
+    for offset, source in enumerate(sources):
+        try:
+            if not isinstance(source, bytes):
+                with open(source, 'rb') as f:
+                    source = f.read()
+            _worker_batches[slot, row + offset] = decode_image(source, dtype=np.uint8)
+        except Exception as e:
+            _worker_batches[slot, row + offset] = 0
+            errors[row + offset] = f'{type(e).__name__}: {e}'
+    return errors
+
+# Decodes and resizes images on a pool of worker processes. Workers write
+# uint8 pixels into a ring of batch slots in one shared-memory block, so the
+# decoded batches reach the caller without being pickled or copied, and several
+# batches are decoded ahead of the one being consumed.
+#
+#     with PreprocessPool() as pool:
+#         for batch, count, errors in pool.map_batches(paths):
+#             predictions = model.predict_on_batch(batch)[:count]
+class PreprocessPool:
+    def __init__(self, workers=None, batch_size=BATCH_SIZE, prefetch=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.slots = prefetch or max(2, 2 * self.workers * IMAGES_PER_TASK // batch_size)
+
+        shape = (self.slots, batch_size, *IMAGE_SIZE, 3)
+        self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        self._batches = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+        # spawn keeps workers free of any TensorFlow state in the parent
+        context = multiprocessing.get_context('spawn')
+        self._pool = context.Pool(self.workers, initializer=_attach, initargs=(self._shm.name, shape))
+        # The batch slots are shared by every map_batches call, so calls from
+        # several threads (e.g. Streamlit sessions sharing one pool) run one at
+        # a time
+        self._lock = threading.Lock()
+
+    def _submit(self, slot, sources):
+        return [
+            self._pool.apply_async(_decode_into, (slot, row, sources[row:row + IMAGES_PER_TASK]))
+            for row in range(0, len(sources), IMAGES_PER_TASK)
+        ]
+
+    # Yield (batch, count, errors) per batch_size images, in input order.
+    # sources are file paths or raw image bytes. batch is a uint8 view into
+    # shared memory that stays valid until the next batch is requested; rows
+    # past count are stale, and errors maps failed rows to a message (those
+    # rows are zero-filled). The pool is held from the first batch until the
+    # generator is exhausted or closed, so close it when stopping early.
+    def map_batches(self, sources):
+        sources = list(sources)
+        chunks = [sources[i:i + self.batch_size] for i in range(0, len(sources), self.batch_size)]
+        with self._lock:
+            in_flight = deque()
+            next_chunk = 0
+            try:
+                for slot in range(min(self.slots, len(chunks))):
+                    in_flight.append((slot, len(chunks[next_chunk]), self._submit(slot, chunks[next_chunk])))
+                    next_chunk += 1
+
+                while in_flight:
+                    slot, count, tasks = in_flight[0]
+                    errors = {}
+                    for task in tasks:
+                        errors.update(task.get())
+                    in_flight.popleft()
+                    yield self._batches[slot], count, errors
+
+                    # The caller is done with this slot once it asks for the next batch
+                    if next_chunk < len(chunks):
+                        in_flight.append((slot, len(chunks[next_chunk]), self._submit(slot, chunks[next_chunk])))
+                        next_chunk += 1
+            finally:
+                # Stopped early: let the decodes already queued finish before
+                # the next call reuses their slots
+                for _, _, tasks in in_flight:
+                    for task in tasks:
+                        task.wait()
+
+    def close(self):
+        self._pool.terminate()
+        self._pool.join()
+        self._batches = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
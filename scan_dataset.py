@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from datasets import IMAGE_EXTENSIONS, TRAIN_DIR, VALID_DIR
+from manifest import HASH_WORKERS, content_hash
+
+# Integrity pass over the dataset splits, meant to be run before training.
+# Every image is fully decoded on worker processes (a truncated JPEG otherwise
+# only fails inside model.fit, possibly hours into an epoch) and its format,
+# mode and size checked. Every file is checked against its label folder:
+# non-image files (.DS_Store, notebooks and their .ipynb_checkpoints), files
+# outside a class folder, folders that are not a known class and class folders
+# nested inside another class (whose images the loaders label with the outer
+# class) are all reported. Bad files are moved out of the splits into a
+# quarantine folder, keeping their relative paths, and listed in a JSON report.
+#
+# Decoding results are cached in the dataset root by content hash, and file
+# hashes by size and mtime, so a rerun only reads and decodes new or changed
+# files.
+#
+#     python scan_dataset.py --root "Project....4/Disease" --dry-run
+#     python scan_dataset.py --root "Project....4/Disease"
+CACHE_FORMAT = 1
+CACHE_FILE = 'scan_cache.json'
+REPORT_FILE = 'scan_report.json'
+QUARANTINE_DIR = 'quarantine'
+# Formats tf.io.decode_image reads, and modes whose channels=3 decode is the
+# picture as viewed (CMYK or 16-bit images decode to different colours)
+DECODABLE_FORMATS = ('BMP', 'GIF', 'JPEG', 'PNG')
+COLOUR_MODES = ('1', 'L', 'LA', 'P', 'RGB', 'RGBA')
+MIN_SIDE = 32
+
+# Decode one image completely. Returns [error, format, mode, width, height];
+# error is None for a readable image and the other fields None for an
+# unreadable one. Truncated files raise instead of being padded with grey.
+def decode_image(path):
+    from PIL import Image, ImageFile
+
+    ImageFile.LOAD_TRUNCATED_IMAGES = False
+    try:
+        with Image.open(path) as img:
+            img.load()
+            return [None, img.format, img.mode, img.width, img.height]
+    except Exception as e:
+        return [f'{type(e).__name__}: {e}', None, None, None, None]
+
+def load_cache(root):
+    try:
+        with open(os.path.join(root, CACHE_FILE)) as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {'format': CACHE_FORMAT, 'files': {}, 'images': {}}
+    if cache.get('format') != CACHE_FORMAT:
+        raise ValueError(f'{CACHE_FILE}: unsupported cache format {cache.get("format")!r}')
+    return cache
+
+def save_cache(root, cache):
+    fd, tmp_path = tempfile.mkstemp(dir=root, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, os.path.join(root, CACHE_FILE))
+
+# Every file in each split as {path relative to root: (size, mtime_ns)}
+def scan(root, splits):
+    found = {}
+    for split in splits:
+        for directory, _, files in os.walk(os.path.join(root, split)):
+            for name in files:
+                path = os.path.join(directory, name)
+                stat = os.stat(path)
+                found[os.path.relpath(path, root).replace(os.sep, '/')] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+def is_image_name(path):
+    return path.lower().endswith(IMAGE_EXTENSIONS)
+
+# Bring the cache up to date with the files on disk: hash new or modified
+# images on threads, decode contents not seen before on worker processes and
+# forget deleted files. Returns (cache, images hashed, images decoded).
+def update_cache(root, found, workers=None):
+    cache = load_cache(root)
+    files, images = cache['files'], cache['images']
+    images_found = {path: stat for path, stat in found.items() if is_image_name(path)}
+    stale = [path for path, stat in images_found.items()
+             if path not in files or tuple(files[path][:2]) != stat]
+
+    with ThreadPoolExecutor(HASH_WORKERS) as pool:
+        digests = pool.map(content_hash, [os.path.join(root, path) for path in stale])
+        for path, digest in zip(stale, digests):
+            files[path] = [*images_found[path], digest]
+    for path in [path for path in files if path not in images_found]:
+        del files[path]
+
+    # One decode per distinct content, however many copies of it there are
+    first_path = {}
+    for path in sorted(files):
+        digest = files[path][2]
+        if digest not in images:
+            first_path.setdefault(digest, path)
+    if first_path:
+        with ProcessPoolExecutor(workers) as pool:
+            results = pool.map(decode_image, [os.path.join(root, path) for path in first_path.values()],
+                               chunksize=64)
+            for digest, result in zip(first_path, results):
+                images[digest] = result
+    used = {entry[2] for entry in files.values()}
+    for digest in [digest for digest in images if digest not in used]:
+        del images[digest]
+
+    save_cache(root, cache)
+    return cache, len(stale), len(first_path)
+
+# The first problem with a file, as (kind, detail), or None when it is fine.
+# class_names are the folders a split may have; a class folder found nested
+# below another one means its images are labelled with the outer class.
+def find_problem(path, cache, class_names, min_side=MIN_SIDE):
+    parts = path.split('/')
+    if len(parts) < 3:
+        return 'stray', 'not inside a class folder'
+    if not is_image_name(path):
+        return 'stray', 'not an image file'
+    if parts[1] not in class_names:
+        return 'label', f'{parts[1]} is not a known class'
+    nested = [part for part in parts[2:-1] if part in class_names]
+    if nested:
+        return 'label', f'in a {nested[-1]} folder inside {parts[1]}'
+
+    size, _, digest = cache['files'][path]
+    if size == 0:
+        return 'unreadable', 'empty file'
+    error, image_format, mode, width, height = cache['images'][digest]
+    if error is not None:
+        return 'unreadable', error
+    if image_format not in DECODABLE_FORMATS:
+        return 'format', f'{image_format} cannot be decoded by the input pipeline'
+    if mode not in COLOUR_MODES:
+        return 'mode', f'{mode} image, the input pipeline expects RGB'
+    if min(width, height) < min_side:
+        return 'size', f'{width}x{height} is smaller than {min_side}px'
+    return None
+
+# Move path (relative to root) to the same relative path under quarantine,
+# never overwriting an earlier quarantined file. Returns the new location.
+def quarantine_file(root, path, quarantine):
+    target = os.path.join(quarantine, *path.split('/'))
+    stem, extension = os.path.splitext(target)
+    number = 1
+    while os.path.lexists(target):
+        target = f'{stem}.{number}{extension}'
+        number += 1
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    shutil.move(os.path.join(root, path), target)
+    return target
+
+# Remove the folders below the class folders that quarantining left empty,
+# deepest first; the split and class folders themselves are kept
+def remove_empty_folders(root, paths):
+    folders = {os.path.dirname(path) for path in paths}
+    for folder in sorted(folders, key=lambda folder: folder.count('/'), reverse=True):
+        while folder.count('/') >= 2:
+            directory = os.path.join(root, *folder.split('/'))
+            if not os.path.isdir(directory) or os.listdir(directory):
+                break
+            os.rmdir(directory)
+            folder = os.path.dirname(folder)
+
+def main():
+    parser = argparse.ArgumentParser(description='Decode every image, quarantine corrupt and stray files')
+    parser.add_argument('--root', default='.', help='dataset root holding the split folders and the cache')
+    parser.add_argument('--splits', nargs='+', default=[TRAIN_DIR, VALID_DIR])
+    parser.add_argument('--class-names-from', metavar='MODEL',
+                        help='bundled model whose classes the folders must be (default: any folder in a split)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='processes decoding images')
+    parser.add_argument('--min-side', type=int, default=MIN_SIDE, help='smallest acceptable width or height')
+    parser.add_argument('--quarantine', help=f'where bad files are moved (default: {QUARANTINE_DIR} in the root)')
+    parser.add_argument('--report', help=f'JSON report to write (default: {REPORT_FILE} in the root)')
+    parser.add_argument('--dry-run', action='store_true', help='report problems but move nothing')
+    args = parser.parse_args()
+
+    if args.class_names_from:
+        import inference
+
+        class_names = set(inference.get_class_names(args.class_names_from))
+    else:
+        class_names = {entry.name for split in args.splits for entry in os.scandir(os.path.join(args.root, split))
+                       if entry.is_dir() and not entry.name.startswith('.')}
+    quarantine = args.quarantine or os.path.join(args.root, QUARANTINE_DIR)
+
+    start = time.perf_counter()
+    found = scan(args.root, args.splits)
+    cache, hashed, decoded = update_cache(args.root, found, args.workers)
+    problems = []
+    for path in sorted(found):
+        problem = find_problem(path, cache, class_names, args.min_side)
+        if problem is not None:
+            problems.append({'path': path, 'problem': problem[0], 'detail': problem[1]})
+    elapsed = time.perf_counter() - start
+
+    if not args.dry_run:
+        for entry in problems:
+            entry['quarantined_to'] = quarantine_file(args.root, entry['path'], quarantine)
+        remove_empty_folders(args.root, [entry['path'] for entry in problems])
+
+    images = Counter(tuple(result[1:]) for result in cache['images'].values() if result[0] is None)
+    report = {
+        'files': len(found),
+        'images': sum(1 for path in found if is_image_name(path)),
+        'problems': Counter(entry['problem'] for entry in problems),
+        'quarantined': 0 if args.dry_run else len(problems),
+        'formats': {f'{image_format} {mode} {width}x{height}': count
+                    for (image_format, mode, width, height), count in images.most_common()},
+        'files_with_problems': problems,
+    }
+    with open(args.report or os.path.join(args.root, REPORT_FILE), 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f'{len(found)} files checked in {elapsed:.1f}s ({hashed} hashed, {decoded} decoded)', file=sys.stderr)
+    # One line per kind of problem and folder; every file is in the report
+    grouped = {}
+    for entry in problems:
+        grouped.setdefault((entry['problem'], os.path.dirname(entry['path'])), []).append(entry)
+    for (problem, folder), entries in grouped.items():
+        details = {entry['detail'] for entry in entries}
+        where = entries[0]['path'] if len(entries) == 1 else f'{folder}/ ({len(entries)} files)'
+        print(f'{problem:10s} {where}' + (f': {details.pop()}' if len(details) == 1 else ''))
+    action = 'found' if args.dry_run else f'moved to {quarantine}'
+    print(f'{len(problems)} bad files {action}')
+
+if __name__ == '__main__':
+    main()
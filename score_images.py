@@ -0,0 +1,63 @@
+import argparse
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+
+import inference
+from datasets import IMAGE_EXTENSIONS
+from preprocess_pool import PreprocessPool
+
+# Scores every image under a directory and writes one CSV row per image.
+# Decoding runs on a pool of worker processes that keep several batches ahead
+# of the model, so inference does not wait on JPEG decode.
+#
+#     python score_images.py photos/ --output predictions.csv --workers 32
+def find_images(directory):
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files
+                     if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS)
+    return sorted(paths)
+
+def main():
+    parser = argparse.ArgumentParser(description='Score a directory of leaf images')
+    parser.add_argument('directory')
+    parser.add_argument('--output', default='predictions.csv')
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--serving-mode', choices=inference.SERVING_MODES, default=inference.SERVING_MODE)
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='decode processes')
+    parser.add_argument('--batch-size', type=int, default=inference.BATCH_SIZE)
+    args = parser.parse_args()
+
+    paths = find_images(args.directory)
+    if not paths:
+        sys.exit(f'No images found under {args.directory}')
+    model = inference.load_model(args.model, args.serving_mode)
+    class_names = inference.get_class_names(args.model)
+
+    start = time.perf_counter()
+    failed = 0
+    with PreprocessPool(args.workers, args.batch_size) as pool, open(args.output, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['path', 'prediction', 'confidence', 'error'])
+        offset = 0
+        for batch, count, errors in pool.map_batches(paths):
+            probabilities = inference.predict_batch(model, batch)[:count]
+            for row, p in enumerate(probabilities):
+                path = paths[offset + row]
+                if row in errors:
+                    writer.writerow([path, '', '', errors[row]])
+                    failed += 1
+                else:
+                    index = int(np.argmax(p))
+                    writer.writerow([path, class_names[index], f'{p[index]:.4f}', ''])
+            offset += count
+    elapsed = time.perf_counter() - start
+    print(f'Scored {len(paths) - failed} images ({failed} failed) in {elapsed:.1f}s '
+          f'({len(paths) / elapsed:.1f} img/s) -> {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import argparse
+import os
+
+import inference
+import prefork
+
+# Runs several replicas of the Streamlit app on consecutive ports, forked from
+# one parent that has already imported Streamlit and the serving runtime, so
+# the replicas share those libraries instead of each importing its own copy.
+# Each replica still loads the model weights itself (see prefork.py). Put the
+# ports behind the load balancer as before.
+#
+#     PLANT_SERVING_MODE=tflite-int8 python serve_streamlit.py --replicas 4 --port 8501
+def run_replica(port):
+    from streamlit.web import bootstrap
+
+    flag_options = {'server_port': port, 'server_headless': True}
+    bootstrap.load_config_options(flag_options)
+    main_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    bootstrap.run(main_script, False, [], flag_options)
+
+def main():
+    parser = argparse.ArgumentParser(description='Prefork several Streamlit replicas that share the serving runtime')
+    parser.add_argument('--replicas', type=int, default=os.cpu_count())
+    parser.add_argument('--port', type=int, default=8501, help='port of the first replica')
+    args = parser.parse_args()
+
+    import streamlit.web.bootstrap  # noqa: F401
+    prefork.preload(inference.MODEL_PATH, inference.SERVING_MODE)
+    print(f'Starting {args.replicas} replicas on ports {args.port}-{args.port + args.replicas - 1} '
+          f'(serving mode {inference.SERVING_MODE})')
+    prefork.run_workers(args.replicas, lambda index: run_replica(args.port + index))
+
+if __name__ == '__main__':
+    main()
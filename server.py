@@ -0,0 +1,227 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from PIL import UnidentifiedImageError
+
+import inference
+from prediction_cache import PredictionCache
+
+# Reject uploads larger than this before reading them
+MAX_BODY_BYTES = 20 * 1024 * 1024
+
+# The request body is not a readable image. Only the decode step raises it, so
+# errors from the model or backend are reported as server errors instead.
+class UndecodableImageError(Exception):
+    pass
+
+# Collects single images submitted by concurrent request threads into
+# micro-batches and scores each micro-batch with one forward pass
+class MicroBatcher:
+    def __init__(self, model, max_batch_size=32, max_wait_ms=5.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, input_arr):
+        future = Future()
+        self._queue.put((input_arr, future))
+        return future
+
+    # Block for the first request, then keep collecting until the batch is
+    # full or max_wait has passed since that first request arrived
+    def _collect(self):
+        items = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(items) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return items
+
+    # Pad to the next power of two so the model only ever sees a handful of
+    # distinct batch shapes
+    def padded_size(self, count):
+        size = 1
+        while size < count:
+            size *= 2
+        return min(size, self.max_batch_size)
+
+    def _run(self):
+        while True:
+            items = self._collect()
+            try:
+                batch = inference.stack_batch([arr for arr, _ in items], self.padded_size(len(items)))
+                predictions = inference.predict_batch(self.model, batch)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            for (_, future), probabilities in zip(items, predictions):
+                future.set_result(probabilities)
+
+def format_prediction(probabilities, class_names):
+    index = int(np.argmax(probabilities))
+    return {
+        'class': class_names[index],
+        'index': index,
+        'confidence': float(probabilities[index]),
+        'top5': [
+            {'class': class_names[i], 'probability': float(probabilities[i])}
+            for i in inference.top_k(probabilities)
+        ],
+        'probabilities': {name: float(p) for name, p in zip(class_names, probabilities)},
+    }
+
+class PredictionServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for bursts of connections while every worker is busy
+    request_queue_size = 128
+
+    # batcher, cache and class_names may be attached after binding, when
+    # prefork workers share one listening socket
+    def __init__(self, address, batcher, cache, class_names):
+        super().__init__(address, PredictionHandler)
+        self.batcher = batcher
+        self.cache = cache
+        self.class_names = class_names
+        # Set when serving from a model registry (--registry)
+        self.registry = None
+
+    # Decoding runs on the request thread so it overlaps with inference
+    def score(self, image_bytes):
+        try:
+            input_arr = inference.decode_image(image_bytes)
+        except inference.ImageTooLargeError:
+            raise
+        except (UnidentifiedImageError, OSError, ValueError) as e:
+            raise UndecodableImageError(str(e)) from e
+        return self.batcher.submit(input_arr).result()
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/models' and self.server.registry is not None:
+            self._send_json(200, self.server.registry.status())
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    # POST /predict with the raw JPEG/PNG bytes as the request body
+    def do_POST(self):
+        # POST /models/promote makes the shadowed candidate the active version
+        if self.path == '/models/promote' and self.server.registry is not None:
+            promoted = self.server.registry.promote()
+            self._send_json(200 if promoted else 409, self.server.registry.status())
+            return
+        if self.path != '/predict':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        if length <= 0:
+            self._send_json(400, {'error': 'empty request body'})
+            return
+        if length > MAX_BODY_BYTES:
+            self._send_json(413, {'error': 'image too large'})
+            return
+
+        try:
+            probabilities = self.server.cache.get_or_compute(self.rfile.read(length), self.server.score)
+        except inference.ImageTooLargeError as e:
+            self._send_json(413, {'error': str(e)})
+            return
+        except UndecodableImageError:
+            self._send_json(400, {'error': 'could not decode image'})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+        self._send_json(200, format_prediction(probabilities, self.server.class_names))
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP inference service for the plant disease model')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--model', default=inference.MODEL_PATH)
+    parser.add_argument('--serving-mode', choices=inference.SERVING_MODES, default=inference.SERVING_MODE)
+    parser.add_argument('--max-batch-size', type=int, default=32)
+    parser.add_argument('--max-wait-ms', type=float, default=5.0)
+    parser.add_argument('--cache-entries', type=int, default=10000)
+    parser.add_argument('--cache-mb', type=float, default=16)
+    parser.add_argument('--cache-dir', help='persist cached predictions in this directory')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='worker processes forked after preloading the runtime (see prefork.py)')
+    parser.add_argument('--registry', help='serve the newest version in this model registry and hot-swap new ones')
+    parser.add_argument('--poll-interval', type=float, default=10.0, help='seconds between registry checks')
+    parser.add_argument('--shadow-fraction', type=float, default=0.0,
+                        help='fraction of batches also scored by a new version before it is promoted')
+    parser.add_argument('--promote-after', type=int,
+                        help='promote a shadowed version after this many images (default: POST /models/promote)')
+    parser.add_argument('--min-agreement', type=float, default=0.99,
+                        help='top-1 agreement a shadowed version needs to be promoted automatically')
+    args = parser.parse_args()
+    # Each forked worker would run its own registry: promotion, shadow stats
+    # and GET /models would only cover the connections that worker accepted
+    if args.registry and args.workers > 1:
+        parser.error('--registry serves from a single process; run one --workers 1 server per port instead')
+
+    def serve(server):
+        if args.registry:
+            from model_registry import ModelRegistry
+
+            model = ModelRegistry(args.registry, args.serving_mode, args.poll_interval,
+                                  args.shadow_fraction, args.promote_after, args.min_agreement)
+            version = model.version
+            server.registry = model
+        else:
+            model = inference.load_model(args.model, args.serving_mode)
+            version = model.version
+        # Labels come from the bundle of the model this worker loaded
+        server.class_names = model.class_names
+        server.batcher = MicroBatcher(model, args.max_batch_size, args.max_wait_ms)
+        model.warm_up(sorted({server.batcher.padded_size(n) for n in range(1, args.max_batch_size + 1)}))
+        server.cache = PredictionCache(version, args.cache_entries, int(args.cache_mb * 1024 * 1024), args.cache_dir)
+        if server.registry is not None:
+            server.registry.add_listener(server.cache.set_model_version)
+        server.serve_forever()
+
+    server = PredictionServer((args.host, args.port), None, None, None)
+    print(f'Serving on http://{args.host}:{args.port} with {args.workers} worker(s) '
+          f'(max batch {args.max_batch_size}, max wait {args.max_wait_ms} ms)')
+    try:
+        if args.workers > 1:
+            import prefork
+
+            # Workers accept connections from the socket bound above
+            prefork.preload(args.model, args.serving_mode)
+            prefork.run_workers(args.workers, lambda index: serve(server))
+        else:
+            serve(server)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+import inference
+from datasets import list_labeled_images
+
+# Pre-decoded dataset shards. Each image is decoded and resized once (exactly
+# as data_pipeline decodes it) and stored as uint8 in fixed-size .npy arrays
+# that are memory-mapped at read time:
+#
+#     shards/train/
+#         index.json             class names, image size, shard list
+#         paths.txt              source file of each row, in row order
+#         images-00000.npy       (rows, 128, 128, 3) uint8
+#         labels-00000.npy       (rows,) int16
+#
+# Rows are written in a seeded random order, so every shard mixes all classes
+# and an epoch can read whole shards in turn instead of seeking between
+# images. A 128x128 image is 48 KB, so the full train split is about 3.4 GB and
+# an epoch is that much sequential reading, with no JPEG decoding.
+#
+#     python shards.py train shards/train
+#     python shards.py valid shards/valid --class-names-from shards/train
+SHARD_FORMAT = 1
+SHARD_SIZE = 4096
+INDEX_FILE = 'index.json'
+
+def is_shard_dir(path):
+    return os.path.isfile(os.path.join(path, INDEX_FILE))
+
+# Decode every image under source_dir into shards in output_dir. Written to a
+# staging directory and renamed into place, so readers never see a partial set.
+# originals_only leaves out the pre-augmented copies (see augmentation.py).
+def write_shards(source_dir, output_dir, class_names=None, shard_size=SHARD_SIZE, seed=0,
+                 batch_size=inference.BATCH_SIZE, originals_only=False):
+    import tensorflow as tf
+
+    import augmentation
+    import data_pipeline
+
+    paths, labels, class_names = list_labeled_images(source_dir, class_names)
+    if originals_only:
+        paths, labels, _ = augmentation.select_originals(paths, labels)
+    if not paths:
+        raise FileNotFoundError(f'No images found under {source_dir}')
+    order = np.random.default_rng(seed).permutation(len(paths))
+    paths = [paths[i] for i in order]
+    labels = np.asarray(labels, dtype=np.int16)[order]
+
+    staging = f'{output_dir.rstrip(os.sep)}.partial'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    decoded = (tf.data.Dataset.from_tensor_slices((paths, labels))
+               .map(data_pipeline.decode, num_parallel_calls=tf.data.AUTOTUNE)
+               .batch(batch_size)
+               .prefetch(tf.data.AUTOTUNE))
+    shards = []
+    images = None
+    row = 0
+    for batch, _ in decoded:
+        batch = batch.numpy()
+        offset = 0
+        while offset < len(batch):
+            shard_row = row % shard_size
+            if shard_row == 0:
+                number = len(shards)
+                rows = min(shard_size, len(paths) - row)
+                images_file, labels_file = f'images-{number:05d}.npy', f'labels-{number:05d}.npy'
+                images = np.lib.format.open_memmap(os.path.join(staging, images_file), mode='w+', dtype=np.uint8,
+                                                   shape=(rows, *inference.IMAGE_SIZE, 3))
+                np.save(os.path.join(staging, labels_file), labels[row:row + rows])
+                shards.append({'images': images_file, 'labels': labels_file, 'count': rows})
+            take = min(len(batch) - offset, shard_size - shard_row)
+            images[shard_row:shard_row + take] = batch[offset:offset + take]
+            offset += take
+            row += take
+            if row % shard_size == 0 or row == len(paths):
+                images.flush()
+
+    with open(os.path.join(staging, 'paths.txt'), 'w') as f:
+        f.writelines(f'{path}\n' for path in paths)
+    with open(os.path.join(staging, INDEX_FILE), 'w') as f:
+        json.dump({
+            'format': SHARD_FORMAT,
+            'source': os.path.abspath(source_dir),
+            'class_names': list(class_names),
+            'image_size': list(inference.IMAGE_SIZE),
+            'interpolation': 'bilinear',
+            'originals_only': originals_only,
+            'count': len(paths),
+            'shards': shards,
+        }, f, indent=2)
+
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    os.rename(staging, output_dir)
+    return output_dir
+
+# Read-only view of a shard directory. images[i] and labels[i] are
+# memory-mapped arrays, so slicing them copies nothing until the pages are used.
+class ShardSet:
+    def __init__(self, shard_dir):
+        with open(os.path.join(shard_dir, INDEX_FILE)) as f:
+            index = json.load(f)
+        if index.get('format') != SHARD_FORMAT:
+            raise ValueError(f'{shard_dir}: unsupported shard format {index.get("format")!r}')
+        if index['image_size'] != list(inference.IMAGE_SIZE):
+            raise ValueError(f'{shard_dir}: shards hold {index["image_size"]} images, '
+                             f'the model expects {list(inference.IMAGE_SIZE)}')
+        self.shard_dir = shard_dir
+        self.class_names = index['class_names']
+        self.count = index['count']
+        self.images = [np.load(os.path.join(shard_dir, s['images']), mmap_mode='r') for s in index['shards']]
+        self.labels = [np.load(os.path.join(shard_dir, s['labels'])) for s in index['shards']]
+
+    def __len__(self):
+        return self.count
+
+    def paths(self):
+        with open(os.path.join(self.shard_dir, 'paths.txt')) as f:
+            return f.read().splitlines()
+
+    # Batches of (uint8 images, int labels). In order, a batch is a slice of
+    # one shard's memory map. Shuffled, shards are visited in a random order
+    # and rows are shuffled within each shard, which keeps reads local to one
+    # shard at a time.
+    def batches(self, batch_size, shuffle=False, rng=None):
+        shard_order = rng.permutation(len(self.images)) if shuffle else range(len(self.images))
+        for s in shard_order:
+            images, labels = self.images[s], self.labels[s]
+            if shuffle:
+                rows = rng.permutation(len(images))
+                for start in range(0, len(rows), batch_size):
+                    # Sorted rows read the memory map front to back
+                    batch_rows = np.sort(rows[start:start + batch_size])
+                    yield images[batch_rows], labels[batch_rows]
+            else:
+                for start in range(0, len(images), batch_size):
+                    yield images[start:start + batch_size], labels[start:start + batch_size]
+
+# tf.data over a shard directory with the same element spec as
+# data_pipeline.make_dataset: (float32 0-255 images, one-hot labels). With
+# class_names given, the shard's classes must be among them and labels are
+# remapped to their positions. With augment, batches are split into images
+# for augmentation.augment() and rebatched. Returns (dataset, class_names,
+# image_count).
+def make_dataset(shard_dir, class_names=None, batch_size=inference.BATCH_SIZE, shuffle=True, seed=0,
+                 prefetch=-1, augment=False):
+    import tensorflow as tf
+
+    shard_set = ShardSet(shard_dir)
+    if class_names is None:
+        class_names = shard_set.class_names
+    missing = set(shard_set.class_names) - set(class_names)
+    if missing:
+        raise ValueError(f'{shard_dir} has classes the model does not know: {sorted(missing)}')
+    remap = np.array([list(class_names).index(name) for name in shard_set.class_names], dtype=np.int32)
+    rng = np.random.default_rng(seed)
+
+    def generate():
+        for images, labels in shard_set.batches(batch_size, shuffle, rng):
+            yield images, remap[labels]
+
+    dataset = tf.data.Dataset.from_generator(generate, output_signature=(
+        tf.TensorSpec([None, *inference.IMAGE_SIZE, 3], tf.uint8),
+        tf.TensorSpec([None], tf.int32),
+    ))
+    dataset = dataset.map(lambda images, labels: (tf.cast(images, tf.float32), tf.one_hot(labels, len(class_names))),
+                          num_parallel_calls=tf.data.AUTOTUNE)
+    if augment:
+        import augmentation
+
+        dataset = augmentation.augment_dataset(dataset.unbatch(), seed, tf.data.AUTOTUNE).batch(batch_size)
+    if prefetch is not None:
+        dataset = dataset.prefetch(prefetch)
+    return dataset, list(class_names), len(shard_set)
+
+def main():
+    parser = argparse.ArgumentParser(description='Decode an image directory into memory-mapped shards')
+    parser.add_argument('source', help='class-per-folder image directory')
+    parser.add_argument('output', help='shard directory to write')
+    parser.add_argument('--class-names-from', metavar='PATH',
+                        help='shard directory or bundled model whose class list (and label order) to use')
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE, help='images per shard')
+    parser.add_argument('--seed', type=int, default=0, help='row order of the shards')
+    parser.add_argument('--originals-only', action='store_true',
+                        help='leave out the pre-augmented copies (_90deg, _flipTB, ...)')
+    args = parser.parse_args()
+
+    class_names = None
+    if args.class_names_from:
+        if is_shard_dir(args.class_names_from):
+            class_names = ShardSet(args.class_names_from).class_names
+        else:
+            class_names = inference.get_class_names(args.class_names_from)
+
+    start = time.perf_counter()
+    write_shards(args.source, args.output, class_names, args.shard_size, args.seed,
+                 originals_only=args.originals_only)
+    shard_set = ShardSet(args.output)
+    size = sum(os.path.getsize(os.path.join(args.output, name)) for name in os.listdir(args.output))
+    print(f'Wrote {len(shard_set)} images in {len(shard_set.images)} shards ({size / 2**20:.0f} MB) '
+          f'to {args.output} in {time.perf_counter() - start:.1f}s')
+
+if __name__ == '__main__':
+    main()
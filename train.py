@@ -0,0 +1,84 @@
+import argparse
+import json
+
+import inference
+import model_bundle
+from datasets import TRAIN_DIR, VALID_DIR
+
+# The training notebook as a script, reading through data_pipeline so JPEG
+# decoding runs in parallel with (and cached ahead of) the training steps.
+#
+#     python train.py --architecture baseline --epochs 10
+#     python train.py --cache none --parallel-calls 1 --prefetch 0   # unpipelined, for comparison
+#     python train.py --train-dir shards/train --valid-dir shards/valid  # pre-decoded, see shards.py
+#     python train.py --originals-only --augment   # skip the rotated/flipped copies, augment in the pipeline
+def main():
+    import architectures
+
+    parser = argparse.ArgumentParser(description='Train the plant disease model')
+    parser.add_argument('--train-dir', default=TRAIN_DIR, help='image directory or shards.py output')
+    parser.add_argument('--valid-dir', default=VALID_DIR, help='image directory or shards.py output')
+    parser.add_argument('--architecture', choices=architectures.ARCHITECTURES, default='baseline')
+    parser.add_argument('--epochs', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=inference.BATCH_SIZE)
+    parser.add_argument('--learning-rate', type=float, default=0.001)
+    parser.add_argument('--seed', type=int, default=0, help='seeds weights, shuffling and dropout')
+    parser.add_argument('--cache', default='memory',
+                        help="'memory', 'none', or a file path prefix for an on-disk cache")
+    parser.add_argument('--shuffle-buffer', type=int, default=None,
+                        help='decoded images held for reshuffling cached epochs')
+    parser.add_argument('--parallel-calls', type=int, default=None, help='decode parallelism (default AUTOTUNE)')
+    parser.add_argument('--prefetch', type=int, default=None, help='batches prefetched (default AUTOTUNE)')
+    parser.add_argument('--nondeterministic', action='store_true',
+                        help='let parallel decoding reorder images for a little more throughput')
+    parser.add_argument('--originals-only', action='store_true',
+                        help='train on one file per leaf, skipping the pre-augmented copies on disk')
+    parser.add_argument('--augment', action='store_true',
+                        help='random rotations, flips and colour jitter on training images')
+    parser.add_argument('--output', default=inference.MODEL_PATH)
+    parser.add_argument('--history', default='training_hist.json')
+    args = parser.parse_args()
+
+    import tensorflow as tf
+
+    import data_pipeline
+
+    tf.keras.utils.set_random_seed(args.seed)
+    pipeline = {
+        'batch_size': args.batch_size,
+        'seed': args.seed,
+        'cache': None if args.cache == 'none' else args.cache,
+        'parallel_calls': args.parallel_calls or data_pipeline.AUTOTUNE,
+        'prefetch': data_pipeline.AUTOTUNE if args.prefetch is None else args.prefetch or None,
+        'deterministic': not args.nondeterministic,
+    }
+    if args.shuffle_buffer:
+        pipeline['shuffle_buffer'] = args.shuffle_buffer
+    training_set, class_names, train_count = data_pipeline.make_dataset(
+        args.train_dir, originals_only=args.originals_only, augment=args.augment, **pipeline)
+    validation_cache = pipeline['cache']
+    if validation_cache not in (None, 'memory'):
+        validation_cache = f'{validation_cache}-valid'
+    validation_set, _, valid_count = data_pipeline.make_dataset(
+        args.valid_dir, class_names, **{**pipeline, 'shuffle': False, 'cache': validation_cache})
+    print(f'{train_count} training and {valid_count} validation images in {len(class_names)} classes')
+
+    model = architectures.build_model(args.architecture, num_classes=len(class_names))
+    model.compile(optimizer=tf.keras.optimizers.Adam(args.learning_rate), loss='categorical_crossentropy',
+                  metrics=['accuracy'])
+    history = model.fit(training_set, validation_data=validation_set, epochs=args.epochs,
+                        callbacks=[data_pipeline.ThroughputLogger(train_count)])
+
+    timings = zip(history.history['train_seconds'], history.history['images_per_sec'])
+    for epoch, (seconds, rate) in enumerate(timings, 1):
+        print(f'epoch {epoch}: {seconds:.1f}s training, {rate:.1f} images/s')
+
+    model_bundle.save_bundle(model, args.output, class_names, image_size=inference.IMAGE_SIZE,
+                             interpolation='bilinear')
+    with open(args.history, 'w') as f:
+        json.dump({key: [float(v) for v in values] for key, values in history.history.items()}, f)
+    print(f'Saved {args.output} (validation accuracy {history.history["val_accuracy"][-1]:.4f}) '
+          f'and {args.history}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+# Language translations
+TRANSLATIONS = {
+    'English': {
+        'select_language': 'Select Language',
+        'home': 'Home',
+        'about': 'About',
+        'disease_recognition': 'Disease Recognition',
+        'welcome_header': 'PLANT DISEASE RECOGNITION SYSTEM',
+        'welcome_message': '''Welcome to the Plant Disease Recognition System! 🌿🔍
+        Our mission is to help in identifying plant diseases efficiently. Upload an image of a plant, and our system will analyze it to detect any signs of diseases. Together, let's protect our crops and ensure a healthier harvest!''',
+        'how_it_works': 'How It Works',
+        'step1': '1. Upload Image: Go to the Disease Recognition page and upload an image of a plant with suspected diseases.',
+        'step2': '2. Analysis: Our system will process the image using advanced algorithms to identify potential diseases.',
+        'step3': '3. Results: View the results and recommendations for further action.',
+        'why_choose_us': 'Why Choose Us?',
+        'accuracy': '- Accuracy: Our system utilizes state-of-the-art machine learning techniques for accurate disease detection.',
+        'user_friendly': '- User-Friendly: Simple and intuitive interface for seamless user experience.',
+        'fast': '- Fast and Efficient: Receive results in seconds, allowing for quick decision-making.',
+        'get_started': 'Get Started',
+        'about_us': 'About Us',
+        'upload_image': 'Upload Plant Image',
+        'choose_image': 'Choose an Image:',
+        'analyze_button': '🔍 Analyze Image',
+        'processing': 'Processing image...',
+        'analysis_complete': '✨ Analysis Complete!',
+        'predicted_disease': '🎯 Predicted Disease:',
+        'top_predictions': '📊 Top 5 Predictions',
+        'disease_details': '📋 Disease Details',
+        'symptoms': '🔍 Symptoms',
+        'causes': '⚕️ Causes',
+        'reasons': '❓ Reasons for Cause',
+        'precautions': '⚠️ Precautions',
+        'treatments': '💊 Treatments',
+        'more_info': 'ℹ️ More Information',
+        'error_occurred': '❌ An error occurred during prediction:',
+        'try_again': 'Please try uploading a different image or contact support if the issue persists.',
+        'instructions': '📝 Instructions',
+        'tips': '💡 Tips for Best Results',
+        'analysis_mode': 'Analysis Mode',
+        'single_image': 'Single Image',
+        'multiple_images': 'Multiple Images',
+        'choose_images': 'Choose Images:',
+        'analyze_all_button': '🔍 Analyze All Images',
+        'processing_batch': 'Processing images...',
+        'batch_results': '📊 Batch Results',
+        'file_name': 'File',
+        'prediction': 'Prediction',
+        'confidence': 'Confidence',
+        'about_dataset': 'About Dataset',
+        'dataset_intro': 'This dataset is recreated using offline augmentation from the original dataset. The original dataset can be found on this GitHub repo.',
+        'dataset_description': 'This dataset consists of about 87K RGB images of healthy and diseased crop leaves categorized into 38 different classes. The total dataset is divided into an 80/20 ratio for training and validation sets while preserving directory structure.',
+        'test_images': 'A new directory containing 33 test images was created later for prediction purposes.',
+        'content': 'Content',
+        'train_images': 'train (70,295 images)',
+        'test_images_count': 'test (33 images)',
+        'validation_images': 'validation (17,572 images)',
+        'dataset_details': 'Dataset Details',
+        'total_images': 'Total Images',
+        'total_images_count': '87,900 RGB images',
+        'number_of_classes': 'Number of Classes',
+        'classes_count': '38 different plant diseases and healthy conditions',
+        'image_resolution': 'Image Resolution',
+        'resolution_type': 'High-quality RGB images',
+        'data_split': 'Data Split',
+        'training_split': 'Training: 80% (70,295 images)',
+        'validation_split': 'Validation: 20% (17,572 images)',
+        'test_split': 'Test: 33 images for prediction',
+        'plant_categories': 'Plant Categories',
+        'categories_intro': 'The dataset covers various plant species including:',
+        'disease_types': 'Disease Types',
+        'disease_types_intro': 'Each plant category includes:',
+        'healthy_samples': 'Healthy samples',
+        'disease_conditions': 'Various disease conditions',
+        'disease_stages': 'Multiple disease stages',
+        'disease_manifestations': 'Different disease manifestations',
+        'data_augmentation': 'Data Augmentation',
+        'augmentation_intro': 'The dataset has been enhanced through:',
+        'rotation': 'Rotation',
+        'flipping': 'Flipping',
+        'color_adjustments': 'Color adjustments',
+        'brightness_modifications': 'Brightness modifications',
+        'contrast_variations': 'Contrast variations',
+        'usage': 'Usage',
+        'usage_intro': 'This dataset is suitable for:',
+        'plant_classification': 'Plant disease classification',
+        'ml_training': 'Machine learning model training',
+        'cv_research': 'Computer vision research',
+        'disease_detection': 'Agricultural disease detection',
+        'educational_purposes': 'Educational purposes',
+        'data_quality': 'Data Quality',
+        'high_resolution': 'High-resolution images',
+        'clear_symptoms': 'Clear disease symptoms',
+        'well_labeled': 'Well-labeled categories',
+        'consistent_quality': 'Consistent image quality',
+        'professional_photography': 'Professional photography',
+        'applications': 'Applications',
+        'agricultural_detection': 'Agricultural disease detection',
+        'health_monitoring': 'Plant health monitoring',
+        'crop_protection': 'Crop protection',
+        'research_education': 'Research and education',
+        'automated_diagnosis': 'Automated disease diagnosis'
+    },
+    'Telugu': {
+        'select_language': 'భాష ఎంచుకోండి',
+        'home': 'హోమ్',
+        'about': 'గురించి',
+        'disease_recognition': 'వ్యాధి గుర్తింపు',
+        'welcome_header': 'మొక్క వ్యాధి గుర్తింపు వ్యవస్థ',
+        'welcome_message': '''మొక్క వ్యాధి గుర్తింపు వ్యవస్థకు స్వాగతం! 🌿🔍
+        మొక్కల వ్యాధులను సమర్థవంతంగా గుర్తించడంలో సహాయపడటం మా లక్ష్యం. మొక్క యొక్క చిత్రాన్ని అప్‌లోడ్ చేయండి, మా వ్యవస్థ దానిని విశ్లేషించి వ్యాధి లక్షణాలను గుర్తిస్తుంది. కలిసి, మన పంటలను రక్షించుకుందాం!''',
+        'how_it_works': 'ఇది ఎలా పనిచేస్తుంది',
+        'step1': '1. చిత్రాన్ని అప్‌లోడ్ చేయండి: వ్యాధి గుర్తింపు పేజీకి వెళ్లి వ్యాధి అనుమానితమైన మొక్క చిత్రాన్ని అప్‌లోడ్ చేయండి.',
+        'step2': '2. విశ్లేషణ: మా వ్యవస్థ అధునాతన అల్గారిథమ్‌ల ద్వారా చిత్రాన్ని విశ్లేషిస్తుంది.',
+        'step3': '3. ఫలితాలు: ఫలితాలను మరియు తదుపరి చర్యల కోసం సిఫార్సులను చూడండి.',
+        'why_choose_us': 'మమ్మల్ని ఎందుకు ఎంచుకోవాలి?',
+        'accuracy': '- ఖచ్చితత్వం: మా వ్యవస్థ అత్యాధునిక మెషీన్ లెర్నింగ్ పద్ధతులను ఉపయోగిస్తుంది.',
+        'user_friendly': '- వినియోగదారు స్నేహపూర్వకం: సరళమైన మరియు సులభమైన ఇంటర్‌ఫేస్.',
+        'fast': '- వేగవంతం మరియు సమర్థవంతం: సెకన్లలో ఫలితాలను పొందండి.',
+        'get_started': 'ప్రారంభించండి',
+        'about_us': 'మా గురించి',
+        'upload_image': 'మొక్క చిత్రాన్ని అప్‌లోడ్ చేయండి',
+        'choose_image': 'చిత్రాన్ని ఎంచుకోండి:',
+        'analyze_button': '🔍 చిత్రాన్ని విశ్లేషించండి',
+        'processing': 'చిత్రం ప్రాసెస్ అవుతోంది...',
+        'analysis_complete': '✨ విశ్లేషణ పూర్తయింది!',
+        'predicted_disease': '🎯 అంచనా వేసిన వ్యాధి:',
+        'top_predictions': '📊 టాప్ 5 అంచనాలు',
+        'disease_details': '📋 వ్యాధి వివరాలు',
+        'symptoms': '🔍 లక్షణాలు',
+        'causes': '⚕️ కారణాలు',
+        'reasons': '❓ కారణాల వివరణ',
+        'precautions': '⚠️ జాగ్రత్తలు',
+        'treatments': '💊 చికిత్సలు',
+        'more_info': 'ℹ️ మరింత సమాచారం',
+        'error_occurred': '❌ విశ్లేషణలో లోపం సంభవించింది:',
+        'try_again': 'దయచేసి వేరే చిత్రాన్ని అప్‌లోడ్ చేయండి లేదా సహాయం కోసం సంప్రదించండి.',
+        'instructions': '📝 సూచనలు',
+        'tips': '💡 ఉత్తమ ఫలితాల కోసం చిట్కాలు',
+        'analysis_mode': 'విశ్లేషణ విధానం',
+        'single_image': 'ఒక చిత్రం',
+        'multiple_images': 'బహుళ చిత్రాలు',
+        'choose_images': 'చిత్రాలను ఎంచుకోండి:',
+        'analyze_all_button': '🔍 అన్ని చిత్రాలను విశ్లేషించండి',
+        'processing_batch': 'చిత్రాలు ప్రాసెస్ అవుతున్నాయి...',
+        'batch_results': '📊 బ్యాచ్ ఫలితాలు',
+        'file_name': 'ఫైల్',
+        'prediction': 'అంచనా',
+        'confidence': 'విశ్వాసం',
+        'about_dataset': 'డేటాసెట్ గురించి',
+        'dataset_intro': 'ఈ డేటాసెట్ అసలు డేటాసెట్ నుండి ఆఫ్‌లైన్ ఆక్మెంటేషన్ ఉపయోగించి తిరిగి సృష్టించబడింది. అసలు డేటాసెట్ ఈ GitHub రిపోజిటరీలో కనుగొనవచ్చు.',
+        'dataset_description': 'ఈ డేటాసెట్ 38 వేర్వేరు తరగతులుగా వర్గీకరించబడిన ఆరోగ్యకరమైన మరియు వ్యాధిగ్రస్తమైన పంట ఆకుల యొక్క 87K RGB చిత్రాలను కలిగి ఉంది. మొత్తం డేటాసెట్ డైరెక్టరీ నిర్మాణాన్ని కాపాడుతూ 80/20 నిష్పత్తిలో శిక్షణ మరియు ధ్రువీకరణ సెట్లుగా విభజించబడింది.',
+        'test_images': 'అంచనా ప్రయోజనాల కోసం 33 పరీక్ష చిత్రాలతో కూడిన కొత్త డైరెక్టరీ తర్వాత సృష్టించబడింది.',
+        'content': 'విషయ సూచిక',
+        'train_images': 'శిక్షణ (70,295 చిత్రాలు)',
+        'test_images_count': 'పరీక్ష (33 చిత్రాలు)',
+        'validation_images': 'ధ్రువీకరణ (17,572 చిత్రాలు)',
+        'dataset_details': 'డేటాసెట్ వివరాలు',
+        'total_images': 'మొత్తం చిత్రాలు',
+        'total_images_count': '87,900 RGB చిత్రాలు',
+        'number_of_classes': 'తరగతుల సంఖ్య',
+        'classes_count': '38 వేర్వేరు మొక్క వ్యాధులు మరియు ఆరోగ్యకరమైన పరిస్థితులు',
+        'image_resolution': 'చిత్ర రిజల్యూషన్',
+        'resolution_type': 'అధిక-నాణ్యత RGB చిత్రాలు',
+        'data_split': 'డేటా విభజన',
+        'training_split': 'శిక్షణ: 80% (70,295 చిత్రాలు)',
+        'validation_split': 'ధ్రువీకరణ: 20% (17,572 చిత్రాలు)',
+        'test_split': 'పరీక్ష: 33 చిత్రాలు అంచనా కోసం',
+        'plant_categories': 'మొక్క వర్గాలు',
+        'categories_intro': 'డేటాసెట్ క్రింది మొక్క జాతులను కవర్ చేస్తుంది:',
+        'disease_types': 'వ్యాధి రకాలు',
+        'disease_types_intro': 'ప్రతి మొక్క వర్గంలో ఇవి ఉన్నాయి:',
+        'healthy_samples': 'ఆరోగ్యకరమైన నమూనాలు',
+        'disease_conditions': 'వేర్వేరు వ్యాధి పరిస్థితులు',
+        'disease_stages': 'అనేక వ్యాధి దశలు',
+        'disease_manifestations': 'వేర్వేరు వ్యాధి వ్యక్తీకరణలు',
+        'data_augmentation': 'డేటా ఆగ్మెంటేషన్',
+        'augmentation_intro': 'డేటాసెట్ క్రింది మార్గాల ద్వారా మెరుగుపరచబడింది:',
+        'rotation': 'భ్రమణం',
+        'flipping': 'ఫ్లిపింగ్',
+        'color_adjustments': 'రంగు సర్దుబాట్లు',
+        'brightness_modifications': 'ప్రకాశవంతమైన సర్దుబాట్లు',
+        'contrast_variations': 'కాంట్రాస్ట్ వైవిధ్యాలు',
+        'usage': 'వినియోగం',
+        'usage_intro': 'ఈ డేటాసెట్ క్రింది వాటికి అనువైనది:',
+        'plant_classification': 'మొక్క వ్యాధి వర్గీకరణ',
+        'ml_training': 'మెషీన్ లెర్నింగ్ మోడల్ శిక్షణ',
+        'cv_research': 'కంప్యూటర్ విజన్ పరిశోధన',
+        'disease_detection': 'వివచాయ నోయ్ గుర్తింపు',
+        'educational_purposes': 'విద్యా ప్రయోజనాలు',
+        'data_quality': 'డేటా నాణ్యత',
+        'high_resolution': 'అధిక-రిజల్యూషన్ చిత్రాలు',
+        'clear_symptoms': 'స్పష్టమైన వ్యాధి లక్షణాలు',
+        'well_labeled': 'బాగా లేబుల్ చేసిన వర్గాలు',
+        'consistent_quality': 'స్థిరమైన చిత్ర నాణ్యత',
+        'professional_photography': 'తొఴిల్ముఱై పుకైప్పటమ్',
+        'applications': 'అనువర్తనాలు',
+        'agricultural_detection': 'వివచాయ నోయ్ గుర్తింపు',
+        'health_monitoring': 'మొక్క ఆరోగ్య పర్యవేక్షణ',
+        'crop_protection': 'పంట రక్షణ',
+        'research_education': 'పరిశోధన మరియు విద్య',
+        'automated_diagnosis': 'తానియఙ్కి నోయ్ గుర్తింపు'
+    },
+    'Tamil': {
+        'select_language': 'மொழியை தேர்ந்தெடுக்கவும்',
+        'home': 'முகப்பு',
+        'about': 'பற்றி',
+        'disease_recognition': 'நோய் கண்டறிதல்',
+        'welcome_header': 'தாவர நோய் கண்டறியும் அமைப்பு',
+        'welcome_message': '''தாவர நோய் கண்டறியும் அமைப்புக்கு வரவேற்கிறோம்! 🌿🔍
+        தாவர நோய்களை திறம்பட கண்டறிவதற்கு உதவுவதே எங்கள் நோக்கம். தாவரத்தின் படத்தை பதிவேற்றம் செய்யுங்கள், எங்கள் அமைப்பு நோய் அறிகுறிகளை கண்டறியும்.''',
+        'how_it_works': 'இது எப்படி செயல்படுகிறது',
+        'step1': '1. படத்தை பதிவேற்றம் செய்யவும்: நோய் கண்டறியும் பக்கத்திற்கு சென்று தாவரத்தின் படத்தை பதிவேற்றம் செய்யவும்.',
+        'step2': '2. பகுப்பாய்வு: எங்கள் அமைப்பு நவீன அல்காரிதம்கள் மூலம் படத்தை பகுப்பாய்வு செய்யும்.',
+        'step3': '3. முடிவுகள்: முடிவுகளையும் அடுத்த நடவடிக்கைக்கான பரிந்துரைகளையும் காணலாம்.',
+        'why_choose_us': 'எங்களை ஏன் தேர்ந்தெடுக்க வேண்டும்?',
+        'accuracy': '- துல்லியம்: எங்கள் அமைப்பு நவீன மெஷின் லேர்னிங் தொழில்நுட்பங்களை பயன்படுத்துகிறது.',
+        'user_friendly': '- பயனர் நட்பு: எளிமையான மற்றும் புரிந்துகொள்ள எளிதான இடைமுகம்.',
+        'fast': '- வேகமானது மற்றும் திறமையானது: விநாடிகளில் முடிவுகளைப் பெறுங்கள்.',
+        'get_started': 'தொடங்குங்கள்',
+        'about_us': 'எங்களைப் பற்றி',
+        'upload_image': 'தாவர படத்தை பதிவேற்றவும்',
+        'choose_image': 'படத்தை தேர்ந்தெடுக்கவும்:',
+        'analyze_button': '🔍 படத்தை பகுப்பாய்வு செய்',
+        'processing': 'படம் செயலாக்கப்படுகிறது...',
+        'analysis_complete': '✨ பகுப்பாய்வு முடிந்தது!',
+        'predicted_disease': '🎯 கணிக்கப்பட்ட நோய்:',
+        'top_predictions': '📊 முதல் 5 கணிப்புகள்',
+        'disease_details': '📋 நோய் விவரங்கள்',
+        'symptoms': '🔍 அறிகுறிகள்',
+        'causes': '⚕️ காரணங்கள்',
+        'reasons': '❓ காரணங்களுக்கான விளக்கம்',
+        'precautions': '⚠️ முன்னெச்சரிக்கைகள்',
+        'treatments': '💊 சிகிச்சைகள்',
+        'more_info': 'ℹ️ மேலும் தகவல்',
+        'error_occurred': '❌ பகுப்பாய்வில் பிழை ஏற்பட்டது:',
+        'try_again': 'தயவுசெய்து வேறு படத்தை பதிவேற்றம் செய்யவும் அல்லது உதவிக்கு தொடர்பு கொள்ளவும்.',
+        'instructions': '📝 வழிமுறைகள்',
+        'tips': '💡 சிறந்த முடிவுகளுக்கான குறிப்புகள்',
+        'analysis_mode': 'பகுப்பாய்வு முறை',
+        'single_image': 'ஒரு படம்',
+        'multiple_images': 'பல படங்கள்',
+        'choose_images': 'படங்களை தேர்ந்தெடுக்கவும்:',
+        'analyze_all_button': '🔍 அனைத்து படங்களையும் பகுப்பாய்வு செய்',
+        'processing_batch': 'படங்கள் செயலாக்கப்படுகின்றன...',
+        'batch_results': '📊 தொகுப்பு முடிவுகள்',
+        'file_name': 'கோப்பு',
+        'prediction': 'கணிப்பு',
+        'confidence': 'நம்பகத்தன்மை',
+        'about_dataset': 'தரவு தொகுப்பு பற்றி',
+        'dataset_intro': 'இந்த தரவு தொகுப்பு அசல் தரவு தொகுப்பிலிருந்து ஆஃப்லைன் ஆக்மென்டேஷன் பயன்படுத்தி மீண்டும் உருவாக்கப்பட்டது. அசல் தரவு தொகுப்பை இந்த GitHub களஞ்சியத்தில் காணலாம்.',
+        'dataset_description': 'இந்த தரவு தொகுப்பு 38 வெவ்வேறு வகைகளாக வகைப்படுத்தப்பட்ட ஆரோக்கியமான மற்றும் நோயுற்ற பயிர் இலைகளின் 87K RGB படங்களைக் கொண்டுள்ளது. மொத்த தரவு தொகுப்பு கோப்புறை கட்டமைப்பை பாதுகாத்து 80/20 விகிதத்தில் பயிற்சி மற்றும் சரிபார்ப்பு தொகுப்புகளாக பிரிக்கப்பட்டுள்ளது.',
+        'test_images': 'கணிப்பு நோக்கங்களுக்காக 33 சோதனை படங்களைக் கொண்ட புதிய கோப்புறை பின்னர் உருவாக்கப்பட்டது.',
+        'content': 'உள்ளடக்கம்',
+        'train_images': 'பயிற்சி (70,295 படங்கள்)',
+        'test_images_count': 'சோதனை (33 படங்கள்)',
+        'validation_images': 'சரிபார்ப்பு (17,572 படங்கள்)',
+        'dataset_details': 'தரவு தொகுப்பு விவரங்கள்',
+        'total_images': 'மொத்த படங்கள்',
+        'total_images_count': '87,900 RGB படங்கள்',
+        'number_of_classes': 'வகைகளின் எண்ணிக்கை',
+        'classes_count': '38 வெவ்வேறு தாவர நோய்கள் மற்றும் ஆரோக்கியமான நிலைகள்',
+        'image_resolution': 'பட தெளிவு',
+        'resolution_type': 'உயர்-தர RGB படங்கள்',
+        'data_split': 'தரவு பிரிவு',
+        'training_split': 'பயிற்சி: 80% (70,295 படங்கள்)',
+        'validation_split': 'சரிபார்ப்பு: 20% (17,572 படங்கள்)',
+        'test_split': 'சோதனை: 33 படங்கள் கணிப்புக்காக',
+        'plant_categories': 'தாவர வகைகள்',
+        'categories_intro': 'தரவு தொகுப்பு பின்வரும் தாவர இனங்களை உள்ளடக்கியது:',
+        'disease_types': 'நோய் வகைகள்',
+        'disease_types_intro': 'ஒவ்வொரு தாவர வகையிலும் உள்ளவை:',
+        'healthy_samples': 'ஆரோக்கியமான மாதிரிகள்',
+        'disease_conditions': 'பல்வேறு நோய் நிலைகள்',
+        'disease_stages': 'பல நோய் நிலைகள்',
+        'disease_manifestations': 'பல்வேறு நோய் வெளிப்பாடுகள்',
+        'data_augmentation': 'தரவு மேம்படுத்தல்',
+        'augmentation_intro': 'தரவு தொகுப்பு பின்வரும் முறைகளால் மேம்படுத்தப்பட்டுள்ளது:',
+        'rotation': 'சுழற்சி',
+        'flipping': 'புரட்டுதல்',
+        'color_adjustments': 'நிற சரிசெய்தல்',
+        'brightness_modifications': 'ஒளி சரிசெய்தல்',
+        'contrast_variations': 'மாறுபாடு மாற்றங்கள்',
+        'usage': 'பயன்பாடு',
+        'usage_intro': 'இந்த தரவு தொகுப்பு பின்வரும் நோக்கங்களுக்கு ஏற்றது:',
+        'plant_classification': 'தாவர நோய் வகைப்பாடு',
+        'ml_training': 'பொறி கற்றல் மாதிரி பயிற்சி',
+        'cv_research': 'கணினி பார்வை ஆராய்ச்சி',
+        'disease_detection': 'விவசாய நோய் கண்டறிதல்',
+        'educational_purposes': 'கல்வி நோக்கங்கள்',
+        'data_quality': 'தரவு தரம்',
+        'high_resolution': 'உயர்-தெளிவு படங்கள்',
+        'clear_symptoms': 'தெளிவான நோய் அறிகுறிகள்',
+        'well_labeled': 'நன்கு குறிக்கப்பட்ட வகைகள்',
+        'consistent_quality': 'சீரான பட தரம்',
+        'professional_photography': 'தொழில்முறை புகைப்படம்',
+        'applications': 'பயன்பாடுகள்',
+        'agricultural_detection': 'விவசாய நோய் கண்டறிதல்',
+        'health_monitoring': 'தாவர ஆரோக்கிய கண்காணிப்பு',
+        'crop_protection': 'பயிர் பாதுகாப்பு',
+        'research_education': 'ஆராய்ச்சி மற்றும் கல்வி',
+        'automated_diagnosis': 'தானியங்கி நோய் கண்டறிதல்'
+    }
+}